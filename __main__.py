@@ -15,15 +15,14 @@ import platform
 import sys
 import traceback
 from pathlib import Path
-from typing import Any
 
 import aiohttp
 import asyncpg
 import click
 import discord
-import orjson
 
-from bot import AluBot, setup_logging
+from bot import AluBot, create_pool, send_restart_notice, setup_logging
+from bot.migrations import Migration, MigrationRunner
 from config import config
 from utils import const
 
@@ -35,40 +34,16 @@ else:
     asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
-async def create_pool() -> asyncpg.Pool[asyncpg.Record]:
-    """Create a database connection pool."""
-
-    def _encode_jsonb(value: Any) -> str:
-        return orjson.dumps(value).decode("utf-8")
-
-    def _decode_jsonb(value: str) -> Any:
-        return orjson.loads(value)
-
-    async def init(con: asyncpg.Connection[asyncpg.Record]) -> None:
-        await con.set_type_codec(
-            "jsonb",
-            schema="pg_catalog",
-            encoder=_encode_jsonb,
-            decoder=_decode_jsonb,
-            format="text",
-        )
-
-    postgres_url = config["POSTGRES"]["VPS"] if platform.system() == "Linux" else config["POSTGRES"]["HOME"]
-    return await asyncpg.create_pool(
-        postgres_url,
-        init=init,
-        command_timeout=60,
-        min_size=20,
-        max_size=20,
-        statement_cache_size=0,
-    )  # pyright: ignore[reportReturnType]
+def get_postgres_url() -> str:
+    """Get PostgreSQL connection string for the current machine."""
+    return config["POSTGRES"]["VPS"] if platform.system() == "Linux" else config["POSTGRES"]["HOME"]
 
 
 async def start_the_bot(*, test: bool) -> None:
     """Helper function to start the bot."""
     log = logging.getLogger()
     try:
-        pool = await create_pool()
+        pool = await create_pool(get_postgres_url(), config["POSTGRES"].get("POOL", {}))
     except Exception:
         msg = "Could not set up PostgreSQL. Exiting."
         click.echo(msg, file=sys.stderr)
@@ -89,16 +64,18 @@ async def start_the_bot(*, test: bool) -> None:
             pool as pool,
             AluBot(test=test, session=session, pool=pool) as alubot,
         ):
+            await send_restart_notice(session)
             await alubot.start()
 
 
 @click.group(invoke_without_command=True, options_metavar="[options]")
 @click.pass_context
 @click.option("--test", "-t", is_flag=True)
-def main(click_ctx: click.Context, *, test: bool) -> None:
+@click.option("--debug-buffer", "-d", type=int, default=0, help="Keep this many `log.debug` records in memory.")
+def main(click_ctx: click.Context, *, test: bool, debug_buffer: int) -> None:
     """Launches the bot."""
     if click_ctx.invoked_subcommand is None:
-        with setup_logging(test=test):
+        with setup_logging(test=test, debug_buffer_size=debug_buffer):
             try:
                 asyncio.run(start_the_bot(test=test))
             except KeyboardInterrupt:
@@ -122,6 +99,8 @@ def create() -> None:
                     if f.is_file() and f.suffix == ".sql" and not f.name.startswith("_"):
                         sql = f.read_text("utf-8")
                         await connection.execute(sql)
+                # fresh tables don't have the later changes yet
+                await MigrationRunner(connection).upgrade()
 
         asyncio.run(run_create())
     except Exception:  # noqa: BLE001
@@ -131,5 +110,33 @@ def create() -> None:
         click.secho("Applied SQL tables", fg="green")
 
 
+@db.command()
+@click.option("--dry-run", is_flag=True, help="Only list pending migrations.")
+def migrate(*, dry_run: bool) -> None:
+    """Applies pending versioned migrations from `sql/migrations`."""
+
+    async def run_migrate() -> list[Migration]:
+        connection = await asyncpg.connect(get_postgres_url())
+        try:
+            return await MigrationRunner(connection).upgrade(dry_run=dry_run)
+        finally:
+            await connection.close()
+
+    try:
+        migrations = asyncio.run(run_migrate())
+    except Exception:  # noqa: BLE001
+        traceback.print_exc()
+        click.secho("failed to apply migrations due to error", fg="red")
+        return
+
+    if not migrations:
+        click.secho("Database is up to date", fg="green")
+        return
+    for migration in migrations:
+        click.echo(f"{'Pending' if dry_run else 'Applied'} {migration.label}")
+    if not dry_run:
+        click.secho(f"Applied {len(migrations)} migration(s)", fg="green")
+
+
 if __name__ == "__main__":
     main()
@@ -1,4 +1,5 @@
 from .bases import *
 from .bot import *
+from .database import *
 from .logs import *
 from .timer_manager import *
@@ -99,6 +99,8 @@ class AluBot(commands.Bot):
         self.community_invite_url: str = "https://discord.gg/K8FuDeP"
 
         self.category_cogs: dict[ExtCategory, list[AluCog]] = {}
+        self.module_source_hashes: dict[str, str] = {}
+        """Mapping of project modules to hashes of their currently loaded source code. Used in `ext.dev.reload`."""
 
         self.mimic_message_user_mapping: MutableMapping[int, int] = cache.ExpiringCache(
             seconds=datetime.timedelta(days=7).seconds,
@@ -145,6 +147,7 @@ class AluBot(commands.Bot):
 
         ?tag ass (auto-syncing sucks) and all, but come on - it's just too convenient to pass on.
         The function is using non-global sync methods so should be fine on rate-limits.
+        Besides, it only syncs if the hash of the commands payload differs from the last synced one.
 
         Sources
         -------
@@ -157,20 +160,8 @@ class AluBot(commands.Bot):
         guild = discord.Object(id=self.hideout.id)
         self.tree.copy_global_to(guild=guild)
 
-        all_cmds = self.tree.get_commands(guild=guild)
-
-        new_payloads = [(guild.id, cmd.to_dict(self.tree)) for cmd in all_cmds]
-
-        query = "SELECT payload FROM auto_sync WHERE guild_id = $1"
-        db_payloads = [r["payload"] for r in await self.pool.fetch(query, guild.id)]
-
-        updated_payloads = [p for _, p in new_payloads if p not in db_payloads]
-        outdated_payloads = [p for p in db_payloads if p not in [p for _, p in new_payloads]]
-        not_synced = updated_payloads + outdated_payloads
-
-        if not_synced:
-            await self.pool.execute("DELETE FROM auto_sync WHERE guild_id = $1", guild.id)
-            await self.pool.executemany("INSERT INTO auto_sync (guild_id, payload) VALUES ($1, $2)", new_payloads)
+        # compares hashes of the command payloads with the last synced ones from the database
+        if await self.tree.plan_sync([guild]):
             await self.tree.sync(guild=guild)
             return True
         return False
@@ -193,6 +184,28 @@ class AluBot(commands.Bot):
             category = EXT_CATEGORY_NONE
 
         self.category_cogs.setdefault(category, []).append(cog)
+        self.dispatch("cogs_changed")
+
+    @override
+    async def remove_cog(
+        self,
+        name: str,
+        /,
+        *,
+        guild: Snowflake | None = MISSING,
+        guilds: Sequence[Snowflake] = MISSING,
+    ) -> commands.Cog | None:
+        cog = await super().remove_cog(name, guild=guild, guilds=guilds)
+        if cog is None:
+            return None
+
+        for category, cog_list in list(self.category_cogs.items()):
+            if cog in cog_list:
+                cog_list.remove(cog)
+            if not cog_list:
+                del self.category_cogs[category]
+        self.dispatch("cogs_changed")
+        return cog
 
     async def on_ready(self) -> None:
         """Handle `ready` event."""
@@ -273,6 +286,7 @@ class AluBot(commands.Bot):
 
             self.twitch = AluTwitchClient(self)
             await self.twitch.login()
+            self.twitch.stream_status.poll.start()
 
     def instantiate_tz_manager(self) -> None:
         """Instantiate TimeZone Manager."""
@@ -287,13 +301,15 @@ class AluBot(commands.Bot):
         log.info("%s is closing.", self.__class__.__name__)
         await self.send_warning("AluBot is closing.")
 
-        await self.pool.close()
+        self.exc_manager.close()
+        # clients go before the pool since they save their rate limiters state into the database
         if hasattr(self, "twitch"):
             await self.twitch.close()
         if hasattr(self, "dota"):
             await self.dota.close()
         if hasattr(self, "lol"):
             await self.lol.close()
+        await self.pool.close()
 
         await super().close()
         # session needs to be closed the last probably
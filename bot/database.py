@@ -0,0 +1,209 @@
+"""Database connection pool for AluBot.
+
+* elastic pool sizing that is configured in `config.toml` (`[POSTGRES.POOL]` section)
+* optional prepared statements cache (with a safe mode for pgbouncer in transaction pooling mode)
+* statistics for `Pool.acquire` wait and query latency
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, override
+
+import asyncpg
+import orjson
+
+if TYPE_CHECKING:
+    from asyncpg.pool import PoolConnectionProxy
+
+    from types_.config import PostgresPool
+
+
+__all__ = (
+    "LatencyStats",
+    "PoolStats",
+    "StatsPool",
+    "create_pool",
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+SLOW_QUERY_THRESHOLD = 1.0
+"""Queries slower than this amount of seconds are logged as warnings."""
+
+
+class LatencyStats:
+    """Aggregated latency statistics with percentiles over the most recent samples.
+
+    Attributes
+    ----------
+    count: int
+        Total amount of samples.
+    total: float
+        Sum of all samples, in seconds.
+    max: float
+        The biggest sample, in seconds.
+    recent: deque[float]
+        The most recent samples, used to calculate percentiles.
+    """
+
+    __slots__: tuple[str, ...] = ("count", "max", "recent", "total")
+
+    def __init__(self, *, recent_size: int = 1000) -> None:
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self.recent: deque[float] = deque(maxlen=recent_size)
+
+    def add(self, value: float) -> None:
+        """Add a sample, in seconds."""
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.recent.append(value)
+
+    def percentile(self, percent: float) -> float:
+        """Get the percentile of the recent samples, in seconds."""
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    @property
+    def mean(self) -> float:
+        """Mean of all samples, in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> str:
+        """Human-readable summary in milliseconds."""
+        return (
+            f"n={self.count} avg={self.mean * 1000:.1f}ms p50={self.percentile(50) * 1000:.1f}ms "
+            f"p95={self.percentile(95) * 1000:.1f}ms max={self.max * 1000:.1f}ms"
+        )
+
+
+class PoolStats:
+    """Statistics of the connection pool usage.
+
+    Attributes
+    ----------
+    acquire: LatencyStats
+        How long callers waited for `Pool.acquire` to give them a connection.
+    queries: LatencyStats
+        How long queries took to execute.
+    slow_queries: int
+        Amount of queries that took longer than `SLOW_QUERY_THRESHOLD`.
+    failed_queries: int
+        Amount of queries that raised an exception.
+    """
+
+    __slots__: tuple[str, ...] = ("acquire", "failed_queries", "queries", "slow_queries")
+
+    def __init__(self) -> None:
+        self.acquire: LatencyStats = LatencyStats()
+        self.queries: LatencyStats = LatencyStats()
+        self.slow_queries: int = 0
+        self.failed_queries: int = 0
+
+    def log_query(self, record: asyncpg.connection.LoggedQuery) -> None:
+        """Query logger callback for `asyncpg.Connection.add_query_logger`."""
+        self.queries.add(record.elapsed)
+        if record.exception is not None:
+            self.failed_queries += 1
+        if record.elapsed > SLOW_QUERY_THRESHOLD:
+            self.slow_queries += 1
+            log.warning("Slow query (%.2fs): %s", record.elapsed, " ".join(record.query.split())[:300])
+
+
+class StatsPool(asyncpg.Pool):  # pyright: ignore[reportMissingTypeArgument] # not generic at runtime
+    """Connection pool that collects `PoolStats`.
+
+    Use `create_pool` to create it.
+    """
+
+    def __init__(self, *args: Any, stats: PoolStats, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats: PoolStats = stats
+
+    @override
+    async def _acquire(self, timeout: float | None) -> PoolConnectionProxy[asyncpg.Record]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        start = time.perf_counter()
+        try:
+            return await super()._acquire(timeout)  # pyright: ignore[reportAttributeAccessIssue]
+        finally:
+            self.stats.acquire.add(time.perf_counter() - start)
+
+
+async def create_pool(dsn: str, settings: PostgresPool) -> StatsPool:
+    """Create a database connection pool.
+
+    Parameters
+    ----------
+    dsn: str
+        PostgreSQL connection string.
+    settings: PostgresPool
+        `[POSTGRES.POOL]` section of the config. Missing keys fall back to defaults.
+
+    Notes
+    -----
+    * With the statements cache, asyncpg prepares each query string once per connection,
+        so repeated (hot) queries skip parsing and planning.
+    * pgbouncer in transaction pooling mode can hand the next transaction to another server connection
+        where the named prepared statement does not exist, so `PGBOUNCER = true` disables the cache.
+    * `COMMAND_TIMEOUT` is the default timeout for all queries, it can be overridden per query with `timeout=`.
+    """
+
+    def _encode_jsonb(value: Any) -> str:
+        return orjson.dumps(value).decode("utf-8")
+
+    def _decode_jsonb(value: str) -> Any:
+        return orjson.loads(value)
+
+    pgbouncer = settings.get("PGBOUNCER", False)
+    min_size = settings.get("MIN_SIZE", 4)
+    max_size = max(min_size, settings.get("MAX_SIZE", 20))
+    statement_cache_size = 0 if pgbouncer else settings.get("STATEMENT_CACHE_SIZE", 256)
+
+    stats = PoolStats()
+
+    async def init(con: asyncpg.Connection[asyncpg.Record]) -> None:
+        await con.set_type_codec(
+            "jsonb",
+            schema="pg_catalog",
+            encoder=_encode_jsonb,
+            decoder=_decode_jsonb,
+            format="text",
+        )
+        con.add_query_logger(stats.log_query)
+
+    pool = StatsPool(
+        dsn,
+        stats=stats,
+        min_size=min_size,
+        max_size=max_size,
+        max_queries=50_000,
+        max_inactive_connection_lifetime=settings.get("MAX_INACTIVE_CONNECTION_LIFETIME", 300.0),
+        connect=None,
+        setup=None,
+        init=init,
+        reset=None,
+        loop=None,
+        connection_class=asyncpg.Connection,
+        record_class=asyncpg.Record,
+        command_timeout=settings.get("COMMAND_TIMEOUT", 60.0),
+        statement_cache_size=statement_cache_size,
+        # keep the cache for the whole connection lifetime - the schema doesn't change under a running bot
+        max_cached_statement_lifetime=0,
+    )
+    await pool
+    log.info(
+        "Created database pool: size=%s..%s, statement_cache_size=%s, pgbouncer=%s.",
+        min_size,
+        max_size,
+        statement_cache_size,
+        pgbouncer,
+    )
+    return pool
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import hashlib
 import logging
 import traceback
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, override
 
 import discord
 
+from utils import const, fmt
+
 if TYPE_CHECKING:
     from collections.abc import Generator
 
@@ -19,14 +22,107 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("exc_manager")
 
+__all__ = (
+    "ErrorInfoPacket",
+    "ExceptionManager",
+)
+
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+class ErrorInfoPacket:
+    """Information about one error "kind" that is being delivered or was recently delivered to developers.
+
+    Errors are grouped by their fingerprint (error type + stack location) so a storm of the same exception
+    results in one traceback report followed by short summaries instead of hundreds of identical tracebacks.
+
+    Attributes
+    ----------
+    fingerprint: str
+        Short hash of error type and stack location.
+    error_name: str
+        Qualified name of the error class.
+    location: str
+        Stack location where the error was raised, i.e. `ext/fpc/dota/notifications.py:123 in send_match`.
+    traceback: str
+        Formatted traceback of the first occurrence.
+    embed: discord.Embed
+        Embed with extra information about the first occurrence.
+    channel_id: int | None
+        Channel ID coming from `register_error` for the first occurrence.
+    count: int
+        Total amount of occurrences within the aggregation window.
+    delivered_count: int
+        Amount of occurrences that developers were already notified about.
+    delivered_at: datetime.datetime | None
+        When developers were notified about the packet the last time.
+    first_seen: datetime.datetime
+        When the first occurrence happened.
+    last_seen: datetime.datetime
+        When the latest occurrence happened.
+    queued: bool
+        Whether the packet is currently waiting in the delivery queue.
+
+    """
+
+    __slots__: tuple[str, ...] = (
+        "channel_id",
+        "count",
+        "delivered_at",
+        "delivered_count",
+        "embed",
+        "error_name",
+        "fingerprint",
+        "first_seen",
+        "last_seen",
+        "location",
+        "queued",
+        "traceback",
+    )
+
+    def __init__(
+        self,
+        *,
+        fingerprint: str,
+        error_name: str,
+        location: str,
+        traceback: str,
+        embed: discord.Embed,
+        channel_id: int | None,
+        now: datetime.datetime,
+    ) -> None:
+        self.fingerprint: str = fingerprint
+        self.error_name: str = error_name
+        self.location: str = location
+        self.traceback: str = traceback
+        self.embed: discord.Embed = embed
+        self.channel_id: int | None = channel_id
+
+        self.count: int = 1
+        self.delivered_count: int = 0
+        self.delivered_at: datetime.datetime | None = None
+        self.first_seen: datetime.datetime = now
+        self.last_seen: datetime.datetime = now
+        self.queued: bool = False
+
+    @override
+    def __repr__(self) -> str:
+        return f"<ErrorInfoPacket fingerprint={self.fingerprint} error_name={self.error_name} count={self.count}>"
+
+    @property
+    def undelivered_count(self) -> int:
+        """Amount of occurrences that developers are not notified about yet."""
+        return self.count - self.delivered_count
+
 
 class ExceptionManager:
     """Exception Manager that.
 
     * should be used to send all unhandled errors to developers via webhooks.
     * controls rate-limit of the said webhook
-    * contains history of errors that was not fixed yet
-    * allows users to track the said errors and get notification when it's fixed
+    * fingerprints errors and aggregates repeats of the same error into short summaries
+    * delivers errors in a background task so callers are never blocked by the rate-limit
 
     Attributes
     ----------
@@ -34,10 +130,14 @@ class ExceptionManager:
         The bot instance.
     cooldown: datetime.timedelta
         The cooldown between sending errors. This defaults to 5 seconds.
-    errors_cache: dict[str, list[ErrorInfoPacket]]
-        A mapping of tracebacks to their error information.
-    error_webhook: discord.Webhook
-        The error webhook used to send errors.
+    aggregate_window: datetime.timedelta
+        For how long repeats of an already reported error are only counted instead of being reported in full.
+        This defaults to 1 hour.
+    summary_interval: datetime.timedelta
+        Minimum time between two deliveries of the same error, so a loop that fails every minute
+        doesn't post a summary every minute forever. This defaults to `aggregate_window`.
+    errors_cache: dict[str, ErrorInfoPacket]
+        A mapping of error fingerprints to their error information.
 
     """
 
@@ -46,11 +146,15 @@ class ExceptionManager:
     # https://github.com/DuckBot-Discord/DuckBot/blob/rewrite/utils/errorhandler.py
 
     __slots__: tuple[str, ...] = (
-        "_lock",
+        "_delivery_task",
         "_most_recent",
+        "_queue",
+        "_scheduled",
+        "aggregate_window",
         "bot",
         "cooldown",
         "errors_cache",
+        "summary_interval",
     )
 
     def __init__(
@@ -58,12 +162,19 @@ class ExceptionManager:
         bot: AluBot,
         *,
         cooldown: datetime.timedelta = datetime.timedelta(seconds=5),
+        aggregate_window: datetime.timedelta = datetime.timedelta(hours=1),
+        summary_interval: datetime.timedelta | None = None,
     ) -> None:
         self.bot: AluBot = bot
         self.cooldown: datetime.timedelta = cooldown
+        self.aggregate_window: datetime.timedelta = aggregate_window
+        self.summary_interval: datetime.timedelta = summary_interval or aggregate_window
+        self.errors_cache: dict[str, ErrorInfoPacket] = {}
 
-        self._lock: asyncio.Lock = asyncio.Lock()
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._delivery_task: asyncio.Task[None] | None = None
         self._most_recent: datetime.datetime | None = None
+        self._scheduled: dict[str, asyncio.TimerHandle] = {}
 
     def _yield_code_chunks(self, iterable: str, *, chunks_size: int = 2000) -> Generator[str, None, None]:
         codeblocks: str = "```py\n{}```"
@@ -72,6 +183,32 @@ class ExceptionManager:
         for i in range(0, len(iterable), max_chars_in_code):
             yield codeblocks.format(iterable[i : i + max_chars_in_code])
 
+    @staticmethod
+    def get_fingerprint(error: BaseException) -> tuple[str, str]:
+        """Get fingerprint and stack location for the error.
+
+        The location is the innermost frame from the bot's own code (or just the innermost frame
+        if the whole traceback consists of library frames).
+
+        Returns
+        -------
+        tuple[str, str]
+            Fingerprint hash and human-readable stack location.
+        """
+        cwd = str(Path.cwd())
+        frames = traceback.extract_tb(error.__traceback__)
+        own_frames = [frame for frame in frames if frame.filename.startswith(cwd)] or frames
+        if own_frames:
+            frame = own_frames[-1]
+            filename = frame.filename.replace(cwd, "AluBot")
+            location = f"{filename}:{frame.lineno} in {frame.name}"
+        else:
+            location = "unknown location"
+
+        error_name = f"{error.__class__.__module__}.{error.__class__.__qualname__}"
+        fingerprint = hashlib.blake2b(f"{error_name}@{location}".encode(), digest_size=6).hexdigest()
+        return fingerprint, location
+
     async def register_error(
         self,
         error: BaseException,
@@ -82,6 +219,8 @@ class ExceptionManager:
     ) -> None:
         """Register, analyse error and put it into queue to send to developers.
 
+        This doesn't wait for the error to be delivered, the actual sending happens in a background task.
+
         Parameters
         ----------
         error: Exception
@@ -102,49 +241,166 @@ class ExceptionManager:
         log_message = log_message if log_message is not None else embed.footer.text
         log.error("%s: `%s`.", error.__class__.__name__, log_message, exc_info=error)
 
-        # apparently there is https://github.com/vi3k6i5/flashtext for "the fastest replacement"
-        # not sure if I want to add an extra dependency
-        traceback_string = "".join(traceback.format_exception(error)).replace(str(Path.cwd()), "AluBot")
-        traceback_string = traceback_string.replace("``", "`\u200b`")
+        now = datetime.datetime.now(datetime.UTC)
+        fingerprint, location = self.get_fingerprint(error)
+
+        packet = self.errors_cache.get(fingerprint)
+        if packet is None or now - packet.last_seen > self.aggregate_window:
+            # apparently there is https://github.com/vi3k6i5/flashtext for "the fastest replacement"
+            # not sure if I want to add an extra dependency
+            traceback_string = "".join(traceback.format_exception(error)).replace(str(Path.cwd()), "AluBot")
+            traceback_string = traceback_string.replace("``", "`\u200b`")
+
+            packet = self.errors_cache[fingerprint] = ErrorInfoPacket(
+                fingerprint=fingerprint,
+                error_name=error.__class__.__name__,
+                location=location,
+                traceback=traceback_string,
+                embed=embed,
+                channel_id=channel_id,
+                now=now,
+            )
+        else:
+            packet.count += 1
+            packet.last_seen = now
+            log.debug("Aggregating repeated error %r.", packet)
+
+        if not packet.queued:
+            packet.queued = True
+            wait = (packet.delivered_at + self.summary_interval - now).total_seconds() if packet.delivered_at else 0
+            if wait > 0:
+                # the summary of repeats waits for `summary_interval` since the previous delivery
+                self._scheduled[fingerprint] = asyncio.get_running_loop().call_later(
+                    wait, self._enqueue_scheduled, packet
+                )
+            else:
+                self._queue.put_nowait(fingerprint)
+
+        if self._delivery_task is None or self._delivery_task.done():
+            self._delivery_task = asyncio.create_task(self.delivery_worker())
+
+    def _enqueue_scheduled(self, packet: ErrorInfoPacket) -> None:
+        """Put the packet with a postponed summary into the delivery queue."""
+        self._scheduled.pop(packet.fingerprint, None)
+        if self.errors_cache.get(packet.fingerprint) is packet:
+            self._queue.put_nowait(packet.fingerprint)
+        if self._delivery_task is None or self._delivery_task.done():
+            self._delivery_task = asyncio.create_task(self.delivery_worker())
+
+    async def delivery_worker(self) -> None:
+        """Background task that sends queued errors to the error webhook while respecting the cooldown."""
+        while True:
+            fingerprint = await self._queue.get()
 
-        async with self._lock:
             if self._most_recent and (delta := datetime.datetime.now(datetime.UTC) - self._most_recent) < self.cooldown:
-                # We have to wait
-                total_seconds = delta.total_seconds()
+                # We have to wait; repeats of queued errors keep aggregating meanwhile
+                total_seconds = (self.cooldown - delta).total_seconds()
                 log.debug("Waiting %s seconds to send the error.", total_seconds)
                 await asyncio.sleep(total_seconds)
 
+            packet = self.errors_cache.get(fingerprint)
+            if packet is None:
+                continue
+            packet.queued = False
+            if not packet.undelivered_count:
+                continue
+
             self._most_recent = datetime.datetime.now(datetime.UTC)
-            await self.send_error(traceback_string, embed, channel_id=channel_id)
+            # occurrences registered while the message is being sent are left for the next delivery
+            count = packet.count
+            try:
+                await self.send_error(packet)
+            except Exception as exc:  # noqa: BLE001
+                # never let the worker die, otherwise errors would silently pile up in the queue
+                log.warning("Failed to deliver error %r: %s", packet, exc)
+            finally:
+                packet.delivered_count = count
+                packet.delivered_at = self._most_recent
+                self._prune_cache()
+
+    def _prune_cache(self) -> None:
+        """Remove packets that are out of the aggregation window and are not waiting for delivery."""
+        now = datetime.datetime.now(datetime.UTC)
+        to_remove = [
+            fingerprint
+            for fingerprint, packet in self.errors_cache.items()
+            if not packet.queued and now - packet.last_seen > self.aggregate_window
+        ]
+        for fingerprint in to_remove:
+            del self.errors_cache[fingerprint]
+
+    def summary_embed(self, packet: ErrorInfoPacket) -> discord.Embed:
+        """Embed that summarizes repeats of the error."""
+        return (
+            discord.Embed(
+                color=const.Color.error,
+                title=f"`{packet.error_name}` x{packet.undelivered_count}",
+                description=f"`{packet.location}`",
+            )
+            .add_field(name="Total Count", value=str(packet.count))
+            .add_field(name="First Seen", value=fmt.format_dt(packet.first_seen, style="T"))
+            .add_field(name="Last Seen", value=fmt.format_dt(packet.last_seen, style="T"))
+            .set_footer(text=f"Fingerprint: {packet.fingerprint}")
+        )
 
-    async def send_error(self, traceback: str, embed: discord.Embed, *, channel_id: int | None = None) -> None:
+    @staticmethod
+    def _pack_embeds(embeds: list[discord.Embed]) -> Generator[list[discord.Embed], None, None]:
+        """Pack embeds into as few messages as Discord limits allow."""
+        batch: list[discord.Embed] = []
+        batch_length = 0
+        for embed in embeds:
+            embed_length = len(embed)
+            if batch and (
+                len(batch) >= MAX_EMBEDS_PER_MESSAGE or batch_length + embed_length > MAX_EMBED_CHARS_PER_MESSAGE
+            ):
+                yield batch
+                batch, batch_length = [], 0
+            batch.append(embed)
+            batch_length += embed_length
+        if batch:
+            yield batch
+
+    async def send_error(self, packet: ErrorInfoPacket) -> None:
         """Send an error to the error webhook.
 
         It is not recommended to call this yourself, call `register_error` instead.
 
+        The first delivery of the packet sends the full traceback, packed into multi-embed messages.
+        Further deliveries (repeats within the aggregation window) only send a short summary.
+
         Parameters
         ----------
-        traceback: str
-            The traceback of the error.
-        embed: discord.Embed
-            The additional information about the error. This comes from registering the error.
-        channel_id: int | None = None
-            Channel ID coming from `register_error`.
+        packet: ErrorInfoPacket
+            The information about the error. This comes from registering the error.
         """
-        code_chunks = list(self._yield_code_chunks(traceback))
-
-        # hmm, this is honestly a bit too many sends for 5 seconds of rate limit :thinking:
+        if packet.delivered_count:
+            # the traceback was already sent - only summarize repeats
+            content = ""
+            embeds = [self.summary_embed(packet)]
+        else:
+            content = self.bot.error_ping
+            embeds = [
+                discord.Embed(color=const.Color.error, description=chunk)
+                for chunk in self._yield_code_chunks(packet.traceback)
+            ]
+            if packet.channel_id != self.bot.hideout.spam_channel_id:
+                embeds.append(packet.embed)
+            if packet.count > 1:
+                embeds.append(self.summary_embed(packet))
 
-        # if channel_id != self.bot.hideout.spam_channel_id:
         try:
-            await self.bot.error_webhook.send(self.bot.error_ping)
-
-            for chunk in code_chunks:
-                await self.bot.error_webhook.send(chunk)
-
-            if channel_id != self.bot.hideout.spam_channel_id:
-                await self.bot.error_webhook.send(embed=embed)
+            for batch in self._pack_embeds(embeds):
+                await self.bot.error_webhook.send(content=content, embeds=batch)
+                content = ""  # only ping once
         except discord.HTTPException as error:
             # possible rate limit or worse :c
             warning = f"{self.bot.error_ping} {error.__class__.__name__} {error}"
             await self.bot.spam_webhook.send(warning)
+
+    def close(self) -> None:
+        """Cancel the background delivery task and postponed summaries."""
+        for handle in self._scheduled.values():
+            handle.cancel()
+        self._scheduled.clear()
+        if self._delivery_task is not None:
+            self._delivery_task.cancel()
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
+import gzip
 import logging
 import platform
+import queue
+import shutil
+from collections import deque
 from contextlib import contextmanager
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, override
 
@@ -16,7 +21,14 @@ from utils import const, fmt
 if TYPE_CHECKING:
     from collections.abc import Generator
 
-__all__ = ("setup_logging",)
+    from aiohttp import ClientSession
+
+__all__ = (
+    "DebugRingBufferHandler",
+    "get_debug_buffer",
+    "send_restart_notice",
+    "setup_logging",
+)
 
 # generated at https://patorjk.com/software/taag/ using "Standard" font
 ASCII_STARTING_UP_ART = r"""
@@ -31,16 +43,31 @@ ASCII_STARTING_UP_ART = r"""
 
 
 @contextmanager
-def setup_logging(*, test: bool) -> Generator[Any, Any, Any]:
-    """Setup logging."""
+def setup_logging(*, test: bool, debug_buffer_size: int = 0) -> Generator[Any, Any, Any]:
+    """Setup logging.
+
+    Handlers that do I/O (stream and rotating file) are put behind a `QueueHandler` so
+    the event loop thread only pushes records into a queue while a `QueueListener` thread
+    does the actual writing, rotation and compression.
+
+    Parameters
+    ----------
+    test: bool
+        Whether the bot is a testing version (YenBot) or main production bot (AluBot).
+    debug_buffer_size: int = 0
+        If positive, `log.debug` records are additionally kept in a ring buffer of this size
+        that can be dumped on demand, i.e. with `/system debug-logs`.
+
+    """
     log = logging.getLogger()
-    log.setLevel(logging.INFO)
+    log.setLevel(logging.DEBUG if debug_buffer_size > 0 else logging.INFO)
 
+    listener: QueueListener | None = None
     try:
         # Stream Handler
         handler = logging.StreamHandler()
+        handler.setLevel(logging.INFO)
         handler.setFormatter(get_log_fmt(handler))
-        log.addHandler(handler)
 
         # ensure folder for logs, cfg, temp, etc
         Path(".temp/").mkdir(parents=True, exist_ok=True)
@@ -52,31 +79,105 @@ def setup_logging(*, test: bool) -> Generator[Any, Any, Any]:
             maxBytes=24 * 1024 * 1024,  # MiB
             backupCount=5,  # Rotate through 5 files
         )
+        file_handler.namer = gzip_namer
+        file_handler.rotator = gzip_rotator
+        file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(get_log_fmt(file_handler))
-        log.addHandler(file_handler)
+
+        # Queue Handler: the only handler doing work on the caller's thread is a cheap `put_nowait`
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(logging.INFO)
+        log.addHandler(queue_handler)
+        listener = QueueListener(log_queue, handler, file_handler, respect_handler_level=True)
+        listener.start()
+
+        if debug_buffer_size > 0:
+            log.addHandler(DebugRingBufferHandler(capacity=debug_buffer_size))
 
         if platform.system() == "Linux":
             # so start-ups in logs are way more noticeable
             log.info(ASCII_STARTING_UP_ART)
-            # send a webhook message as well
-            webhook_uls = [config["WEBHOOKS"]["LOGGER"], config["WEBHOOKS"]["SPAM"]]
-            webhooks = [discord.SyncWebhook.from_url(w) for w in webhook_uls]
-
-            for webhook in webhooks:
-                content = "# Restarting"
-                now_str = fmt.format_dt(datetime.datetime.now(datetime.UTC), style="T")
-                embed = discord.Embed(color=discord.Color.og_blurple(), description=f"{now_str} The bot is restarting")
-                webhook.send(content=content, avatar_url=const.Emoticon.Swan, embed=embed)
 
         yield
     finally:
         # __exit__
+        if listener is not None:
+            # flushes the remaining records from the queue
+            listener.stop()
         handlers = log.handlers[:]
         for h in handlers:
             h.close()
             log.removeHandler(h)
 
 
+async def send_restart_notice(session: ClientSession) -> None:
+    """Send a webhook message that the bot is restarting, so start-ups are noticeable in Discord too."""
+    if platform.system() != "Linux":
+        return
+
+    webhook_urls = [config["WEBHOOKS"]["LOGGER"], config["WEBHOOKS"]["SPAM"]]
+    content = "# Restarting"
+    now_str = fmt.format_dt(datetime.datetime.now(datetime.UTC), style="T")
+    embed = discord.Embed(color=discord.Color.og_blurple(), description=f"{now_str} The bot is restarting")
+    await asyncio.gather(
+        *(
+            discord.Webhook.from_url(url, session=session).send(
+                content=content, avatar_url=const.Emoticon.Swan, embed=embed
+            )
+            for url in webhook_urls
+        ),
+        return_exceptions=True,
+    )
+
+
+def gzip_namer(name: str) -> str:
+    """Namer for rotated log files, they are compressed with `gzip_rotator`."""
+    return f"{name}.gz"
+
+
+def gzip_rotator(source: str, dest: str) -> None:
+    """Rotator that compresses rotated log files.
+
+    This is executed in `QueueListener` thread so it doesn't block the event loop.
+
+    Sources
+    -------
+    * Python Logging Cookbook, "Using a rotator and namer to customize log rotation processing":
+        https://docs.python.org/3/howto/logging-cookbook.html#using-a-rotator-and-namer-to-customize-log-rotation-processing
+    """
+    source_path = Path(source)
+    with source_path.open("rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    source_path.unlink()
+
+
+class DebugRingBufferHandler(logging.Handler):
+    """Handler that keeps the latest `log.debug` records in memory.
+
+    Appending to a bounded `deque` is cheap and thread-safe so this handler is attached to the root logger directly.
+    The records are only formatted when somebody asks for them with `dump`.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(logging.DEBUG)
+        self.buffer: deque[logging.LogRecord] = deque(maxlen=capacity)
+        self.setFormatter(get_log_fmt(self))
+
+    @override
+    def emit(self, record: logging.LogRecord) -> None:
+        self.buffer.append(record)
+
+    def dump(self) -> str:
+        """Format all records currently in the buffer."""
+        return "\n".join(self.format(record) for record in list(self.buffer))
+
+
+def get_debug_buffer() -> DebugRingBufferHandler | None:
+    """Get the debug ring buffer handler from the root logger if it's enabled."""
+    return next((h for h in logging.getLogger().handlers if isinstance(h, DebugRingBufferHandler)), None)
+
+
 class MyColorFormatter(logging.Formatter):
     """My color formatter.
 
@@ -0,0 +1,161 @@
+"""Versioned database migrations.
+
+`sql/*.sql` files describe tables and are (re-)applied by `db create` as a whole.
+Changes to the existing databases (indexes, new columns, data fixes, etc.) go into
+`sql/migrations/NNNN_short_name.sql` files instead. Each of them is applied exactly once,
+in the order of their versions, and recorded in the `schema_migrations` table.
+
+Usage: `python . db migrate` (or `db migrate --dry-run` to only list the pending ones).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, TypedDict
+
+if TYPE_CHECKING:
+    import datetime
+
+    import asyncpg
+
+    class AppliedMigrationRow(TypedDict):
+        version: int
+        name: str
+        checksum: str
+        applied_at: datetime.datetime
+
+
+__all__ = (
+    "Migration",
+    "MigrationRunner",
+    "discover_migrations",
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+MIGRATIONS_DIRECTORY = Path("sql") / "migrations"
+MIGRATION_FILENAME_REGEX = re.compile(r"^(?P<version>\d{4})_(?P<name>\w+)\.sql$")
+
+
+class Migration(NamedTuple):
+    """Migration file."""
+
+    version: int
+    name: str
+    path: Path
+
+    @property
+    def sql(self) -> str:
+        """SQL source of the migration."""
+        return self.path.read_text("utf-8")
+
+    @property
+    def checksum(self) -> str:
+        """Hash of the SQL source, used to notice edits of already applied migrations."""
+        return hashlib.sha256(self.sql.encode()).hexdigest()
+
+    @property
+    def label(self) -> str:
+        """Human-readable label, i.e. `0001_hot_query_indexes`."""
+        return f"{self.version:04d}_{self.name}"
+
+
+def discover_migrations(directory: Path = MIGRATIONS_DIRECTORY) -> list[Migration]:
+    """Get migrations from the directory sorted by their versions.
+
+    Raises
+    ------
+    ValueError
+        A file is misnamed or two files share the same version.
+    """
+    migrations: dict[int, Migration] = {}
+    for path in directory.glob("*.sql"):
+        match = MIGRATION_FILENAME_REGEX.match(path.name)
+        if match is None:
+            msg = f"Migration file `{path.name}` does not follow `NNNN_short_name.sql` naming."
+            raise ValueError(msg)
+
+        version = int(match.group("version"))
+        if version in migrations:
+            msg = f"Migrations `{migrations[version].path.name}` and `{path.name}` share the same version."
+            raise ValueError(msg)
+        migrations[version] = Migration(version, match.group("name"), path)
+    return [migrations[version] for version in sorted(migrations)]
+
+
+class MigrationRunner:
+    """Applies pending migrations and records them in the `schema_migrations` table.
+
+    Attributes
+    ----------
+    connection: asyncpg.Connection
+        Database connection to run migrations with.
+    migrations: list[Migration]
+        All known migrations sorted by their versions.
+    """
+
+    __slots__: tuple[str, ...] = ("connection", "migrations")
+
+    def __init__(
+        self, connection: asyncpg.Connection[asyncpg.Record], migrations: list[Migration] | None = None
+    ) -> None:
+        self.connection: asyncpg.Connection[asyncpg.Record] = connection
+        self.migrations: list[Migration] = migrations if migrations is not None else discover_migrations()
+
+    async def ensure_table(self) -> None:
+        """Create the table that keeps track of applied migrations."""
+        query = """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INT PRIMARY KEY,
+                name TEXT NOT NULL,
+                checksum TEXT NOT NULL,
+                applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            );
+        """
+        await self.connection.execute(query)
+
+    async def applied(self) -> dict[int, AppliedMigrationRow]:
+        """Get already applied migrations by their versions."""
+        query = "SELECT version, name, checksum, applied_at FROM schema_migrations"
+        rows: list[AppliedMigrationRow] = await self.connection.fetch(query)  # pyright: ignore[reportAssignmentType]
+        return {row["version"]: row for row in rows}
+
+    async def pending(self) -> list[Migration]:
+        """Get migrations that were not applied yet.
+
+        Already applied migrations whose files were edited since are reported with a warning:
+        they are not re-applied, write a new migration instead.
+        """
+        applied = await self.applied()
+        for migration in self.migrations:
+            row = applied.get(migration.version)
+            if row is not None and row["checksum"] != migration.checksum:
+                log.warning("Migration `%s` was edited after it had been applied.", migration.label)
+        return [migration for migration in self.migrations if migration.version not in applied]
+
+    async def apply(self, migration: Migration) -> None:
+        """Apply the migration and record it, in one transaction."""
+        async with self.connection.transaction():
+            await self.connection.execute(migration.sql)
+            query = "INSERT INTO schema_migrations (version, name, checksum) VALUES ($1, $2, $3)"
+            await self.connection.execute(query, migration.version, migration.name, migration.checksum)
+        log.info("Applied migration `%s`.", migration.label)
+
+    async def upgrade(self, *, dry_run: bool = False) -> list[Migration]:
+        """Apply all pending migrations in order.
+
+        Returns
+        -------
+        list[Migration]
+            Migrations that were applied (or would be applied for `dry_run=True`).
+        """
+        await self.ensure_table()
+        pending = await self.pending()
+        if not dry_run:
+            for migration in pending:
+                await self.apply(migration)
+        return pending
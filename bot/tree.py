@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 from typing import TYPE_CHECKING, Any, override
 
 import discord
+import orjson
 from discord import app_commands
 from discord.ext import commands
 
 from utils import const, errors, fmt, helpers
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Generator
+    from collections.abc import AsyncGenerator, Generator, Sequence
 
     from .bases import AluInteraction
+    from .bot import AluBot
 
 
 __all__ = ("AluAppCommandTree",)
@@ -36,6 +40,12 @@ class AluAppCommandTree(app_commands.CommandTree):
         https://gist.github.com/Soheab/fed903c25b1aae1f11a8ca8c33243131
     """
 
+    if TYPE_CHECKING:
+        client: AluBot
+
+    SYNC_MAX_CONCURRENCY: int = 3
+    """How many guilds are allowed to be synced at the same time by `sync_changed`."""
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.application_commands: dict[int | None, list[app_commands.AppCommand]] = {}
@@ -47,13 +57,89 @@ class AluAppCommandTree(app_commands.CommandTree):
 
     @override
     async def sync(self, *, guild: discord.abc.Snowflake | None = None) -> list[app_commands.AppCommand]:
-        """Method overwritten to store the commands."""
+        """Method overwritten to store the commands and the hash of the synced payload."""
+        payload_hash = self.payload_hash(guild=guild)
         ret = await super().sync(guild=guild)
         guild_id = guild.id if guild else None
         self.application_commands[guild_id] = ret
         self.cache.pop(guild_id, None)
+
+        query = """
+            INSERT INTO app_command_sync (application_id, guild_id, payload_hash)
+            VALUES ($1, $2, $3)
+            ON CONFLICT (application_id, guild_id) DO UPDATE
+                SET payload_hash = $3;
+        """
+        await self.client.pool.execute(query, self.client.application_id, guild_id or 0, payload_hash)
+        # command ids (thus mentions) might have changed
+        self.client.dispatch("app_commands_synced")
         return ret
 
+    def payload_hash(self, *, guild: discord.abc.Snowflake | None = None) -> str:
+        """Get hash of the canonical payload of the commands that `sync` would send for the guild (or globally)."""
+        payloads = sorted(
+            (cmd.to_dict(self) for cmd in self.get_commands(guild=guild)),
+            key=lambda payload: (payload.get("type", 1), payload["name"]),
+        )
+        return hashlib.sha256(orjson.dumps(payloads, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    async def plan_sync(self, guilds: Sequence[discord.abc.Snowflake | None]) -> list[discord.abc.Snowflake | None]:
+        """Get the list of guilds (`None` for global scope) which commands payload changed since their last sync.
+
+        The hashes of the last synced payloads are stored in the database,
+        so this doesn't require any API calls to fetch the remote state.
+        """
+        query = "SELECT guild_id, payload_hash FROM app_command_sync WHERE application_id = $1 AND guild_id = ANY($2)"
+        rows = await self.client.pool.fetch(
+            query, self.client.application_id, [guild.id if guild else 0 for guild in guilds]
+        )
+        synced_hashes: dict[int, str] = {row["guild_id"]: row["payload_hash"] for row in rows}
+        return [
+            guild for guild in guilds if synced_hashes.get(guild.id if guild else 0) != self.payload_hash(guild=guild)
+        ]
+
+    async def sync_changed(
+        self, guilds: Sequence[discord.abc.Snowflake | None], *, force: bool = False
+    ) -> tuple[list[app_commands.AppCommand], int, list[discord.abc.Snowflake | None]]:
+        """Sync only the guilds (`None` for global scope) which commands payload changed since their last sync.
+
+        Changed guilds are synced concurrently, but no more than `SYNC_MAX_CONCURRENCY` at a time
+        so we stay well within Discord's rate limits. discord.py handles per-route buckets itself.
+
+        Parameters
+        ----------
+        guilds: Sequence[discord.abc.Snowflake | None]
+            Guilds (`None` for global scope) to sync.
+        force: bool = False
+            Sync all the given guilds even if their stored payload hash matches,
+            i.e. when the remote state drifted from what we synced last time (edited from another client, etc.).
+
+        Returns
+        -------
+        tuple[list[app_commands.AppCommand], int, list[discord.abc.Snowflake | None]]
+            Synced commands, amount of skipped (unchanged) guilds and the list of guilds that failed to sync.
+        """
+        changed = list(guilds) if force else await self.plan_sync(guilds)
+        semaphore = asyncio.Semaphore(self.SYNC_MAX_CONCURRENCY)
+
+        async def sync_one(guild: discord.abc.Snowflake | None) -> list[app_commands.AppCommand]:
+            async with semaphore:
+                return await self.sync(guild=guild)
+
+        results = await asyncio.gather(*(sync_one(guild) for guild in changed), return_exceptions=True)
+
+        synced: list[app_commands.AppCommand] = []
+        failed: list[discord.abc.Snowflake | None] = []
+        for guild, result in zip(changed, results, strict=True):
+            if isinstance(result, discord.HTTPException):
+                log.warning("Failed to sync guild %s: %s", guild.id if guild else "global", result)
+                failed.append(guild)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                synced.extend(result)
+        return synced, len(guilds) - len(changed), failed
+
     @override
     async def fetch_commands(self, *, guild: discord.abc.Snowflake | None = None) -> list[app_commands.AppCommand]:
         """Method overwritten to store the commands."""
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import itertools
-from typing import TYPE_CHECKING, Any, Literal, Self, override
+import logging
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self, override
 
 import discord
 from discord.ext import commands, menus
@@ -10,7 +12,7 @@ from bot import AluCog, AluContext, ExtCategory, aluloop
 from utils import const, pages
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Sequence
 
     from bot import AluBot
 
@@ -18,6 +20,12 @@ if TYPE_CHECKING:
 type AluCommand = commands.Command[AluCog, Any, Any]
 type AluGroupCommand = commands.Group[AluCog, Any, Any]
 
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+CORPUS_REBUILD_DELAY = 3.0
+"""Seconds to wait before rebuilding the help corpus so bulk extension reloads result in a single rebuild."""
+
 
 class CogPage:
     def __init__(
@@ -39,6 +47,45 @@ class CogPage:
         self.section_total_pages: int = section_total_pages
         self.category_page_number: int = category_page_number
         self.category_total_pages: int = category_total_pages
+        self.embed: discord.Embed = discord.Embed()
+
+
+class HelpCorpus:
+    """Pre-built help menu: pages with their embeds, section starting pages and category select options.
+
+    It's compiled once after extensions are loaded and after app commands sync
+    so showing the help menu is just a lookup and never walks commands or calls the API.
+
+    Attributes
+    ----------
+    help_data: dict[ExtCategory, list[CogPage]]
+        Help pages grouped by category, index page goes first.
+    section_pages: dict[str, int]
+        Mapping of cog qualified names to the number of their first page.
+    select_options: list[discord.SelectOption]
+        Options for the category select menu.
+    """
+
+    __slots__: tuple[str, ...] = ("help_data", "section_pages", "select_options")
+
+    def __init__(self, help_data: dict[ExtCategory, list[CogPage]], section_pages: dict[str, int]) -> None:
+        self.help_data: dict[ExtCategory, list[CogPage]] = help_data
+        self.section_pages: dict[str, int] = section_pages
+
+        self.select_options: list[discord.SelectOption] = []
+        total = 1
+        for category, cog_pages in help_data.items():
+            start, end = total, total + len(cog_pages) - 1
+            total += len(cog_pages)
+            pages_string = f"(page {start})" if start == end else f"(pages {start}-{end})"
+            self.select_options.append(
+                discord.SelectOption(
+                    label=f"{category.name} {pages_string}",
+                    emoji=category.emote,
+                    description=category.description,
+                    value=str(start - 1),  # we added 1 in total=1
+                )
+            )
 
 
 class HelpPageSource(menus.ListPageSource):
@@ -48,10 +95,23 @@ class HelpPageSource(menus.ListPageSource):
 
     @override
     async def format_page(self, menu: HelpPages, page: CogPage) -> discord.Embed:
+        menu.clear_items()
+        menu.fill_items()
+        if page.section == "_front_page":
+            bot = menu.ctx_ntr.client
+            menu.add_item(discord.ui.Button(emoji=const.EmoteLogo.GitHub, label="GitHub", url=bot.repository_url))
+            menu.add_item(discord.ui.Button(emoji=const.Emote.FeelsDankMan, label="Invite me", url=bot.invite_link))
+            menu.add_item(
+                discord.ui.Button(emoji=const.EmoteLogo.AluerieServer, label="Community", url=bot.community_invite_url),
+            )
+        return page.embed
+
+    @staticmethod
+    def build_embed(bot: AluBot, help_cmd: AluHelp, page: CogPage) -> discord.Embed:
+        """Build the embed for the help page."""
         e = discord.Embed(color=const.Color.prpl)
 
         if page.section == "_front_page":
-            bot = menu.ctx_ntr.client
             owner = bot.owner
             e.title = f"{bot.user.name}'s Help Menu"
             e.description = (
@@ -66,15 +126,6 @@ class HelpPageSource(menus.ListPageSource):
             e.set_thumbnail(url=bot.user.display_avatar)
             e.set_author(name=f"Made by @{owner.display_name}", icon_url=owner.display_avatar)
             e.set_footer(text=f"With love, {bot.user.display_name}", icon_url=bot.user.display_avatar)
-
-            menu.clear_items()
-            menu.fill_items()
-            menu.add_item(discord.ui.Button(emoji=const.EmoteLogo.GitHub, label="GitHub", url=bot.repository_url))
-            menu.add_item(discord.ui.Button(emoji=const.Emote.FeelsDankMan, label="Invite me", url=bot.invite_link))
-            menu.add_item(
-                discord.ui.Button(emoji=const.EmoteLogo.AluerieServer, label="Community", url=bot.community_invite_url),
-            )
-
             return e
 
         emote = getattr(page.section, "emote", None) or ""
@@ -91,28 +142,20 @@ class HelpPageSource(menus.ListPageSource):
         e.description = page.section.description
         for c in page.page_commands:
             e.add_field(
-                name=menu.help_cmd.get_command_signature(c),
-                value=menu.help_cmd.get_command_short_help(c),
+                name=help_cmd.get_command_signature(c),
+                value=help_cmd.get_command_short_help(c),
                 inline=False,
             )
-        e.set_footer(text=page.category.description, icon_url=menu.ctx_ntr.client.user.display_avatar)
-        menu.clear_items()
-        menu.fill_items()
+        e.set_footer(text=page.category.description, icon_url=bot.user.display_avatar)
         return e
 
 
 class HelpPages(pages.Paginator):
     source: HelpPageSource
 
-    def __init__(
-        self,
-        ctx: AluContext | discord.Interaction[AluBot],
-        help_cmd: AluHelp,
-        help_data: dict[ExtCategory, list[CogPage]],
-    ) -> None:
-        self.help_cmd: AluHelp = help_cmd
-        self.help_data: dict[ExtCategory, list[CogPage]] = help_data
-        super().__init__(ctx, HelpPageSource(help_data))
+    def __init__(self, ctx: AluContext | discord.Interaction[AluBot], corpus: HelpCorpus) -> None:
+        self.corpus: HelpCorpus = corpus
+        super().__init__(ctx, HelpPageSource(corpus.help_data))
 
     @override
     def fill_items(self) -> None:
@@ -163,28 +206,12 @@ class HelpPages(pages.Paginator):
 
 class HelpSelect(discord.ui.Select[HelpPages]):
     def __init__(self, paginator: HelpPages) -> None:
-        super().__init__(placeholder="\N{UNICORN FACE} Choose help category")
+        super().__init__(
+            placeholder="\N{UNICORN FACE} Choose help category",
+            options=list(paginator.corpus.select_options),
+        )
         self.paginator: HelpPages = paginator
 
-        self.__fill_options()
-
-    def __fill_options(self) -> None:
-        pages_per_category: Mapping[ExtCategory, tuple[int, int]] = {}
-        total = 1
-        for category, cog_pages in self.paginator.help_data.items():
-            starting = total
-            total += len(cog_pages)
-            pages_per_category[category] = starting, total - 1
-
-        for category, (start, end) in pages_per_category.items():
-            pages_string = f"(page {start})" if start == end else f"(pages {start}-{end})"
-            self.add_option(
-                label=f"{category.name} {pages_string}",
-                emoji=category.emote,
-                description=category.description,
-                value=str(start - 1),  # we added 1 in total=1
-            )
-
     @override
     async def callback(self, interaction: discord.Interaction[AluBot]) -> None:
         page_to_open = int(self.values[0])
@@ -194,6 +221,9 @@ class HelpSelect(discord.ui.Select[HelpPages]):
 class AluHelp(commands.HelpCommand):
     context: AluContext
 
+    corpora: ClassVar[dict[bool, HelpCorpus]] = {}
+    """Compiled help corpora by `show_hidden` value. Cleared by `BaseHelpCog` on extension load/unload/reload/sync."""
+
     # todo: idk
     def __init__(self, show_hidden: bool = False) -> None:
         super().__init__(
@@ -205,6 +235,9 @@ class AluHelp(commands.HelpCommand):
                 "usage": "[command/section/category]",
             },
         )
+        self.mentions: dict[str, str] = {}
+        """Mapping of command qualified names to their app command mentions, filled during the corpus compiling."""
+        self.prefix: str = "$"
 
     async def unpack_commands(
         self,
@@ -233,12 +266,7 @@ class AluHelp(commands.HelpCommand):
     @override
     def get_command_signature(self, command: AluCommand) -> str:
         def signature() -> str:
-            app_command = self.context.bot.tree.get_app_command(command.qualified_name)
-            if app_command:
-                cmd_mention = app_command.mention
-            else:
-                prefix = getattr(self.context, "clean_prefix", "$")
-                cmd_mention = f"`{prefix}{command.qualified_name}`"
+            cmd_mention = self.mentions.get(command.qualified_name) or f"`{self.prefix}{command.qualified_name}`"
 
             sign = f" `{command.signature}`" if command.signature else ""
             return f"{cmd_mention}{sign}"
@@ -272,33 +300,37 @@ class AluHelp(commands.HelpCommand):
     @override
     def get_bot_mapping(self) -> dict[ExtCategory, dict[AluCog, list[AluCommand]]]:
         """Retrieves the bot mapping passed to `send_bot_help`."""
+        return self.build_bot_mapping(self.context.bot)
+
+    @staticmethod
+    def build_bot_mapping(bot: AluBot) -> dict[ExtCategory, dict[AluCog, list[AluCommand]]]:
+        """Build the mapping of categories to their cogs and cogs' commands."""
         # TODO: include solo slash commands and Context Menu commands.
-        categories = self.context.bot.category_cogs
+        categories = bot.category_cogs
 
         return {category: {cog: cog.get_commands() for cog in cog_list} for category, cog_list in categories.items()}
         # todo: think how to sort front page to front
 
-    async def send_help_menu(
-        self,
-        mapping: dict[ExtCategory, dict[AluCog, list[AluCommand]]],
-        *,
-        requested_cog: AluCog | None = None,
-    ) -> None:
-        await self.context.typing()
+    async def compile_corpus(self, bot: AluBot) -> HelpCorpus:
+        """Compile the help corpus: walk the commands, fetch their mentions and build all the page embeds.
+
+        This is the only place where the help menu might need API calls (to fetch app commands for mentions).
+        """
+        self.prefix = bot.main_prefix
+        mapping = self.build_bot_mapping(bot)
 
         help_data: dict[ExtCategory, list[CogPage]] = {}
 
-        starting_page, page_counter = 0, 0  # used to get to the section page we might need from the cog command.
         for category, cog_cmd_dict in mapping.items():
             for cog, cmds in cog_cmd_dict.items():
-                if requested_cog == cog:
-                    starting_page = page_counter + 1
-
                 filtered = await self.filter_commands(cmds)  # , sort=True)
                 if filtered:
                     cmds_unpacked = list(
                         itertools.chain.from_iterable([await self.unpack_commands(c) for c in filtered]),
                     )
+                    for command in cmds_unpacked:
+                        if mention := await bot.tree.find_mention(command.qualified_name):
+                            self.mentions[command.qualified_name] = mention
                     amount_of_cmds = len(cmds_unpacked)
                     chunk_size = 7
                     cmds10 = [cmds_unpacked[i : i + chunk_size] for i in range(0, amount_of_cmds, chunk_size)]
@@ -313,7 +345,6 @@ class AluHelp(commands.HelpCommand):
                             category=category,
                         )
                         help_data.setdefault(category, []).append(page)
-                        page_counter += 1
 
         for category, cog_pages in help_data.items():
             cog_len = len(cog_pages)
@@ -328,7 +359,26 @@ class AluHelp(commands.HelpCommand):
 
         help_data = {index_category: index_pages} | help_data
 
-        pages = HelpPages(self.context, self, help_data)
+        # used to get to the section page we might need from the cog command.
+        section_pages: dict[str, int] = {}
+        for page_number, page in enumerate(itertools.chain.from_iterable(help_data.values())):
+            if isinstance(page.section, commands.Cog):
+                section_pages.setdefault(page.section.qualified_name, page_number)
+            page.embed = HelpPageSource.build_embed(bot, self, page)
+        return HelpCorpus(help_data, section_pages)
+
+    async def get_corpus(self) -> HelpCorpus:
+        """Get the compiled help corpus, compiling it if it's missing (i.e. it was just invalidated)."""
+        try:
+            return self.corpora[self.show_hidden]
+        except KeyError:
+            corpus = self.corpora[self.show_hidden] = await self.compile_corpus(self.context.bot)
+            return corpus
+
+    async def send_help_menu(self, *, requested_cog: AluCog | None = None) -> None:
+        corpus = await self.get_corpus()
+        starting_page = corpus.section_pages.get(requested_cog.qualified_name, 0) if requested_cog else 0
+        pages = HelpPages(self.context, corpus)
         await pages.start(page_number=starting_page)
 
     @override
@@ -336,12 +386,11 @@ class AluHelp(commands.HelpCommand):
         self,
         mapping: dict[ExtCategory, dict[AluCog, list[AluCommand]]],
     ) -> None:
-        await self.send_help_menu(mapping)
+        await self.send_help_menu()
 
     @override
     async def send_cog_help(self, cog: AluCog) -> None:
-        mapping = self.get_bot_mapping()
-        await self.send_help_menu(mapping, requested_cog=cog)
+        await self.send_help_menu(requested_cog=cog)
 
     @override
     async def send_command_help(self, command: AluCommand) -> None:
@@ -370,12 +419,36 @@ class BaseHelpCog(AluCog):
     @override
     async def cog_load(self) -> None:
         self.load_help_info.start()
+        await self.invalidate_help_corpus()
 
     @override
     async def cog_unload(self) -> None:
         self.load_help_info.cancel()
+        self.compile_help_corpus.cancel()
+        AluHelp.corpora.clear()
         self.bot.help_command = self._original_help_command
 
+    @commands.Cog.listener("on_cogs_changed")
+    @commands.Cog.listener("on_app_commands_synced")
+    async def invalidate_help_corpus(self) -> None:
+        """Drop the compiled help corpus and schedule its recompiling.
+
+        Called when extensions are loaded/unloaded/reloaded (cogs are added/removed) or app commands are synced.
+        """
+        AluHelp.corpora.clear()
+        if self.compile_help_corpus.is_running():
+            self.compile_help_corpus.restart()
+        else:
+            self.compile_help_corpus.start()
+
+    @aluloop(count=1)
+    async def compile_help_corpus(self) -> None:
+        """Compile the help corpus ahead of time so `/help` is just a lookup."""
+        # debounce: loading/reloading extensions in bulk adds/removes cogs one by one
+        await asyncio.sleep(CORPUS_REBUILD_DELAY)
+        AluHelp.corpora[False] = await AluHelp().compile_corpus(self.bot)
+        log.debug("Compiled the help corpus.")
+
     @aluloop(count=1)
     async def load_help_info(self) -> None:
         # auto-syncing is bad, but is auto-fetching commands bad to fill the cache?
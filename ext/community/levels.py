@@ -21,7 +21,6 @@ if TYPE_CHECKING:
     class RemoveLongGoneRow(TypedDict):
         id: int
         name: str
-        last_seen: datetime.datetime
 
     class LeaderboardQueryRow(TypedDict):
         id: int
@@ -30,6 +29,7 @@ if TYPE_CHECKING:
 
 
 LAST_SEEN_TIMEOUT = 60
+REMOVE_LONG_GONE_BATCH_SIZE = 500
 
 # fmt: off
 exp_lvl_table = [
@@ -328,21 +328,47 @@ class ExperienceSystem(CommunityCog, name="Profile", emote=const.Emote.bubuAYAYA
             # let's do this task on Thursdays only, why not xd.
             return
 
-        query = "SELECT id, last_seen, name FROM community_members"
-        rows: list[RemoveLongGoneRow] = await self.bot.pool.fetch(query)
+        # keep anybody who is still in the server no matter how long they've been silent
+        present_ids = [member.id for member in self.community.guild.members]
+        cutoff = discord.utils.utcnow() - datetime.timedelta(days=365)
 
-        for row in rows:
-            guild = self.community.guild
-            person = guild.get_member(row["id"])
-            if person is None and discord.utils.utcnow() - row["last_seen"] > datetime.timedelta(days=365):
-                query = "DELETE FROM community_members WHERE id=$1"
-                await self.bot.pool.execute(query, row["id"])
+        # one set-based statement per batch (driven by `community_members_last_seen_idx`)
+        # so locks are short no matter how many members left;
+        # rows keyed by the removed members (`userid`) in the other community tables are pruned in the same statement.
+        # note: `afknotes` is not pruned - its `id` is just an integer row id, there is no member column there.
+        query = """
+            WITH gone AS (
+                DELETE FROM community_members
+                WHERE id IN (
+                    SELECT id FROM community_members
+                    WHERE last_seen < $1 AND NOT (id = ANY($2::bigint[]))
+                    ORDER BY last_seen
+                    LIMIT $3
+                )
+                RETURNING id, name
+            ),
+            pruned_warnings AS (DELETE FROM warnings WHERE userid IN (SELECT id FROM gone)),
+            pruned_mutes AS (DELETE FROM mutes WHERE userid IN (SELECT id FROM gone))
+            SELECT id, name FROM gone;
+        """
+        while True:
+            rows: list[RemoveLongGoneRow] = await self.bot.pool.fetch(
+                query, cutoff, present_ids, REMOVE_LONG_GONE_BATCH_SIZE
+            )
+            if not rows:
+                break
+
+            lines = [f"`{row['id']}` {row['name']}" for row in rows]
+            for chunk in discord.utils.as_chunks(lines, 50):
                 embed = discord.Embed(
                     color=0xE6D690,
-                    description=f"id = {row['id']}",
-                ).set_author(name=f"{row['name']} was removed from the database")
+                    description="\n".join(chunk),
+                ).set_author(name=f"{len(chunk)} long gone members were removed from the database")
                 await self.community.logs.send(embed=embed)
 
+            if len(rows) < REMOVE_LONG_GONE_BATCH_SIZE:
+                break
+
 
 async def setup(bot: AluBot) -> None:
     """Load AluBot extension. Framework of discord.py."""
@@ -5,15 +5,15 @@ import datetime
 import platform
 from typing import TYPE_CHECKING, override
 
+import discord
 from discord.ext import commands
 
 from bot import aluloop
+from utils import const
 
 from ._base import CommunityCog
 
 if TYPE_CHECKING:
-    import discord
-
     from bot import AluBot
 
 
@@ -29,47 +29,80 @@ class StatsVoiceChannels(CommunityCog):
     async def cog_load(self) -> None:
         self.my_time.start()
 
-        self._lock: asyncio.Lock = asyncio.Lock()
         self.cooldown: datetime.timedelta = datetime.timedelta(seconds=3600)
-        self._most_recent: datetime.datetime | None = None
+        # member join/leave events only flag the counters as dirty,
+        # a single worker then writes the latest numbers at most once per `cooldown`.
+        self._people_dirty: bool = False
+        self._bots_dirty: bool = False
+        self._dirty_event: asyncio.Event = asyncio.Event()
+        self.member_stats_worker.start()
 
     @override
     async def cog_unload(self) -> None:
         self.my_time.stop()
+        self.member_stats_worker.cancel()
 
     @aluloop(time=[datetime.time(hour=x) for x in range(24)])  # 24 times a day
     async def my_time(self) -> None:
         """Update channel name to show Irene's Current Time."""
         symbol = "#" if platform.system() == "Windows" else "-"
         msk_now = datetime.datetime.now(datetime.timezone(datetime.timedelta(hours=3)))
-        new_name = f'\N{ALARM CLOCK} {msk_now.strftime(f"%{symbol}I %p")}, MSK, Aluerie time'
+        new_name = f"\N{ALARM CLOCK} {msk_now.strftime(f'%{symbol}I %p')}, MSK, Aluerie time"
         await self.bot.community.my_time.edit(name=new_name)
 
     @commands.Cog.listener("on_member_join")
     @commands.Cog.listener("on_member_remove")
     async def refresh_member_stats(self, member: discord.Member) -> None:
-        """Update channel name to show Total People/Bots numbers in the community."""
-        async with self._lock:
-            if self._most_recent and (delta := datetime.datetime.now(datetime.UTC) - self._most_recent) < self.cooldown:
-                # We have to wait
-                total_seconds = delta.total_seconds()
-                await asyncio.sleep(total_seconds)
-
-            self._most_recent = datetime.datetime.now(datetime.UTC)
-
-            # Actually edit the channel name;
-
-            # TODO: this is bad because we aren't clearing previous new member states;
-            amount_of_bots = len(self.bot.community.bots_role.members)
-            # TODO: if it's 0 we should just return or post pone
-            amount_of_people = (self.bot.community.guild.member_count or 0) - amount_of_bots
-
-            if member.bot:
-                # total bots
-                await self.bot.community.total_bots.edit(name=f"\N{ROBOT FACE} Bots: {amount_of_bots}")
-            else:
-                # total people
-                await self.bot.community.total_people.edit(name=f"\N{HOUSE WITH GARDEN} People: {amount_of_people}")
+        """Mark Total People/Bots numbers in the community as outdated."""
+        if member.guild.id != const.Guild.community:
+            return
+
+        if member.bot:
+            self._bots_dirty = True
+        else:
+            self._people_dirty = True
+        self._dirty_event.set()
+
+    @aluloop(seconds=0.0)
+    async def member_stats_worker(self) -> None:
+        """Update channel names to show Total People/Bots numbers in the community.
+
+        Join storms are coalesced: whatever happened during the cooldown is written as one edit with the latest numbers.
+        """
+        await self._dirty_event.wait()
+        self._dirty_event.clear()
+
+        # each flag is cleared right before reading the counts, so events that land
+        # while the edit is in flight set it again and are picked up by the next pass
+        bots_dirty, self._bots_dirty = self._bots_dirty, False
+        people_dirty, self._people_dirty = self._people_dirty, False
+        try:
+            if bots_dirty:
+                amount_of_bots = len(self.bot.community.bots_role.members)
+                new_name = f"\N{ROBOT FACE} Bots: {amount_of_bots}"
+                if self.bot.community.total_bots.name != new_name:
+                    await self.bot.community.total_bots.edit(name=new_name)
+                bots_dirty = False
+            if people_dirty:
+                amount_of_bots = len(self.bot.community.bots_role.members)
+                amount_of_people = (self.bot.community.guild.member_count or 0) - amount_of_bots
+                new_name = f"\N{HOUSE WITH GARDEN} People: {amount_of_people}"
+                if self.bot.community.total_people.name != new_name:
+                    await self.bot.community.total_people.edit(name=new_name)
+                people_dirty = False
+        except discord.HTTPException as exc:
+            # flags of the failed counters are set again so the next pass (after the cooldown) retries
+            self._bots_dirty |= bots_dirty
+            self._people_dirty |= people_dirty
+            self._dirty_event.set()
+            embed = discord.Embed(
+                color=const.Color.error,
+                description="Failed to update Total People/Bots channel names in the community.",
+            ).set_footer(text="StatsVoiceChannels.member_stats_worker")
+            await self.bot.exc_manager.register_error(exc, embed)
+
+        # channel names are heavily rate-limited
+        await asyncio.sleep(self.cooldown.total_seconds())
 
 
 async def setup(bot: AluBot) -> None:
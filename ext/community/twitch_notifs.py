@@ -149,13 +149,13 @@ class TwitchCog(CommunityCog):
             self.edit_offline_screen.cancel()
             return
 
-        irene = await self.bot.twitch.irene.user()
-        channel_info = await irene.fetch_channel_info()
+        # user and current VOD come from the stream status cache which is refreshed by eventsub online event
+        irene = await self.bot.twitch.fetch_streamer(const.TwitchID.Me)
+        channel_info = await self.bot.twitch.irene.fetch_channel_info()
         game = await channel_info.fetch_game()
 
-        stream_url = f"https://twitch.tv/{irene.name}"
-        current_vod = next(iter(await self.bot.twitch.fetch_videos(user_id=irene.id, period="day")), None)
-        current_vod_link = f"/[VOD]({current_vod.url})" if current_vod else ""
+        stream_url = irene.url
+        current_vod_link = f"/[VOD]({irene.vod.url})" if irene.vod else ""
 
         # send notification
 
@@ -169,10 +169,10 @@ class TwitchCog(CommunityCog):
             )
             .set_author(
                 name=f"{irene.display_name} just went live on Twitch!",
-                icon_url=irene.profile_image,
+                icon_url=irene.avatar_url,
                 url=stream_url,
             )
-            .set_thumbnail(url=game.box_art if game else irene.profile_image)
+            .set_thumbnail(url=game.box_art if game else irene.avatar_url)
             .set_image(
                 url=(
                     f"https://static-cdn.jtvnw.net/previews-ttv/live_user_{irene.display_name}-1280x720.jpg"
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, TypedDict
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING, NamedTuple, TypedDict, override
 
 import discord
 from discord.ext import commands
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
 
+from bot import aluloop
 from utils import const
 
 from ._base import CommunityCog
@@ -19,12 +23,65 @@ if TYPE_CHECKING:
         embed: discord.Embed
         file: discord.File
 
-    class WelcomeMemberRow(TypedDict):
-        roles: list[int]
-        name: str
+    class UpsertMembersRow(TypedDict):
+        id: int
+        roles: list[int] | None
+        name: str | None
+        inserted: bool
+
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class RoleRestoration(NamedTuple):
+    member: discord.Member
+    roles: list[discord.Role]
+    nick: str | None
 
 
 class Welcome(CommunityCog):
+    """Welcome new members to the community.
+
+    Joins are processed in batches by a background worker so a raid doesn't clog gateway event processing:
+    * database rows are upserted with one statement per batch;
+    * during a join surge individual welcome images are replaced with one aggregated message;
+    * roles are restored by a separate worker one member at a time so it doesn't fight the rate-limits.
+    """
+
+    JOIN_BATCH_WINDOW: float = 2.0
+    """Seconds to wait for more joins before processing a batch."""
+    SURGE_WINDOW: float = 60.0
+    """Seconds to look back at when detecting a join surge."""
+    SURGE_THRESHOLD: int = 10
+    """Amount of joins within `SURGE_WINDOW` that switches welcoming into surge mode."""
+    ROLE_RESTORATION_PAUSE: float = 0.25
+    """Seconds to pause between member edits while role restoration has a backlog."""
+
+    def __init__(self, bot: AluBot) -> None:
+        super().__init__(bot)
+        self._join_queue: asyncio.Queue[discord.Member] = asyncio.Queue()
+        self._role_queue: asyncio.Queue[RoleRestoration] = asyncio.Queue()
+        self._recent_joins: deque[float] = deque()
+
+    @override
+    async def cog_load(self) -> None:
+        self.join_worker.start()
+        self.role_restoration_worker.start()
+
+    @override
+    async def cog_unload(self) -> None:
+        self.join_worker.cancel()
+        self.role_restoration_worker.cancel()
+
+    @property
+    def surge(self) -> bool:
+        """Whether the community is currently experiencing a join surge (i.e. a raid)."""
+        cutoff = time.monotonic() - self.SURGE_WINDOW
+        while self._recent_joins and self._recent_joins[0] < cutoff:
+            self._recent_joins.popleft()
+        return len(self._recent_joins) >= self.SURGE_THRESHOLD
+
     async def welcome_image(self, member: discord.User | discord.Member) -> Image.Image:
         avatar_asset = await self.bot.transposer.url_to_image(member.display_avatar.url)
 
@@ -94,47 +151,136 @@ class Welcome(CommunityCog):
     async def welcome_new_member(self, member: discord.Member) -> None:
         """Welcome new member.
 
-        This listener also gives back to old returning members their roles and old nickname if any.
+        The actual work is done in `join_worker`. This also gives back to old returning members
+        their roles and old nickname if any.
         """
         if member.guild.id != const.Guild.community:
             return
 
-        back = False
-        if member.bot:
-            await member.add_roles(self.bot.community.bots_role)
-        else:
-            # human person
+        self._recent_joins.append(time.monotonic())
+        self._join_queue.put_nowait(member)
+
+    async def upsert_members(self, members: list[discord.Member]) -> dict[int, UpsertMembersRow]:
+        """Upsert human members into `community_members` with a single statement."""
+        # note: roles are kept updated by listener in this cog
+        # note: nickname (name) is updated by a listener in community logger cog
+        query = """
+            INSERT INTO community_members (id, name)
+            SELECT * FROM unnest($1::bigint[], $2::text[])
+            ON CONFLICT (id) DO UPDATE
+                SET last_seen = (now() at time zone 'utc')
+            RETURNING id, roles, name, (xmax = 0) AS inserted;
+        """  # ^^^ `xmax = 0` is only true for freshly inserted rows https://stackoverflow.com/a/39204667
+        rows: list[UpsertMembersRow] = await self.bot.pool.fetch(
+            query, [member.id for member in members], [member.name for member in members]
+        )
+        return {row["id"]: row for row in rows}
+
+    @aluloop(seconds=0.0)
+    async def join_worker(self) -> None:
+        """Process a batch of joined members."""
+        members = [await self._join_queue.get()]
+        # let the burst accumulate
+        await asyncio.sleep(self.JOIN_BATCH_WINDOW)
+        while not self._join_queue.empty():
+            members.append(self._join_queue.get_nowait())
+        # the same person can rejoin within the window; keep the latest member object
+        members = list({member.id: member for member in members}.values())
+
+        # never let one failed batch stop the worker: the queue would keep growing with nobody to process it
+        try:
+            await self.process_join_batch(members)
+        except Exception as exc:  # noqa: BLE001
+            await self.report_error(exc, f"Failed to process a batch of {len(members)} joined members.")
+
+    async def process_join_batch(self, members: list[discord.Member]) -> None:
+        """Upsert joined members, queue their role restoration and welcome them."""
+        humans = [member for member in members if not member.bot]
+        rows = await self.upsert_members(humans) if humans else {}
+
+        returning_ids: set[int] = set()
+        for member in members:
+            if member.bot:
+                self._role_queue.put_nowait(RoleRestoration(member, [self.bot.community.bots_role], None))
+                continue
 
+            # human person
             # 1. add category roles
-            category_roles = (role for role_id in const.CATEGORY_ROLES if (role := member.guild.get_role(role_id)))
-            await member.add_roles(*category_roles)
-
+            roles = [role for role_id in const.CATEGORY_ROLES if (role := member.guild.get_role(role_id))]
             # 2. if it's returning person - give them their old roles, else give level 0 role
-            # note: roles are kept updated by listener in this cog
-            # note: nickname (name) is updated by a listener in community logger cog
-            query = """
-                INSERT INTO community_members (id, name)
-                VALUES ($1, $2)
-                ON CONFLICT (id) DO UPDATE
-                    SET last_seen = (now() at time zone 'utc')
-                RETURNING roles, name;
-            """  # ^^^ https://stackoverflow.com/a/37543015/19217368
-            # None if new person, record-dict otherwise
-            new_row: WelcomeMemberRow | None = await self.bot.pool.fetchval(query, member.id, member.name)
-
-            if bool(new_row):
-                # returning person
-                # autorole give back roles
-                autorole_roles = (role for role_id in new_row["roles"] if (role := member.guild.get_role(role_id)))
-                await member.add_roles(*autorole_roles)
-                # give back their nickname
-                await member.edit(nick=new_row["name"])
-            # new person
+            row = rows.get(member.id)
+            nick = None
+            if row and not row["inserted"]:
+                returning_ids.add(member.id)
+                roles.extend(role for role_id in row["roles"] or [] if (role := member.guild.get_role(role_id)))
+                nick = row["name"]
             elif role := member.guild.get_role(const.Role.level_zero):
-                await member.add_roles(role)
+                roles.append(role)
+            self._role_queue.put_nowait(RoleRestoration(member, roles, nick))
+
+        if self.surge:
+            log.info("Join surge: welcoming %s members with one aggregated message.", len(members))
+            for embed in self.surge_welcome_embeds(members):
+                try:
+                    await self.bot.community.welcome.send(embed=embed)
+                except discord.HTTPException as exc:
+                    await self.report_error(exc, f"Failed to send a surge welcome message for {len(members)} members.")
+        else:
+            for member in members:
+                try:
+                    send_kwargs = await self.get_send_welcome_kwargs(member, back=member.id in returning_ids)
+                    await self.bot.community.welcome.send(**send_kwargs)
+                except Exception as exc:  # noqa: BLE001
+                    await self.report_error(exc, f"Failed to send a welcome message for {member} (`{member.id}`).")
+
+    async def report_error(self, error: Exception, description: str) -> None:
+        """Report an error from the join processing to developers without stopping the worker."""
+        embed = discord.Embed(color=const.Color.error, description=description).set_footer(text="Welcome.join_worker")
+        await self.bot.exc_manager.register_error(error, embed)
+
+    @staticmethod
+    def surge_welcome_embeds(members: list[discord.Member]) -> list[discord.Embed]:
+        """Embeds welcoming many members at once."""
+        header = f"**💜 Welcome to Aluerie's server, {len(members)} new members!** {const.Emote.DankHey}\n"
+        embeds: list[discord.Embed] = []
+        description = header
+        for member in members:
+            line = f"{member.mention} "
+            if len(description) + len(line) > const.Limit.Embed.description:
+                embeds.append(discord.Embed(color=const.Color.prpl, description=description))
+                description = ""
+            description += line
+        embeds.append(discord.Embed(color=const.Color.prpl, description=description))
+        return embeds
+
+    @aluloop(seconds=0.0)
+    async def role_restoration_worker(self) -> None:
+        """Give roles (and old nicknames) to joined members one by one.
+
+        Roles are added on top of whatever the member has by now (other bots/mods might have granted some
+        while the restoration was queued) and the nickname is edited separately.
+        The edits are sequential, so a raid results in a steady stream of requests
+        that discord.py can pace within the rate-limits.
+        """
+        restoration = await self._role_queue.get()
+        member = restoration.member.guild.get_member(restoration.member.id)
+        if member is None:
+            # already left (or got banned during the raid)
+            return
 
-        send_kwargs = await self.get_send_welcome_kwargs(member, back=back)
-        await self.bot.community.welcome.send(**send_kwargs)
+        roles = [role for role in restoration.roles if role not in member.roles]
+        try:
+            if roles:
+                await member.add_roles(*roles)
+            if restoration.nick:
+                await member.edit(nick=restoration.nick)
+        except discord.NotFound:
+            pass
+        except discord.HTTPException as exc:
+            log.warning("Failed to restore roles for %s: %s", member, exc)
+        if not self._role_queue.empty():
+            # be gentle with the shared member-edit bucket while there is a backlog
+            await asyncio.sleep(self.ROLE_RESTORATION_PAUSE)
 
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member) -> None:
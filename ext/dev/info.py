@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import importlib
 import importlib.metadata
+import io
 import logging
 import platform
 import socket
@@ -14,7 +15,8 @@ import discord
 import psutil
 from discord import app_commands
 
-from utils import const
+from bot import StatsPool, get_debug_buffer
+from utils import const, errors
 
 from ._base import DevBaseCog
 
@@ -124,6 +126,19 @@ class DevInformation(DevBaseCog):
         await interaction.response.defer()
         await interaction.followup.send(file=discord.File(".temp/alubot.log"))
 
+    @system_group.command(name="debug-logs")
+    async def system_debug_logs(self, interaction: discord.Interaction[AluBot]) -> None:
+        """🔬 (#Hideout) Dump bot's in-memory buffer of the latest debug logs."""
+        debug_buffer = get_debug_buffer()
+        if debug_buffer is None:
+            msg = "Debug ring buffer is not enabled. Start the bot with `--debug-buffer` option."
+            raise errors.ErroneousUsage(msg)
+
+        await interaction.response.defer()
+        dump = await asyncio.to_thread(debug_buffer.dump)
+        file = discord.File(io.BytesIO(dump.encode("utf-8")), filename="debug.log")
+        await interaction.followup.send(file=file)
+
     @system_group.command(name="health")
     async def system_health(self, interaction: discord.Interaction[AluBot]) -> None:
         """🔬 (#Hideout) Get bot's health status."""
@@ -150,7 +165,16 @@ class DevInformation(DevBaseCog):
             f"Total `Pool.acquire` Waiters: {total_waiting}",
             f"Current Pool Generation: {current_generation}",
             f"Connections In Use: {len(pool._holders) - pool._queue.qsize()}",
+            f"Pool Size: {pool.get_size()} (idle: {pool.get_idle_size()})",
+            f"Pool Size Range: {pool.get_min_size()}..{pool.get_max_size()}",
         ]
+        if isinstance(pool, StatsPool):
+            stats_value = (
+                f"acquire: {pool.stats.acquire.summary()}\n"
+                f"queries: {pool.stats.queries.summary()}\n"
+                f"slow: {pool.stats.slow_queries} failed: {pool.stats.failed_queries}"
+            )
+            embed.add_field(name="Pool Stats", value=f"```py\n{stats_value}\n```", inline=False)
 
         questionable_connections = 0
         connection_value = []
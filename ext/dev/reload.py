@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import ast
 import asyncio
-import contextlib
+import graphlib
+import hashlib
 import importlib
+import importlib.util
 import re
 import subprocess
 import sys
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Annotated, override
+from typing import TYPE_CHECKING, Annotated, Literal, override
 
 import discord
 from discord.ext import commands
@@ -18,7 +22,7 @@ from utils import const, fmt
 from ._base import DevBaseCog
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Iterable
 
     from bot import AluBot, AluContext
 
@@ -36,7 +40,191 @@ class ExtensionConverter(commands.Converter[str]):
         return f"ext.{m}"
 
 
+class ExtensionGraph:
+    """Import graph of the bot's own modules (`ext`, `core`, `utils` and `bot`) used to plan extension reloads.
+
+    * Extension's own modules (the extension itself and its submodules) are re-imported by discord.py.
+    * Shared utility modules, i.e. `ext.community._base` or `ext.fpc.base_classes`, are not.
+        So we re-import those ourselves - once and in dependency order - before reloading extensions depending on them.
+    * Hashes of modules' source code are compared against the ones from the last (re)load,
+        so extensions without any changes in their import closure can be skipped.
+    * `bot.*` modules define the running bot instance and its managers, so they are never re-imported.
+        Changes there are only reported since they need a restart.
+
+    Note that building the graph reads and parses files so it's better to be done in a thread.
+    """
+
+    PROJECT_PREFIXES: tuple[str, ...] = ("ext.", "core.", "utils.", "bot.")
+    RESTART_PREFIXES: tuple[str, ...] = ("bot.",)
+    """Project modules that are tracked but can't be hot-reloaded."""
+
+    def __init__(self, extensions: Iterable[str]) -> None:
+        self.extensions: set[str] = set(extensions)
+        self.imports: dict[str, set[str]] = {}
+        """Mapping of a project module to the project modules it imports."""
+        self.hashes: dict[str, str] = {}
+        """Mapping of a project module to the hash of its source code."""
+        self.closures: dict[str, set[str]] = {ext: self._walk(ext) for ext in self.extensions}
+        """Mapping of an extension to all project modules it (transitively) imports, including itself."""
+
+    @staticmethod
+    def module_path(name: str) -> Path | None:
+        """Get path to the source file of a module by its name."""
+        base = Path(*name.split("."))
+        if (package := base / "__init__.py").is_file():
+            return package
+        if (module := base.with_suffix(".py")).is_file():
+            return module
+        return None
+
+    def _parse(self, name: str) -> set[str]:
+        if name in self.imports:
+            return self.imports[name]
+
+        path = self.module_path(name)
+        if path is None:
+            self.imports[name] = set()
+            return self.imports[name]
+
+        source = path.read_bytes()
+        self.hashes[name] = hashlib.sha256(source).hexdigest()
+
+        package = name if path.name == "__init__.py" else name.rpartition(".")[0]
+        found: set[str] = set()
+        for node in ast.walk(ast.parse(source)):
+            if isinstance(node, ast.Import):
+                found.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                base = (
+                    importlib.util.resolve_name("." * node.level + (node.module or ""), package)
+                    if node.level
+                    else node.module or ""
+                )
+                found.add(base)
+                # `from . import module` imports modules too
+                found.update(f"{base}.{alias.name}" for alias in node.names)
+
+        self.imports[name] = {
+            module
+            for module in found
+            if module != name and f"{module}.".startswith(self.PROJECT_PREFIXES) and self.module_path(module)
+        }
+        return self.imports[name]
+
+    def _walk(self, extension: str) -> set[str]:
+        closure: set[str] = set()
+        stack = [extension]
+        while stack:
+            module = stack.pop()
+            if module in closure:
+                continue
+            closure.add(module)
+            # other extensions are reloaded on their own
+            stack.extend(m for m in self._parse(module) if m not in self.extensions)
+        return closure
+
+    def is_own(self, extension: str, module: str) -> bool:
+        """Whether the module is re-imported by discord.py together with the extension."""
+        return module == extension or module.startswith(f"{extension}.")
+
+    def is_restart_only(self, module: str) -> bool:
+        """Whether the module is tracked but can't be hot-reloaded."""
+        return f"{module}.".startswith(self.RESTART_PREFIXES)
+
+    def owner(self, module: str) -> str | None:
+        """Get the extension that the module belongs to."""
+        return next((ext for ext in self.extensions if self.is_own(ext, module)), None)
+
+    def extension_order(self, extensions: Iterable[str]) -> list[str]:
+        """Sort extensions so the ones importing other extensions go after them."""
+        selected = set(extensions)
+        dependencies = {
+            ext: {
+                owner
+                for module in self.closures[ext]
+                for imported in self.imports.get(module, set())
+                if (owner := self.owner(imported)) in selected and owner != ext
+            }
+            for ext in selected
+        }
+        try:
+            return list(graphlib.TopologicalSorter(dependencies).static_order())
+        except graphlib.CycleError:
+            return sorted(selected)
+
+    def plan(
+        self, extensions: Iterable[str], known_hashes: dict[str, str], *, force: bool = False
+    ) -> tuple[list[str], list[str], list[str]]:
+        """Plan the reload.
+
+        Returns
+        -------
+        tuple[list[str], list[str], list[str]]
+            Shared modules to re-import (in order), extensions to reload (in order)
+            and changed modules that need a bot restart to take effect.
+        """
+        changed = {module for module, source_hash in self.hashes.items() if known_hashes.get(module) != source_hash}
+        not_reloadable = {module for module in changed if self.is_restart_only(module)}
+        changed -= not_reloadable
+        # modules missing from the snapshot are not known to have changed
+        needs_restart = sorted(module for module in not_reloadable if module in known_hashes)
+        to_reload = [ext for ext in extensions if force or ext not in known_hashes or self.closures[ext] & changed]
+
+        shared = {
+            module
+            for ext in to_reload
+            for module in self.closures[ext]
+            if not self.is_own(ext, module) and not self.is_restart_only(module) and module in sys.modules
+        }
+        # shared module needs re-importing if it or anything it imports changed
+        # so dependent modules do not hold references to outdated objects
+        to_reimport = {module for module in shared if force or self._walk_shared(module, shared) & changed}
+        sorter = graphlib.TopologicalSorter({module: self.imports[module] & to_reimport for module in to_reimport})
+        try:
+            order = list(sorter.static_order())
+        except graphlib.CycleError:
+            # deeper modules first, i.e. package's submodules before its `__init__`
+            order = sorted(to_reimport, key=lambda m: (-m.count("."), m))
+        return order, self.extension_order(to_reload), needs_restart
+
+    def _walk_shared(self, module: str, shared: set[str]) -> set[str]:
+        closure: set[str] = set()
+        stack = [module]
+        while stack:
+            current = stack.pop()
+            if current in closure:
+                continue
+            closure.add(current)
+            stack.extend(self.imports.get(current, set()) & shared)
+        return closure
+
+
 class ReloadCog(DevBaseCog):
+    """Load/Unload/Reload extensions.
+
+    `reload all` and `reload pull` plan the reload with `ExtensionGraph`:
+    only extensions with changes in their source (or in the shared modules they use) are reloaded,
+    shared modules are re-imported once and extensions are (un)loaded one by one in dependency order.
+    """
+
+    @override
+    async def cog_load(self) -> None:
+        if self.bot.is_ready():
+            # loaded manually later on, i.e. `$load dev.reload`, so `setup_hook` is long done
+            await self.take_source_snapshot()
+
+    @commands.Cog.listener("on_ready")
+    async def take_source_snapshot(self) -> None:
+        """Remember hashes of the source code that is currently loaded.
+
+        This is done once `setup_hook` finished loading all extensions, otherwise the snapshot
+        would only cover the extensions that happened to load before this cog.
+        Until the snapshot exists, `reload all` just reloads everything.
+        """
+        if not self.bot.module_source_hashes:
+            graph = await asyncio.to_thread(ExtensionGraph, self.bot.extensions)
+            self.bot.module_source_hashes.update(graph.hashes)
+
     @commands.command(name="extensions", hidden=True)
     async def extensions(self, ctx: AluContext) -> None:
         """Shows available extensions to load/reload/unload."""
@@ -96,41 +284,84 @@ class ReloadCog(DevBaseCog):
 
     # RELOAD ALL
 
-    async def reload_all_worker(self, ctx: AluContext) -> None:
+    async def reload_all_worker(self, ctx: AluContext, *, force: bool = False) -> None:
         extensions_to_reload = get_extensions(ctx.bot.test, reload=True)
         extensions_to_unload = [e for e in self.bot.extensions if e not in extensions_to_reload]
 
-        statuses: list[tuple[bool, str, str]] = []
+        graph = await asyncio.to_thread(ExtensionGraph, [*extensions_to_reload, *extensions_to_unload])
+        to_reimport, to_reload, needs_restart = graph.plan(
+            extensions_to_reload, self.bot.module_source_hashes, force=force
+        )
+        # nothing else we can do about those, so they are reported only once
+        self.bot.module_source_hashes.update(
+            (module, source_hash) for module, source_hash in graph.hashes.items() if graph.is_restart_only(module)
+        )
+
+        statuses: list[tuple[bool, str, str, float]] = []
         errors: list[tuple[str, str]] = []
 
+        async def report_error(exc: Exception, job: str, name: str) -> None:
+            embed = discord.Embed(
+                color=0x663322,
+                description=f"Job `{job}` for extension `{name}` failed.",
+            ).set_footer(text=f"reload_all_worker.do_the_job: {name}")
+            await self.bot.exc_manager.register_error(exc, embed)
+            # name, value
+            errors.append((f"{const.Tick.No} `{exc.__class__.__name__}`", f"{exc}"))
+
+        # shared modules: re-import once, in dependency order
+        for module in to_reimport:
+            start = time.perf_counter()
+            try:
+                importlib.reload(sys.modules[module])
+            except Exception as exc:  # noqa: BLE001
+                statuses.append((False, "\N{PACKAGE}", module, time.perf_counter() - start))
+                await report_error(exc, "importlib.reload", module)
+            else:
+                statuses.append((True, "\N{PACKAGE}", module, time.perf_counter() - start))
+                self.bot.module_source_hashes[module] = graph.hashes[module]
+
         async def do_the_job(ext: str, emote: str, method: Callable[[str], Awaitable[None]]) -> None:
+            start = time.perf_counter()
             try:
                 await method(ext)
-                statuses.append((True, emote, ext))
             except* commands.ExtensionError as eg:
-                statuses.append((False, emote, ext))
+                statuses.append((False, emote, ext, time.perf_counter() - start))
                 for exc in eg.exceptions:
-                    embed = discord.Embed(
-                        color=0x663322,
-                        description=f"Job `{method.__name__}` for extension `{ext}` failed.",
-                    ).set_footer(text=f"reload_all_worker.do_the_job: {ext}")
-                    await self.bot.exc_manager.register_error(exc, embed)
-                    # name, value
-                    errors.append((f"{const.Tick.No} `{exc.__class__.__name__}`", f"{exc}"))
-
-        for ext in extensions_to_reload:
-            emoji = "\N{ANTICLOCKWISE DOWNWARDS AND UPWARDS OPEN CIRCLE ARROWS}"
+                    await report_error(exc, method.__name__, ext)
+            else:
+                statuses.append((True, emote, ext, time.perf_counter() - start))
+                self.bot.module_source_hashes.update(
+                    (module, graph.hashes[module])
+                    for module in graph.closures.get(ext, ())
+                    if graph.is_own(ext, module) and module in graph.hashes
+                )
+
+        # one by one: extensions can import each other and discord.py (un)loading isn't meant to be interleaved;
+        # dependents are unloaded before their dependencies and reloaded after them
+        for ext in reversed(graph.extension_order(extensions_to_unload)):
+            await do_the_job(ext, "\N{OCTAGONAL SIGN}", self.bot.unload_extension)
+        emoji = "\N{ANTICLOCKWISE DOWNWARDS AND UPWARDS OPEN CIRCLE ARROWS}"
+        for ext in to_reload:
             await do_the_job(ext, emoji, self.reload_or_load_extension)
-        for ext in extensions_to_unload:
-            emoji = "\N{OCTAGONAL SIGN}"
-            await do_the_job(ext, emoji, self.bot.unload_extension)
+        # need to restart the timers in case new/old extensions add/remove timer listeners.
+        self.bot.timers.reschedule()
 
-        if errors:
-            content = "\n".join(
-                f"{fmt.tick(status)} - {emoji} `{ext if not ext.startswith('ext.') else ext[5:]}`"
-                for status, emoji, ext in statuses
+        skipped = len(extensions_to_reload) - len(to_reload)
+        lines = [
+            f"{fmt.tick(status)} - {emoji} `{name.removeprefix('ext.')}` {elapsed:.2f}s"
+            for status, emoji, name, elapsed in sorted(statuses, key=lambda s: s[3], reverse=True)
+        ]
+        summary = f"Reloaded `{len(to_reload)}` extensions, skipped `{skipped}` unchanged ones."
+        if needs_restart:
+            summary += f"\n{const.Tick.No} Restart is needed to apply changes in: " + ", ".join(
+                f"`{module}`" for module in needs_restart
             )
+        content = "\n".join([summary, *lines])
+        if len(content) > 2000:
+            content = content[:1997] + "..."
 
+        if errors:
             # let's format errors into embeds. It might backfire because of 25 fields restrictions.
             embed = discord.Embed(color=const.Color.error)
             for name, value in errors:
@@ -138,17 +369,12 @@ class ReloadCog(DevBaseCog):
 
             await ctx.reply(content=content, embed=embed)
         else:
-            # no errors thus let's not clutter my spam channel with output^
-            try:
-                await ctx.message.add_reaction(const.Tick.Yes)
-            except discord.HTTPException:
-                with contextlib.suppress(discord.HTTPException):
-                    await ctx.send(const.Tick.No)
+            await ctx.reply(content=content)
 
     @reload.command(name="all", hidden=True)
-    async def reload_all(self, ctx: AluContext) -> None:
-        """Reloads all modules."""
-        await self.reload_all_worker(ctx)
+    async def reload_all(self, ctx: AluContext, mode: Literal["force"] | None = None) -> None:
+        """Reloads all modules with changes. Use `$reload all force` to reload even unchanged ones."""
+        await self.reload_all_worker(ctx, force=mode == "force")
 
     @commands.command(name="t", hidden=True)
     async def reload_all_shortcut(self, ctx: AluContext) -> None:
@@ -214,29 +440,8 @@ class ReloadCog(DevBaseCog):
         if not await ctx.bot.disambiguator.confirm(ctx, embed=embed):
             return
 
-        statuses = []
-        for is_submodule, module in modules:
-            if is_submodule:
-                try:
-                    actual_module = sys.modules[module]
-                except KeyError:
-                    statuses.append((None, module))
-                else:
-                    try:
-                        importlib.reload(actual_module)
-                    except Exception:
-                        statuses.append((False, module))
-                    else:
-                        statuses.append((True, module))
-            else:
-                try:
-                    await self.reload_or_load_extension(module)
-                except commands.ExtensionError:
-                    statuses.append((False, module))
-                else:
-                    statuses.append((True, module))
-
-        await ctx.send("\n".join(f"{fmt.tick(status)}: `{module}`" for status, module in statuses))
+        # changed modules are detected by their source hashes, so the planner picks exactly what `git pull` changed
+        await self.reload_all_worker(ctx)
 
     @reload.command(name="pull", hidden=True)
     async def reload_pull(self, ctx: AluContext) -> None:
@@ -52,27 +52,26 @@ class SyncAppTreeTools(DevBaseCog):
         """
         # initial wait
         await asyncio.sleep(60.0 * 60 * 2)  # 2 hours
-        # global
-        await self.bot.tree.sync()
-        # premium guilds
-        for guild_id in const.PREMIUM_GUILDS:
-            await asyncio.sleep(30.0)
-            await self.bot.tree.sync(guild=discord.Object(id=guild_id))
-
-        log.info("Synced global and premium guild bound commands.")
+        # global and premium guilds; unchanged ones are skipped
+        scopes: list[discord.abc.Snowflake | None] = [None, *(discord.Object(id=id_) for id_ in const.PREMIUM_GUILDS)]
+        synced, skipped, failed = await self.bot.tree.sync_changed(scopes)
+        log.info(
+            "Synced %s global and premium guild bound commands: %s scopes unchanged, %s failed.",
+            len(synced),
+            skipped,
+            len(failed),
+        )
 
     async def sync_to_guild_list(self, guilds: list[discord.Object]) -> str:
-        """Syncs app tree for the guilds."""
-        successful_guild_syncs = 0
-        cmds = []
-        for guild in guilds:
-            try:
-                cmds += await self.bot.tree.sync(guild=guild)
-            except discord.HTTPException:
-                pass
-            else:
-                successful_guild_syncs += 1
-        return f"Synced {len(cmds)} guild-bound commands to `{successful_guild_syncs}/{len(guilds)}` guilds."
+        """Syncs app tree for the list of guilds.
+
+        This is the manual (owner) sync so it always syncs every guild in the list,
+        because the stored payload hashes can't tell whether Discord's side drifted.
+        Hash-skipping is left for `auto_sync`.
+        """
+        synced, skipped, failed = await self.bot.tree.sync_changed(guilds, force=True)
+        successful_guild_syncs = len(guilds) - skipped - len(failed)
+        return f"Synced {len(synced)} guild-bound commands to `{successful_guild_syncs}/{len(guilds)}` guilds."
 
     async def sync_command_worker(
         self, spec: str | None, current_guild: discord.Guild | None, guilds: list[discord.Object]
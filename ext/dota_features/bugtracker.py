@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
-import itertools
 import logging
 import re
 import textwrap
 from enum import Enum
+from http import HTTPStatus
 from operator import attrgetter
-from typing import TYPE_CHECKING, Any, override
+from typing import TYPE_CHECKING, Any, TypedDict, override
 
 import discord
 from discord.ext import commands
@@ -18,10 +19,15 @@ from bot import AluCog, aluloop
 from utils import const
 
 if TYPE_CHECKING:
-    from githubkit.rest import Issue, SimpleUser
+    from githubkit.rest import Issue, IssueComment, SimpleUser
 
     from bot import AluBot, AluContext
 
+    class BugTrackerCursorRow(TypedDict):
+        etag: str | None
+        last_event_id: int | None
+
+
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
@@ -283,8 +289,14 @@ class BugTracker(AluCog):
 
     Attributes
     ----------
-    valve_devs : list[str]
-        The list of known Valve developers who ever interacted with the Bug Tracker.
+    valve_devs : set[str]
+        The set of known Valve developers who ever interacted with the Bug Tracker.
+    etag : str | None
+        ETag of the "most recently updated issue" request. Any event, comment or new issue in the repository
+        bumps issue's `updated_at` so while it matches (HTTP 304) there is nothing new to look at.
+    last_event_id : int | None
+        ID of the newest issue event that was already processed. Issue events endpoint doesn't have `since`
+        parameter so we page through it until we reach this ID.
     bugtracker_news_worker : utils.bases.tasks.Loop
         The main task of the cog that tracks, analyzes GitHub events and sends news messages.
 
@@ -293,7 +305,12 @@ class BugTracker(AluCog):
     @override
     async def cog_load(self) -> None:
         self.bot.instantiate_github()
-        self.valve_devs: list[str] = await self.get_valve_devs()
+        self.valve_devs: set[str] = await self.get_valve_devs()
+
+        query = "SELECT etag, last_event_id FROM bugtracker_cursor WHERE repo = $1"
+        row: BugTrackerCursorRow | None = await self.bot.pool.fetchrow(query, GITHUB_REPO)
+        self.etag: str | None = row["etag"] if row else None
+        self.last_event_id: int | None = row["last_event_id"] if row else None
 
         self.bugtracker_news_worker.add_exception_type(RequestError, RequestFailed)
         self.bugtracker_news_worker.start()
@@ -307,11 +324,10 @@ class BugTracker(AluCog):
         """Dota 2 Bug tracker news channel."""
         return self.hideout.spam if self.bot.test else self.community.bugtracker_news
 
-    async def get_valve_devs(self) -> list[str]:
-        """Get the list of known Valve developers."""
+    async def get_valve_devs(self) -> set[str]:
+        """Get the set of known Valve developers."""
         query = "SELECT login FROM valve_devs"
-        valve_devs: list[str] = [i for (i,) in await self.bot.pool.fetch(query)]
-        return valve_devs
+        return {i for (i,) in await self.bot.pool.fetch(query)}
 
     @commands.is_owner()
     @commands.group(name="bugtracker", aliases=["valve"], hidden=True)
@@ -324,22 +340,12 @@ class BugTracker(AluCog):
         """Manually add a user login to the list of known Valve developers."""
         logins = [b for x in login.split(",") if (b := x.lstrip().rstrip())]
         query = """
-            INSERT INTO valve_devs (login) VALUES ($1)
+            INSERT INTO valve_devs (login) SELECT unnest($1::text[])
             ON CONFLICT DO NOTHING
-            RETURNING True;
+            RETURNING login;
         """
-
-        error_logins = []
-        success_logins = []
-        for name in logins:
-            # looks like executemany wont work bcs it executes strings letter by letter!
-            val = await self.bot.pool.fetchval(query, name)
-            if val:
-                # query above returned True
-                success_logins.append(name)
-            else:
-                # query above returned None
-                error_logins.append(name)
+        success_logins: list[str] = [i for (i,) in await self.bot.pool.fetch(query, logins)]
+        error_logins = [name for name in logins if name not in success_logins]
 
         def embed_answer(logins: list[str], color: int, description: str) -> discord.Embed:
             logins_join = ", ".join(f"`{name}`" for name in logins)
@@ -347,7 +353,7 @@ class BugTracker(AluCog):
 
         embeds: list[discord.Embed] = []
         if success_logins:
-            self.valve_devs.extend(success_logins)
+            self.valve_devs.update(success_logins)
             embeds.append(
                 embed_answer(success_logins, const.Palette.green(), "Added user(-s) to the list of Valve devs."),
             )
@@ -362,7 +368,7 @@ class BugTracker(AluCog):
         """Manually remove a user login from the list of known Valve developers."""
         query = "DELETE FROM valve_devs WHERE login=$1"
         await self.bot.pool.execute(query, login)
-        self.valve_devs.remove(login)
+        self.valve_devs.discard(login)
         embed = discord.Embed(
             color=const.Palette.orange(),
             description=f"Removed user `{login}` from the list of Valve devs.",
@@ -372,16 +378,48 @@ class BugTracker(AluCog):
     @bugtracker.command(name="list", aliases=["devs"])
     async def bugtracker_list(self, ctx: AluContext) -> None:
         """Show the list of known Valve developers."""
-        query = "SELECT login FROM valve_devs"
-        valve_devs: list[str] = [i for (i,) in await self.bot.pool.fetch(query)]
-        valve_devs.sort()
         embed = discord.Embed(
             color=const.Palette.blue(),
             title="List of known Valve devs",
-            description="\n".join([f"\N{BLACK CIRCLE} {i}" for i in valve_devs]),
+            description="\n".join([f"\N{BLACK CIRCLE} {i}" for i in sorted(self.valve_devs)]),
         )
         await ctx.reply(embed=embed)
 
+    async def anything_new(self) -> str | None:
+        """Check whether anything happened in the repository since the last check.
+
+        Returns
+        -------
+        str | None
+            New ETag if something happened, `None` if GitHub answered with `304 Not Modified`.
+            Conditional requests answered with 304 don't count against GitHub rate-limit.
+        """
+        response = await self.bot.github.rest.issues.async_list_for_repo(
+            owner="ValveSoftware",
+            repo="Dota2-Gameplay",
+            sort="updated",
+            direction="desc",
+            state="all",
+            per_page=1,
+            headers={"If-None-Match": self.etag} if self.etag and not self.bot.test else None,
+        )
+        etag = response.headers.get("ETag", "")
+        # githubkit's own http cache can revalidate the request itself and serve us 200 from the cache
+        if response.status_code == HTTPStatus.NOT_MODIFIED or (etag and etag == self.etag and not self.bot.test):
+            return None
+        return etag
+
+    async def save_cursor(self, etag: str, last_event_id: int | None) -> None:
+        """Persist the polling state so a restart backfills only the missed window."""
+        query = """
+            INSERT INTO bugtracker_cursor (repo, etag, last_event_id)
+            VALUES ($1, $2, $3)
+            ON CONFLICT (repo) DO UPDATE
+                SET etag = excluded.etag, last_event_id = excluded.last_event_id;
+        """
+        await self.bot.pool.execute(query, GITHUB_REPO, etag, last_event_id)
+        self.etag, self.last_event_id = etag, last_event_id
+
     @aluloop(minutes=10)
     async def bugtracker_news_worker(self) -> None:
         """Bugtracker News Task.
@@ -389,78 +427,90 @@ class BugTracker(AluCog):
         * tracks GitHub events/comments in the Dota 2 Bug Tracker Repository
         * analyzes them and build Timelines
         * sends messages to news channel if Valve developers activity was spotted.
+
+        An idle period costs one `304 Not Modified` response.
         """
         log.debug("^^^ BugTracker task started ^^^")
 
         query = "SELECT git_checked_dt FROM botinfo WHERE id=$1"
         dt: datetime.datetime = await self.bot.pool.fetchval(query, const.Guild.community)
         now = datetime.datetime.now(datetime.UTC)
+        last_event_id = self.last_event_id
 
         if self.bot.test:
             # FORCE TESTING
             dt = now - datetime.timedelta(hours=2)
+            last_event_id = None
+
+        etag = await self.anything_new()
+        if etag is None:
+            log.debug("^^^ BugTracker: nothing new ^^^")
+            query = "UPDATE botinfo SET git_checked_dt=$1 WHERE id=$2"
+            await self.bot.pool.execute(query, now, const.Guild.community)
+            return
 
         issue_dict: dict[int, TimeLine] = {}
+        new_valve_devs: set[str] = set()
+        newest_event_id = last_event_id
+        event_names = {x.name for x in EventType}
 
         # Closed / Self-assigned / Reopened Events
-        for page_number in itertools.count(start=1, step=1):
-            async for event in self.bot.github.paginate(
-                self.bot.github.rest.issues.async_list_events_for_repo,
-                owner="ValveSoftware",
-                repo="Dota2-Gameplay",
-                # it's sorted by updated time descending
-                # unfortunately, no "since" parameter.
-                # this is why we need to have this page_number workaround
-                page=page_number,
+        async for event in self.bot.github.paginate(
+            self.bot.github.rest.issues.async_list_events_for_repo,
+            owner="ValveSoftware",
+            repo="Dota2-Gameplay",
+            # it's sorted by id descending
+            # unfortunately, no "since" parameter, so we page until we reach the cursor
+            per_page=100,
+        ):
+            event_created_at = event.created_at.replace(tzinfo=datetime.UTC)
+            if (last_event_id is not None and event.id <= last_event_id) or (
+                last_event_id is None and event_created_at < dt
             ):
-                if not event.actor or not event.issue or not event.issue.user:
-                    # check if this is a valid issue event
-                    continue
-
-                event_created_at = event.created_at.replace(tzinfo=datetime.UTC)
-                log.debug(
-                    "Found event: %s %s %s %s ",
-                    event.event,
-                    event.issue.number,
-                    event.actor.login,
-                    event_created_at,
-                )
-                if event_created_at < dt:
-                    # we reached events that we are supposedly already checked
-                    break
-                if event_created_at > now:
-                    # these events got created after task start and before paginator
-                    # therefore we leave them untouched for the next batch
-                    continue
-                if event.event not in [x.name for x in list(EventType)]:
-                    continue
-
-                if (login := event.actor.login) in self.valve_devs:
-                    # it's confirmed that Valve dev is an actor of the event.
-                    pass
-                elif login != event.issue.user.login:
-                    # if actor is not OP of the issue then we can consider that this person is a valve dev
-                    self.valve_devs.append(login)
-                    query = """
-                        INSERT INTO valve_devs (login) VALUES ($1)
-                        ON CONFLICT DO NOTHING;
-                    """
-                    await self.bot.pool.execute(query, login)
-                else:
-                    # looks like non-dev event
-                    continue
-
-                issue_dict.setdefault(event.issue.number, TimeLine(issue=event.issue)).add_action(
-                    Event(
-                        enum_type=(getattr(EventType, event.event)).value,
-                        created_at=event.created_at,
-                        actor=event.actor,
-                        issue_number=event.issue.number,
-                    ),
-                )
+                # we reached events that we already checked
+                break
+            newest_event_id = max(newest_event_id or 0, event.id)
+
+            if not event.actor or not event.issue or not event.issue.user:
+                # check if this is a valid issue event
+                continue
+
+            log.debug(
+                "Found event: %s %s %s %s ",
+                event.event,
+                event.issue.number,
+                event.actor.login,
+                event_created_at,
+            )
+            if event.event not in event_names:
+                continue
+
+            if (login := event.actor.login) in self.valve_devs:
+                # it's confirmed that Valve dev is an actor of the event.
+                pass
+            elif login != event.issue.user.login:
+                # if actor is not OP of the issue then we can consider that this person is a valve dev
+                self.valve_devs.add(login)
+                new_valve_devs.add(login)
             else:
-                continue  # only executed if the inner loop did NOT break
-            break  # only executed if the inner loop DID break
+                # looks like non-dev event
+                continue
+
+            issue_dict.setdefault(event.issue.number, TimeLine(issue=event.issue)).add_action(
+                Event(
+                    enum_type=(getattr(EventType, event.event)).value,
+                    created_at=event.created_at,
+                    actor=event.actor,
+                    issue_number=event.issue.number,
+                ),
+            )
+
+        if new_valve_devs:
+            query = """
+                INSERT INTO valve_devs (login) SELECT unnest($1::text[])
+                ON CONFLICT DO NOTHING;
+            """
+            await self.bot.pool.execute(query, list(new_valve_devs))
 
         # Issues opened by Valve devs
         async for issue in self.bot.github.paginate(
@@ -486,6 +536,7 @@ class BugTracker(AluCog):
                 )
 
         # Comments left by Valve devs
+        comments: list[tuple[int, IssueComment]] = []
         async for comment in self.bot.github.paginate(
             self.bot.github.rest.issues.async_list_comments_for_repo,
             owner="ValveSoftware",
@@ -495,13 +546,19 @@ class BugTracker(AluCog):
         ):
             if not comment.user or comment.user.login not in self.valve_devs:
                 continue
-
             # comment doesn't have issue object attached directly so we need to manually grab it
             # just take numbers from url string ".../Dota2-Gameplay/issues/2524" with `.split`
-            issue_number = int(comment.issue_url.split("/")[-1])
+            comments.append((int(comment.issue_url.split("/")[-1]), comment))
+
+        # issues that are not in the dict yet are requested concurrently, each only once
+        missing_issue_numbers = list({number for number, _ in comments if number not in issue_dict})
+        missing_issues = await asyncio.gather(*(self.get_issue(number) for number in missing_issue_numbers))
+        for issue in missing_issues:
+            issue_dict[issue.number] = TimeLine(issue=issue)
 
-            # if the issue is not in the dict then we need to async_get it ourselves
-            issue_dict.setdefault(issue_number, TimeLine(issue=await self.get_issue(issue_number))).add_action(
+        for issue_number, comment in comments:
+            assert comment.user
+            issue_dict[issue_number].add_action(
                 Comment(
                     enum_type=CommentType.commented.value,
                     created_at=comment.created_at,
@@ -537,6 +594,9 @@ class BugTracker(AluCog):
 
         query = "UPDATE botinfo SET git_checked_dt=$1 WHERE id=$2"
         await self.bot.pool.execute(query, now, const.Guild.community)
+        if not self.bot.test:
+            # only move the cursor after everything is sent so a crash in-between gets retried
+            await self.save_cursor(etag, newest_event_id)
         log.debug("^^^ BugTracker task is finished ^^^")
 
     async def get_issue(self, issue_number: int) -> Issue:
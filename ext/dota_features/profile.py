@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, override
 
 import discord
@@ -44,7 +45,7 @@ class SteamDotaProfiles(AluCog):
         self, interaction: AluInteraction, user: app_commands.Transform[steam.User, SteamUserTransformer]
     ) -> None:
         """\N{RIGHT-POINTING MAGNIFYING GLASS} Show some basic info on a steam user."""
-        await interaction.response.defer()
+        _, apps = await asyncio.gather(interaction.response.defer(), user.apps())
 
         table = tabulate(
             tabular_data=[
@@ -62,7 +63,7 @@ class SteamDotaProfiles(AluCog):
             .add_field(name="Steam IDs", value=fmt.code(table), inline=False)
             .add_field(name="Currently playing:", value=f"{user.app or 'Nothing'}")
             # .add_field(name="Friends:", value=len(await user.friends()))
-            .add_field(name="Apps:", value=len(await user.apps()))
+            .add_field(name="Apps:", value=len(apps))
         )
         await interaction.followup.send(embed=embed)
 
@@ -70,16 +71,17 @@ class SteamDotaProfiles(AluCog):
     @app_commands.command(name="history")
     async def match_history(self, interaction: AluInteraction) -> None:
         """\N{RIGHT-POINTING MAGNIFYING GLASS} Show Aluerie's Dota 2 recent match history."""
-        await interaction.response.defer()
-
         player = interaction.client.dota.aluerie()
-        history = await player.match_history()
+        storage = interaction.client.dota.heroes
+        _, history, _ = await asyncio.gather(
+            interaction.response.defer(),
+            player.match_history(),
+            storage.get_cached_data(),  # warm up the cache meanwhile
+        )
+        heroes = await storage.by_ids(match.hero for match in history)
 
         description = "\n".join(
-            [
-                (f"{count}. {match.hero} {(await interaction.client.dota.heroes.by_id(match.hero)).emote} - {match.id}")
-                for count, match in enumerate(history)
-            ]
+            [f"{count}. {match.hero} {heroes[match.hero].emote} - {match.id}" for count, match in enumerate(history)]
         )
         embed = discord.Embed(description=description)
         await interaction.followup.send(embed=embed)
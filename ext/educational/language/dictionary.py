@@ -10,6 +10,7 @@ Source:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from typing import TYPE_CHECKING, Any, NamedTuple, Self, override
@@ -19,7 +20,7 @@ import yarl
 from discord import app_commands
 from lxml import html
 
-from utils import errors, pages
+from utils import cache, errors, pages
 
 from .._base import EducationalCog
 
@@ -252,38 +253,48 @@ async def parse_free_dictionary_for_word(session: ClientSession, *, word: str) -
     }
 
     async with session.get(url, headers=headers) as resp:
-        if resp.status != 200:
-            log.info("Got non-200 status code from free dictionary for word %r: %s", word, resp.status)
+        if resp.status == 404:
             return None
+        if resp.status != 200:
+            # raise so `ResponseCache` doesn't remember a rate limit or an outage as "no such word"
+            msg = f"Free Dictionary responded with status {resp.status} for the word `{word}`."
+            raise errors.ResponseNotOK(msg)
 
         text = await resp.text()
-        document = html.document_fromstring(text)
 
-        try:
-            definitions = document.get_element_by_id("Definition")
-        except KeyError:
-            log.info("Could not find definition element")
-            return None
+    # parsing html is CPU-heavy so it shouldn't block the event loop
+    return await asyncio.to_thread(parse_free_dictionary_document, text, word=word)
 
-        h1 = document.find("h1")
-        raw_word = h1.text if h1 is not None else word
 
-        section = definitions.xpath("section[@data-src='hm' or @data-src='hc_dict' or @data-src='rHouse']")
-        if not section:
-            log.info("Could not find section element")
-            return None
+def parse_free_dictionary_document(text: str, *, word: str) -> FreeDictionaryWord | None:
+    """Parse FreeDictionary html page for the word."""
+    document = html.document_fromstring(text)
 
-        node = section[0]
-        h2: Any | None = node.find("h2")
-        if h2 is None:
-            log.info("Could not find word element")
-            return None
+    try:
+        definitions = document.get_element_by_id("Definition")
+    except KeyError:
+        log.info("Could not find definition element")
+        return None
 
-        try:
-            return FreeDictionaryWord(raw_word, h2.text, node)
-        except RuntimeError:
-            log.exception("Error happened while parsing free dictionary")
-            return None
+    h1 = document.find("h1")
+    raw_word = h1.text if h1 is not None else word
+
+    section = definitions.xpath("section[@data-src='hm' or @data-src='hc_dict' or @data-src='rHouse']")
+    if not section:
+        log.info("Could not find section element")
+        return None
+
+    node = section[0]
+    h2: Any | None = node.find("h2")
+    if h2 is None:
+        log.info("Could not find word element")
+        return None
+
+    try:
+        return FreeDictionaryWord(raw_word, h2.text, node)
+    except RuntimeError:
+        log.exception("Error happened while parsing free dictionary")
+        return None
 
 
 async def free_dictionary_autocomplete_query(session: ClientSession, *, query: str) -> list[str]:
@@ -305,7 +316,8 @@ async def free_dictionary_autocomplete_query(session: ClientSession, *, query: s
 
     async with session.get(url, params={"query": query}, headers=headers) as resp:
         if resp.status != 200:
-            return []
+            msg = f"Free Dictionary suggestions responded with status {resp.status}."
+            raise errors.ResponseNotOK(msg)
 
         js = await resp.json()
         if len(js) == 2:
@@ -335,11 +347,19 @@ class FreeDictionaryWordMeaningPaginator(pages.Paginator):
 
 
 class DictionaryCog(EducationalCog):
+    def __init__(self, bot: AluBot, *args: Any, **kwargs: Any) -> None:
+        super().__init__(bot, *args, **kwargs)
+        self.word_cache: cache.ResponseCache[FreeDictionaryWord | None] = cache.ResponseCache(maxsize=512, ttl=86400.0)
+        self.suggest_cache: cache.ResponseCache[list[str]] = cache.ResponseCache(maxsize=1024, ttl=86400.0)
+
     @app_commands.command(name="define")
     @app_commands.describe(word="The word to look up")
     async def define(self, interaction: discord.Interaction[AluBot], word: str) -> None:
         """Looks up an English word in the dictionary."""
-        result = await parse_free_dictionary_for_word(self.bot.session, word=word)
+        result = await self.word_cache.get_or_fetch(
+            self.word_cache.normalize_key(word),
+            lambda: parse_free_dictionary_for_word(self.bot.session, word=word),
+        )
         if result is None:
             msg = "Could not find that word."
             raise errors.SomethingWentWrong(msg)
@@ -364,5 +384,12 @@ class DictionaryCog(EducationalCog):
         if not query:
             return []
 
-        result = await free_dictionary_autocomplete_query(self.bot.session, query=query)
+        try:
+            result = await self.suggest_cache.get_or_fetch(
+                self.suggest_cache.normalize_key(query),
+                lambda: free_dictionary_autocomplete_query(self.bot.session, query=query),
+            )
+        except errors.ResponseNotOK:
+            # not cached, so the next keystroke tries again
+            return []
         return [app_commands.Choice(name=word, value=word) for word in result][:25]
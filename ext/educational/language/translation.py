@@ -28,7 +28,7 @@ from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict, override
 import discord
 from discord import app_commands
 
-from utils import const, errors
+from utils import cache, const, errors
 
 from .._base import EducationalCog
 
@@ -127,6 +127,7 @@ class TranslateCog(EducationalCog):
 
     def __init__(self, bot: AluBot, *args: Any, **kwargs: Any) -> None:
         super().__init__(bot, *args, **kwargs)
+        self.translate_cache: cache.ResponseCache[TranslateResult] = cache.ResponseCache(maxsize=512, ttl=86400.0)
         self.translate_context_menu = app_commands.ContextMenu(
             name="Translate to English",
             callback=self.translate_context_menu_callback,
@@ -143,7 +144,11 @@ class TranslateCog(EducationalCog):
     async def translate_embed(self, text: str) -> discord.Embed:
         """Embed-answer for translation commands."""
         # PS: TranslateError is handled in global ErrorHandler as `AluBotError`.
-        result = await translate(text, session=self.bot.session)
+        # translations are case-sensitive, so only whitespace is normalised
+        result = await self.translate_cache.get_or_fetch(
+            " ".join(text.split()),
+            lambda: translate(text, session=self.bot.session),
+        )
 
         return discord.Embed(
             color=const.Color.prpl,
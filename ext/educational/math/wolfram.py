@@ -1,18 +1,18 @@
 from __future__ import annotations
 
+from io import BytesIO
 from typing import TYPE_CHECKING, Any
 from urllib import parse as urlparse
 
+import discord
 from discord import app_commands
 
 from config import config
-from utils import const, errors
+from utils import cache, const, errors
 
 from .._base import EducationalCog
 
 if TYPE_CHECKING:
-    import discord
-
     from bot import AluBot
 
 
@@ -29,6 +29,18 @@ class WolframAlphaCog(EducationalCog, emote=const.Emote.bedNerdge):
         wolfram_token = config["TOKENS"]["WOLFRAM"]
         self.simple_url = f"{base}/simple?appid={wolfram_token}&background=black&foreground=white&layout=labelbar&i="
         self.short_url = f"{base}/result?appid={wolfram_token}&i="
+        # Wolfram API has a monthly quota so identical queries are answered from the cache
+        self.long_cache: cache.ResponseCache[bytes] = cache.ResponseCache(maxsize=64, ttl=21600.0)
+        self.short_cache: cache.ResponseCache[str] = cache.ResponseCache(maxsize=512, ttl=21600.0)
+
+    async def fetch_short_answer(self, query: str) -> str:
+        """Request a short text answer from WolframAlpha."""
+        question_url = f"{self.short_url}{urlparse.quote(query)}"
+        async with self.bot.session.get(question_url) as response:
+            if response.ok:
+                return await response.text()
+            msg = f"Wolfram Response was not ok, Status {response.status},"
+            raise errors.ResponseNotOK(msg)
 
     wolfram_group = app_commands.Group(
         name="wolfram",
@@ -47,7 +59,11 @@ class WolframAlphaCog(EducationalCog, emote=const.Emote.bedNerdge):
         """
         await interaction.response.defer()
         question_url = f"{self.simple_url}{urlparse.quote(query)}"
-        file = await self.bot.transposer.url_to_file(question_url, filename="WolframAlpha.png")
+        image_bytes = await self.long_cache.get_or_fetch(
+            self.long_cache.normalize_key(query),
+            lambda: self.bot.transposer.url_to_bytes(question_url),
+        )
+        file = discord.File(BytesIO(image_bytes), filename="WolframAlpha.png")
         await interaction.followup.send(content=f"```py\n{query}```", file=file)
 
     @wolfram_group.command(name="short")
@@ -61,13 +77,11 @@ class WolframAlphaCog(EducationalCog, emote=const.Emote.bedNerdge):
             Query for WolframAlpha.
         """
         await interaction.response.defer()
-        question_url = f"{self.short_url}{urlparse.quote(query)}"
-        async with self.bot.session.get(question_url) as response:
-            if response.ok:
-                await interaction.followup.send(f"```py\n{query}```{await response.text()}")
-            else:
-                msg = f"Wolfram Response was not ok, Status {response.status},"
-                raise errors.ResponseNotOK(msg)
+        answer = await self.short_cache.get_or_fetch(
+            self.short_cache.normalize_key(query),
+            lambda: self.fetch_short_answer(query),
+        )
+        await interaction.followup.send(f"```py\n{query}```{answer}")
 
 
 async def setup(bot: AluBot) -> None:
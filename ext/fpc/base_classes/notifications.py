@@ -11,6 +11,7 @@ from . import FPCCog
 
 if TYPE_CHECKING:
     from bot import AluBot
+    from utils.twitch import Streamer
 
     from .models import BaseMatchToEdit, BaseMatchToSend
 
@@ -22,7 +23,6 @@ if TYPE_CHECKING:
         channel_id: int
         spoil: bool
 
-    import twitchio
 
 __all__ = (
     "BaseNotifications",
@@ -52,23 +52,26 @@ class BaseNotifications(FPCCog):
 
         self.message_cache: dict[int, discord.WebhookMessage] = {}
 
-    async def get_player_streams(self, twitch_category_id: str, player_ids: list[int]) -> dict[int, twitchio.Stream]:
-        """Get `player_id` for favourite FPC streams that are currently live on Twitch."""
+    async def get_player_streams(self, twitch_category_id: str, player_ids: list[int]) -> dict[int, Streamer]:
+        """Get `player_id` for favourite FPC streams that are currently live on Twitch.
+
+        Streams are served from the shared stream status cache which is polled in batches in the background.
+        """
         query = f"""
             SELECT twitch_id, player_id
             FROM {self.prefix}_players
             WHERE player_id=ANY($1)
         """
         rows: list[GetTwitchLivePlayerRow] = await self.bot.pool.fetch(query, player_ids)
-        twitch_id_to_player_id = {row["twitch_id"]: row["player_id"] for row in rows}
-        if not twitch_id_to_player_id:
-            # otherwise fetch_streams fetches top100 streams and we dont want that.
-            return {}
-
+        twitch_id_to_player_id = {row["twitch_id"]: row["player_id"] for row in rows if row["twitch_id"]}
+        # only players that were just added to the database are not tracked yet
+        await self.bot.twitch.stream_status.track(twitch_id_to_player_id.keys())
         return {
-            twitch_id_to_player_id[stream.user.id]: stream
-            for stream in await self.bot.twitch.fetch_streams(user_ids=list(twitch_id_to_player_id.keys()))
-            if stream.game_id == twitch_category_id
+            player_id: streamer
+            for twitch_id, player_id in twitch_id_to_player_id.items()
+            if (streamer := self.bot.twitch.stream_status.get(twitch_id))
+            and streamer.live
+            and streamer.game_id == twitch_category_id
         }
 
     async def send_match(self, match: BaseMatchToSend, recipients: list[RecipientTuple]) -> None:
@@ -37,9 +37,11 @@ if TYPE_CHECKING:
         player_id: int
         display_name: str
 
-    class PlayerListQueryRow(TypedDict):
+    class PlayerPageQueryRow(TypedDict):
+        player_id: int
         display_name: str
-        twitch_id: str
+        twitch_id: str | None
+        sort_name: str
 
     class SetupMiscQueryRow(TypedDict):
         enabled: bool
@@ -337,7 +339,99 @@ class SetupMisc(FPCView):
         await interaction.followup.send(embed=response_embed)
 
 
-class SetupPlayersPaginator(pages.Paginator):
+ESTIMATE_TRUST_THRESHOLD = 1000
+"""Below this amount of rows `pg_class.reltuples` estimate isn't worth it, exact `count(*)` is cheap enough."""
+
+
+class FPCPlayersSource(pages.KeysetPageSource["PlayerPageQueryRow", tuple[str, int]]):
+    """Keyset page source of FPC players sorted case-insensitively by their display names.
+
+    Backed by `{prefix}_players_sort_name_idx` expression index on `(lower(display_name), player_id)`.
+
+    Attributes
+    ----------
+    bot: AluBot
+        The bot instance, needed for the database pool.
+    prefix: str
+        Game prefix of the FPC tables, i.e. "dota".
+    guild_id: int | None
+        If provided, only favourite players of this guild are listed.
+    """
+
+    def __init__(self, bot: AluBot, prefix: str, *, guild_id: int | None = None, per_page: int = 20) -> None:
+        super().__init__(per_page=per_page)
+        self.bot: AluBot = bot
+        self.prefix: str = prefix
+        self.guild_id: int | None = guild_id
+
+    @override
+    def key(self, entry: PlayerPageQueryRow) -> tuple[str, int]:
+        return entry["sort_name"], entry["player_id"]
+
+    @override
+    async def fetch(self, *, after: tuple[str, int] | None, offset: int, limit: int) -> list[PlayerPageQueryRow]:
+        conditions: list[str] = []
+        args: list[Any] = []
+        offset_clause = ""
+        if self.guild_id is not None:
+            args.append(self.guild_id)
+            conditions.append(
+                f"p.player_id IN (SELECT player_id FROM {self.prefix}_favourite_players WHERE guild_id = ${len(args)})"
+            )
+        if after is not None:
+            args.extend(after)
+            conditions.append(f"(lower(p.display_name), p.player_id) > (${len(args) - 1}, ${len(args)})")
+        else:
+            args.append(offset)
+            offset_clause = f"OFFSET ${len(args)}"
+        args.append(limit)
+
+        query = f"""
+            SELECT p.player_id, p.display_name, p.twitch_id, lower(p.display_name) AS sort_name
+            FROM {self.prefix}_players p
+            {"WHERE " + " AND ".join(conditions) if conditions else ""}
+            ORDER BY lower(p.display_name), p.player_id
+            {offset_clause}
+            LIMIT ${len(args)}
+        """
+        return await self.bot.pool.fetch(query, *args)
+
+    @override
+    async def count(self, *, estimate: bool) -> int:
+        if self.guild_id is not None:
+            query = f"SELECT count(*) FROM {self.prefix}_favourite_players WHERE guild_id = $1"
+            return await self.bot.pool.fetchval(query, self.guild_id)
+
+        if estimate:
+            # planner statistics estimate is free while `count(*)` has to scan the whole table;
+            # it's `-1` if the table was never vacuumed/analyzed
+            query = "SELECT reltuples::bigint FROM pg_class WHERE oid = $1::regclass"
+            estimated: int = await self.bot.pool.fetchval(query, f"{self.prefix}_players")
+            if estimated >= ESTIMATE_TRUST_THRESHOLD:
+                return estimated
+        return await self.bot.pool.fetchval(f"SELECT count(*) FROM {self.prefix}_players")
+
+
+class FavouritePlayersPaginator(pages.KeysetPaginator):
+    """A Paginator for the subscriber's list of favourite players."""
+
+    def __init__(self, interaction: AluInteraction, cog: BaseSettings, guild_id: int) -> None:
+        super().__init__(interaction, FPCPlayersSource(cog.bot, cog.prefix, guild_id=guild_id, per_page=30))
+        self.cog: BaseSettings = cog
+
+    @override
+    async def format_page(self, entries: list[PlayerPageQueryRow]) -> discord.Embed:
+        favourite_player_names = (
+            "\n".join([field_name(row["display_name"], row["twitch_id"]) for row in entries]) or "Empty list"
+        )
+        return discord.Embed(
+            color=self.cog.color,
+            title="List of your favourite players",
+            description=favourite_player_names,
+        ).set_footer(text=self.cog.game_display_name, icon_url=self.cog.game_icon_url)
+
+
+class SetupPlayersPaginator(pages.KeysetPaginator):
     """A Paginator for `/{game} setup players` command.
 
     This gives:
@@ -345,11 +439,14 @@ class SetupPlayersPaginator(pages.Paginator):
     * list of favourite players button
     * buttons to mark/demark player as favourite
     * button to view all accounts for presented embed
+
+    Players are fetched from the database lazily, page by page.
     """
 
-    def __init__(self, interaction: AluInteraction, player_tuples: list[tuple[int, str]], cog: BaseSettings) -> None:
-        super().__init__(interaction, entries=player_tuples, per_page=20)
+    def __init__(self, interaction: AluInteraction, cog: BaseSettings) -> None:
+        super().__init__(interaction, FPCPlayersSource(cog.bot, cog.prefix))
         self.cog: BaseSettings = cog
+        self.page_player_ids: list[int] = []
 
     @override
     async def on_timeout(self) -> None:  # TODO: do it properly, via combining FPCView and pages.Paginator as a class.
@@ -357,7 +454,7 @@ class SetupPlayersPaginator(pages.Paginator):
         self.cog.setup_messages_cache.pop(self.message.id, None)
 
     @override
-    async def format_page(self, entries: list[tuple[int, str]]) -> discord.Embed:
+    async def format_page(self, entries: list[PlayerPageQueryRow]) -> discord.Embed:
         """Create a page for `/{game} setup {characters/players}` command.
 
         This gives
@@ -367,17 +464,19 @@ class SetupPlayersPaginator(pages.Paginator):
         Parameters
         ----------
         entries:
-            List of (player_id, player_display_name) tuples,
-            for example: [(1, "gosu"), (2, "Quantum"), ...].
+            List of player rows for the page, sorted by display name.
 
         """
         # unfortunately we have to fetch favourites each format page
         # in case they are bad acting with using both slash commands
-        # or several menus
+        # or several menus; but only for players shown on the page
+        self.page_player_ids = [row["player_id"] for row in entries]
 
-        query = f"SELECT player_id FROM {self.cog.prefix}_favourite_players WHERE guild_id=$1"
+        query = f"SELECT player_id FROM {self.cog.prefix}_favourite_players WHERE guild_id=$1 AND player_id=ANY($2)"
         assert self.interaction.guild
-        favourite_ids: list[int] = [r for (r,) in await self.bot.pool.fetch(query, self.interaction.guild.id)]
+        favourite_ids: set[int] = {
+            r for (r,) in await self.bot.pool.fetch(query, self.interaction.guild.id, self.page_player_ids)
+        }
 
         embed = (
             discord.Embed(
@@ -411,12 +510,12 @@ class SetupPlayersPaginator(pages.Paginator):
         for item in [self.favourite_players, self.previous_page, self.index, self.next_page, self.account_list]:
             self.add_item(item)
 
-        for player_id, player_display_name in entries:
+        for row in entries:
             self.add_item(
                 AddRemoveButton(
-                    player_display_name,
-                    player_id,
-                    is_favourite=player_id in favourite_ids,
+                    row["display_name"],
+                    row["player_id"],
+                    is_favourite=row["player_id"] in favourite_ids,
                     table=f"{self.cog.prefix}_favourite_players",
                     column="player_id",
                     menu=self,
@@ -429,8 +528,8 @@ class SetupPlayersPaginator(pages.Paginator):
     async def favourite_players(self, interaction: AluInteraction, _: discord.ui.Button[Self]) -> None:
         """Show favourite object list."""
         assert interaction.guild
-        embed = await self.cog.get_player_list_embed(interaction.guild.id)
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        paginator = FavouritePlayersPaginator(interaction, self.cog, interaction.guild.id)
+        await paginator.start(ephemeral=True)
 
     @discord.ui.button(emoji="\N{PENCIL}", label="Accounts", style=discord.ButtonStyle.blurple)
     async def account_list(self, interaction: AluInteraction, _: discord.ui.Button[Self]) -> None:
@@ -444,9 +543,10 @@ class SetupPlayersPaginator(pages.Paginator):
             FROM {self.cog.prefix}_players p
             JOIN {self.cog.prefix}_accounts a
             ON p.player_id = a.player_id
-            ORDER BY display_name
+            WHERE p.player_id = ANY($1)
+            ORDER BY lower(display_name), p.player_id
         """
-        rows: list[AccountListButtonQueryRow] = await interaction.client.pool.fetch(query) or []
+        rows: list[AccountListButtonQueryRow] = await interaction.client.pool.fetch(query, self.page_player_ids) or []
 
         player_dict: dict[str, AccountListButtonPlayerSortDict] = {}
         for row in rows:
@@ -515,11 +615,16 @@ class SetupCharactersPaginator(pages.Paginator):
         """
         # unfortunately we have to fetch favourites each format page
         # in case they are bad acting with using both slash commands
-        # or several menus
-
-        query = f"SELECT character_id FROM {self.cog.prefix}_favourite_characters WHERE guild_id=$1"
+        # or several menus; but only for characters shown on the page
+        query = f"""
+            SELECT character_id FROM {self.cog.prefix}_favourite_characters
+            WHERE guild_id=$1 AND character_id=ANY($2)
+        """
         assert self.interaction.guild
-        favourite_ids: list[int] = [r for (r,) in await self.bot.pool.fetch(query, self.interaction.guild.id)]
+        character_ids = [character.id for character in entries]
+        favourite_ids: set[int] = {
+            r for (r,) in await self.bot.pool.fetch(query, self.interaction.guild.id, character_ids)
+        }
 
         embed = (
             discord.Embed(
@@ -1095,13 +1200,7 @@ class BaseSettings(FPCCog):
         await interaction.response.defer()
         await self.is_fpc_channel_set(interaction)
 
-        query = f"SELECT player_id, display_name FROM {self.prefix}_players"
-        rows: list[SetupPlayerQueryRow] = await interaction.client.pool.fetch(query)
-
-        player_tuples: list[tuple[int, str]] = [(row["player_id"], row["display_name"]) for row in rows]
-        player_tuples.sort(key=lambda pt: pt[1].lower())
-
-        paginator = SetupPlayersPaginator(interaction, player_tuples, self)
+        paginator = SetupPlayersPaginator(interaction, self)
         message = await paginator.start()
         # paginator.message is already assigned
         self.setup_messages_cache[message.id] = paginator
@@ -1237,29 +1336,6 @@ class BaseSettings(FPCCog):
             msg = "Unknown error."
             raise errors.BadArgument(msg)
 
-    async def get_player_list_embed(self, guild_id: int) -> discord.Embed:
-        """Helper function to get an embed with the subscriber's list of favourite players.
-
-        Parameters
-        ----------
-        guild_id: int
-            Guild ID of the subscriber, for which the bot will fetch the favourite players list.
-        """
-        query = f"""
-            SELECT display_name, twitch_id
-            FROM {self.prefix}_players
-            WHERE player_id=ANY(SELECT player_id FROM {self.prefix}_favourite_players WHERE guild_id=$1)
-        """
-        rows: list[PlayerListQueryRow] = await self.bot.pool.fetch(query, guild_id)
-        favourite_player_names = (
-            "\n".join([field_name(row["display_name"], row["twitch_id"]) for row in rows]) or "Empty list"
-        )
-        return discord.Embed(
-            color=self.color,
-            title="List of your favourite players",
-            description=favourite_player_names,
-        ).set_footer(text=self.game_display_name, icon_url=self.game_icon_url)
-
     async def hideout_player_list(self, interaction: AluInteraction) -> None:
         """Base function for `/{game}-dev player list` Hideout-only command.
 
@@ -1267,8 +1343,8 @@ class BaseSettings(FPCCog):
         """
         await interaction.response.defer()
         assert interaction.guild
-        embed = await self.get_player_list_embed(interaction.guild.id)
-        await interaction.followup.send(embed=embed)
+        paginator = FavouritePlayersPaginator(interaction, self, interaction.guild.id)
+        await paginator.start()
 
     async def get_character_list_embed(self, guild_id: int) -> discord.Embed:
         """Helper function to get an embed with the subscriber's list of favourite characters.
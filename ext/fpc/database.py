@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypedDict
+import asyncio
+import datetime
+import logging
+from typing import TYPE_CHECKING, TypedDict, override
 
 from discord.ext import commands
 
+from bot import aluloop
+
 from .base_classes import FPCCog
 
 if TYPE_CHECKING:
@@ -11,40 +16,102 @@ if TYPE_CHECKING:
 
     class CheckAccRenamesQueryRow(TypedDict):
         player_id: int
-        twitch_id: int
+        twitch_id: str
         display_name: str
 
 
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+HELIX_MAX_IDS_PER_REQUEST = 100
+"""Twitch Helix endpoints such as "Get Users" accept at most 100 ids per request."""
+
+
 class FPCDatabaseManagement(FPCCog):
     """FPC Database Management.
 
     Commands for bot owner(-s) to add/remove player accounts from the FPC database.
     """
 
+    @override
+    async def cog_load(self) -> None:
+        await self.bot.instantiate_twitch()
+        self.initiate_twitch_renames_timer.start()
+
+    @override
+    async def cog_unload(self) -> None:
+        self.initiate_twitch_renames_timer.cancel()
+
+    @aluloop(count=1)
+    async def initiate_twitch_renames_timer(self) -> None:
+        """Create the periodic twitch renames check timer if it doesn't exist yet."""
+        # we have to do this quirk bcs if we put this into cog load
+        # it will not have TimerManager initiated yet.
+        query = "SELECT id FROM timers WHERE event = $1"
+        if await self.bot.pool.fetchval(query, "fpc_twitch_renames_check"):
+            return
+
+        await self.bot.timers.create(
+            event="fpc_twitch_renames_check",
+            expires_at=datetime.datetime.now(datetime.UTC) + datetime.timedelta(hours=1),
+            data={},
+        )
+
+    async def fetch_twitch_display_names(self, twitch_ids: list[str]) -> dict[str, str]:
+        """Fetch display names for twitch users in Helix-maximum chunks of 100 ids concurrently."""
+        chunks = [
+            twitch_ids[i : i + HELIX_MAX_IDS_PER_REQUEST] for i in range(0, len(twitch_ids), HELIX_MAX_IDS_PER_REQUEST)
+        ]
+        responses = await asyncio.gather(*(self.bot.twitch.fetch_users(ids=chunk) for chunk in chunks))
+        return {str(user.id): user.display_name for users in responses for user in users}
+
     @commands.Cog.listener("on_fpc_twitch_renames_check_timer_complete")
     async def check_twitch_accounts_renames(self, timer: Timer) -> None:
         """Checks if people in FPC database renamed themselves on twitch.tv.
 
         I think we're using twitch ids everywhere so this timer is more for convenience matter
         when I'm browsing the database, but still.
+
+        All players from both tables are requested in bulk, the rename diff is computed in memory
+        and applied with a single `UPDATE ... FROM unnest` per table.
         """
-        for table_name in ("dota_players", "lol_players"):
-            query = f"SELECT player_id, twitch_id, display_name FROM {table_name} WHERE twitch_id IS NOT NULL"
-            rows: list[CheckAccRenamesQueryRow] = await self.bot.pool.fetch(query)
-
-            for row in rows:
-                # todo: wtf fetch only one user ?!
-                user = next(iter(await self.bot.twitch.fetch_users(ids=[row["twitch_id"]])), None)
-
-                if user is None:
-                    continue
-                if user.display_name != row["display_name"]:
-                    query = f"UPDATE {table_name} SET display_name=$1 WHERE player_id=$3"
-                    await self.bot.pool.execute(query, user.display_name, row["player_id"])
-        # TODO: periodic timer - create a new one
-        # TODO: maybe standardize the process of periodic timers
-        # TODO: remove twitch_check from other folders
-        # TODO: check if it's possible to fire a timer before cogs load in
+        tables = ("dota_players", "lol_players")
+        rows_per_table: list[list[CheckAccRenamesQueryRow]] = [
+            await self.bot.pool.fetch(
+                f"SELECT player_id, twitch_id, display_name FROM {table_name} WHERE twitch_id IS NOT NULL"
+            )
+            for table_name in tables
+        ]
+        # same streamers are often tracked in both games
+        twitch_ids = list({row["twitch_id"] for rows in rows_per_table for row in rows})
+        display_names = await self.fetch_twitch_display_names(twitch_ids)
+
+        for table_name, rows in zip(tables, rows_per_table, strict=True):
+            renamed = [
+                (row["player_id"], display_name)
+                for row in rows
+                if (display_name := display_names.get(row["twitch_id"])) and display_name != row["display_name"]
+            ]
+            if not renamed:
+                continue
+
+            query = f"""
+                UPDATE {table_name} AS p
+                SET display_name = u.display_name
+                FROM unnest($1::int[], $2::text[]) AS u(player_id, display_name)
+                WHERE p.player_id = u.player_id
+            """
+            player_ids, new_names = zip(*renamed, strict=True)
+            await self.bot.pool.execute(query, list(player_ids), list(new_names))
+            log.info("Renamed %s players in `%s` according to their twitch display names.", len(renamed), table_name)
+
+        # periodic timer - create the next one
+        await self.bot.timers.cleanup(timer.id)
+        await self.bot.timers.create(
+            event="fpc_twitch_renames_check",
+            expires_at=datetime.datetime.now(datetime.UTC) + datetime.timedelta(days=1),
+            data={},
+        )
 
 
 async def setup(bot: AluBot) -> None:
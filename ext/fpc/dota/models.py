@@ -92,7 +92,7 @@ class MatchToSend(BaseMatchToSend):
         streamer = await self.bot.twitch.fetch_streamer(self.twitch_id)
         if streamer.live:
             twitch_status = "Live"
-            vod_url = await streamer.vod_link(seconds_ago=self.long_ago)
+            vod_url = streamer.vod_link(seconds_ago=self.long_ago)
             color = const.Color.prpl
         else:
             twitch_status = "Offline"
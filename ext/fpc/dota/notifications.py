@@ -11,15 +11,19 @@ from discord.ext import commands
 
 from bot import aluloop
 from utils import const
+from utils.dota.pulsefire_clients import QuotaPriority
 from utils.helpers import measure_time
 
 from ..base_classes import BaseNotifications, EditTuple, RecipientTuple
 from .models import MatchToSend, StratzMatchToEdit
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from steam.ext.dota2 import LiveMatch
 
     from bot import AluBot, AluContext
+    from utils.dota import Hero, PseudoHero, WebAPILiveMatch
 
     class AnalyzeGetPlayerIDsQueryRow(TypedDict):
         twitch_live_only: bool
@@ -68,7 +72,7 @@ class DotaFPCNotifications(BaseNotifications):
         super().__init__(bot, prefix="dota", *args, **kwargs)
         # Send Matches related attrs
         self.game_coordinator_death_counter: int = 0
-        self.top_live_matches: list[LiveMatch] = []
+        self.top_live_matches: list[LiveMatch | WebAPILiveMatch] = []
 
         # Edit Matches related attrs
         self.retry_mapping: dict[tuple[int, int], int] = {}
@@ -98,7 +102,7 @@ class DotaFPCNotifications(BaseNotifications):
         query = "SELECT friend_id FROM dota_accounts WHERE player_id=ANY($1)"
         return [f for (f,) in await self.bot.pool.fetch(query, player_ids)]
 
-    async def analyze_top_source_response(self, live_matches: list[LiveMatch]) -> None:
+    async def analyze_top_source_response(self, live_matches: Sequence[LiveMatch | WebAPILiveMatch]) -> None:
         """Analyze FindTopSourceTVGames response from Dota 2 Coordinator and select matches to send notifications for.
 
         This function looks for favourite player + favourite hero combos per subscribed person
@@ -187,6 +191,23 @@ class DotaFPCNotifications(BaseNotifications):
                         )
                         send_log.debug("Sending took %.5f secs", time.perf_counter() - start_time)
 
+    async def web_api_fallback(self, known_match_ids: set[int]) -> list[WebAPILiveMatch]:
+        """Degraded mode: get live matches of our tracked accounts from Steam Web API.
+
+        Matches that Game Coordinator already gave us are skipped.
+        """
+        query = "SELECT friend_id FROM dota_accounts"
+        friend_ids: set[int] = {friend_id for (friend_id,) in await self.bot.pool.fetch(query)}
+        try:
+            web_api_matches = await self.bot.dota.web_api_live_matches(friend_ids)
+        except (aiohttp.ClientError, TimeoutError) as exc:
+            send_log.warning("Steam Web API fallback failed as well: %r", exc)
+            return []
+
+        fallback_matches = [match for match in web_api_matches if match.id not in known_match_ids]
+        send_log.info("Steam Web API fallback found %s matches with our players", len(fallback_matches))
+        return fallback_matches
+
     @aluloop(seconds=59)
     async def notification_sender(self) -> None:
         """Task responsible for sending Dota 2 FPC notifications."""
@@ -195,22 +216,17 @@ class DotaFPCNotifications(BaseNotifications):
         # REQUESTING
         start_time = time.perf_counter()
         try:
-            live_matches = await self.bot.dota.top_live_matches()
+            live_matches: list[LiveMatch | WebAPILiveMatch] = list(await self.bot.dota.top_live_matches())
         except TimeoutError:
             self.game_coordinator_death_counter += 1
             send_log.warning(f"GC is dying: count `{self.game_coordinator_death_counter}`")
-            # nothing to "mark_matches_to_edit" so let's return
-            return
+            live_matches = []
         else:
             self.game_coordinator_death_counter = 0
 
         top_source_end_time = time.perf_counter() - start_time
         send_log.debug("Requesting took %.5f secs with %s results", top_source_end_time, len(live_matches))
 
-        # ANALYZING
-        async with measure_time("Analyzing Top Source Response", logger=send_log):
-            await self.analyze_top_source_response(live_matches)
-
         # another mini-death condition
         if len(live_matches) < 90:  # 100
             # this means it returned 80, 70, ..., or even 0 matches.
@@ -218,9 +234,15 @@ class DotaFPCNotifications(BaseNotifications):
             # We still forgive 90 though, should be fine.
             send_log.warning("GC only fetched %s matches", len(live_matches))
             # thus do not update `self.top_live_matches`
+            # but fill the gaps from Steam Web API so notifications don't go dark while GC is down
+            live_matches.extend(await self.web_api_fallback({match.id for match in live_matches}))
         else:
             self.top_live_matches = live_matches
 
+        # ANALYZING
+        async with measure_time("Analyzing Top Source Response", logger=send_log):
+            await self.analyze_top_source_response(live_matches)
+
         send_log.debug("--- Task is finished ---")
 
     @aluloop(minutes=5)
@@ -250,6 +272,7 @@ class DotaFPCNotifications(BaseNotifications):
             query, [match.id for match in self.top_live_matches],
         )
 
+        to_request: list[tuple[FindMatchesToEditQueryRow, Hero | PseudoHero, str]] = []
         for match_row in match_rows:
             # note to the following line: we could make retry database column instead of
             # having local self.retry_mapping but idk.
@@ -277,10 +300,32 @@ class DotaFPCNotifications(BaseNotifications):
                 await self.delete_match_from_editing_queue(match_id, friend_id)
                 # TODO: maybe edit the match with opendota instead? to have at least some data
 
-            try:
-                stratz_data = await self.bot.dota.stratz.get_fpc_match_to_edit(match_id=match_id, friend_id=friend_id)
-            except aiohttp.ClientResponseError as exc:
-                edit_log.warning("%s Stratz API Resp: Not OK, Status `%s` \N{CROSS MARK}", log_str, exc.status)
+            to_request.append((match_row, player_hero, log_str))
+
+        if not to_request:
+            edit_log.debug("*** Finished Task to Edit Dota FPC Messages ***")
+            return
+
+        # the whole backlog is fetched with a few batched queries instead of a request per match
+        try:
+            stratz_responses = await self.bot.dota.stratz.get_fpc_matches_to_edit(
+                [(match_row["match_id"], match_row["friend_id"]) for match_row, _, _ in to_request],
+                priority=QuotaPriority.Notifications,
+            )
+        except aiohttp.ClientResponseError as exc:
+            edit_log.warning(
+                "Stratz API Resp: Not OK, Status `%s` for a batch of %s matches \N{CROSS MARK}",
+                exc.status,
+                len(to_request),
+            )
+            return
+
+        for match_row, player_hero, log_str in to_request:
+            match_id, friend_id = match_row["match_id"], match_row["friend_id"]
+            stratz_data = stratz_responses.get((match_id, friend_id))
+            if stratz_data is None:
+                # its chunk of the batch failed; try again in the next loop
+                edit_log.warning("%s Stratz API request for the match failed \N{CROSS MARK}", log_str)
                 continue
 
             if not stratz_data["data"]["match"]:
@@ -349,11 +394,12 @@ class DotaFPCNotifications(BaseNotifications):
 
     def get_ratelimit_embed(self) -> discord.Embed:
         """Get Stratz RateLimits embed to send to my logger channel (on daily basis)."""
+        rate_limiter = self.bot.dota.stratz.rate_limiter
         return discord.Embed(
             color=discord.Color.blue(),
             title="Stratz RateLimits",
-            description=self.bot.dota.stratz.rate_limiter.rate_limits_string,
-        )
+            description=rate_limiter.rate_limits_string,
+        ).add_field(name="Daily Quota", value=rate_limiter.governor.status_string)
 
     @commands.command(hidden=True)
     async def ratelimits(self, ctx: AluContext) -> None:
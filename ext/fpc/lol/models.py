@@ -161,7 +161,7 @@ class MatchToSend(BaseMatchToSend):
                 description=(
                     f"Match `{self.platform.upper()}_{self.match_id}` "
                     f"started {human_timedelta(self.long_ago, mode='strip')}\n"
-                    f"{await streamer.vod_link(seconds_ago=self.long_ago)}{self.links}"
+                    f"{streamer.vod_link(seconds_ago=self.long_ago)}{self.links}"
                 ),
             )
             .set_author(name=title, url=streamer.url, icon_url=streamer.avatar_url)
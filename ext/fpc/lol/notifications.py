@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any, TypedDict, override
 
 import aiohttp
@@ -13,6 +15,8 @@ from ..base_classes import BaseNotifications, EditTuple, RecipientTuple
 from .models import MatchToEdit, MatchToSend
 
 if TYPE_CHECKING:
+    from pulsefire.schemas import RiotAPISchema
+
     from bot import AluBot
 
     class LivePlayerAccountRow(TypedDict):
@@ -32,9 +36,15 @@ if TYPE_CHECKING:
         channel_message_tuples: list[tuple[int, int]]
 
     class GetRecipientsQueryRow(TypedDict):
+        idx: int
         channel_id: int
         spoil: bool
 
+    class LiveCandidate(TypedDict):
+        player_account_row: LivePlayerAccountRow
+        game: RiotAPISchema.LolSpectatorV5Game
+        participant: RiotAPISchema.LolSpectatorV5GameParticipant
+
 
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
@@ -75,6 +85,8 @@ class Notifications(BaseNotifications):
         """
         player_account_rows: list[LivePlayerAccountRow] = await self.bot.pool.fetch(query, player_streams.keys())
 
+        candidates: list[LiveCandidate] = []
+
         # todo: bring pulsefire TaskGroup here
         # I'm not sure how to combine `player_account_rows` with results from Semaphore though.
         # https://pulsefire.iann838.com/usage/advanced/concurrent-requests/
@@ -118,41 +130,61 @@ class Notifications(BaseNotifications):
                 and participant["championId"] in favourite_champion_ids
                 and player_account_row["last_edited"] != game["gameId"]
             ):
-                query = """
-                    SELECT s.channel_id, s.spoil
-                    FROM lol_favourite_characters c
-                    JOIN lol_favourite_players p on c.guild_id = p.guild_id
-                    JOIN lol_settings s on s.guild_id = c.guild_id
-                    WHERE character_id=$1
-                        AND player_id=$2
-                        AND NOT channel_id=ANY(SELECT channel_id FROM lol_messages WHERE match_id=$3)
-                        AND s.enabled = TRUE;
-                """
-                rows: list[GetRecipientsQueryRow] = await self.bot.pool.fetch(
-                    query,
-                    participant["championId"],
-                    player_account_row["player_id"],
-                    game["gameId"],
+                candidates.append(
+                    {"player_account_row": player_account_row, "game": game, "participant": participant},
                 )
 
-                if rows:
-                    champion = await self.bot.lol.champions.by_id(participant["championId"])
-                    log.info(
-                        "Sending `%s_%s` - [`%s`](%s) %s",
-                        game["platformId"],
-                        game["gameId"],
-                        player_account_row["display_name"],
-                        (
-                            f"https://op.gg/summoners/{player_account_row['platform']}/"
-                            f"{player_account_row['in_game_name']}-{player_account_row['tag_line']}"
-                        ),
-                        champion.emote,
-                    )
-                    match_to_send = MatchToSend(self.bot, game, participant, player_account_row, champion)
-                    await self.send_match(
-                        match_to_send,
-                        [RecipientTuple(channel_id=row["channel_id"], spoil=row["spoil"]) for row in rows],
-                    )
+        if not candidates:
+            return
+
+        # resolve recipients for all live games at once;
+        # a channel gets at most one notification per match even if several favourite players are in it
+        query = """
+            SELECT DISTINCT ON (u.match_id, s.channel_id) u.idx, s.channel_id, s.spoil
+            FROM unnest($1::int[], $2::int[], $3::bigint[]) WITH ORDINALITY AS u(champion_id, player_id, match_id, idx)
+            JOIN lol_favourite_characters c ON c.character_id = u.champion_id
+            JOIN lol_favourite_players p ON p.guild_id = c.guild_id AND p.player_id = u.player_id
+            JOIN lol_settings s ON s.guild_id = c.guild_id
+            WHERE s.enabled = TRUE
+                AND NOT EXISTS (
+                    SELECT 1 FROM lol_messages m WHERE m.match_id = u.match_id AND m.channel_id = s.channel_id
+                )
+            ORDER BY u.match_id, s.channel_id, u.idx;
+        """
+        rows: list[GetRecipientsQueryRow] = await self.bot.pool.fetch(
+            query,
+            [candidate["participant"]["championId"] for candidate in candidates],
+            [candidate["player_account_row"]["player_id"] for candidate in candidates],
+            [candidate["game"]["gameId"] for candidate in candidates],
+        )
+        recipients_by_candidate: defaultdict[int, list[RecipientTuple]] = defaultdict(list)
+        for row in rows:
+            # `WITH ORDINALITY` is 1-based
+            recipients_by_candidate[row["idx"] - 1].append(
+                RecipientTuple(channel_id=row["channel_id"], spoil=row["spoil"])
+            )
+
+        for idx, recipients in sorted(recipients_by_candidate.items()):
+            candidate = candidates[idx]
+            player_account_row, game, participant = (
+                candidate["player_account_row"],
+                candidate["game"],
+                candidate["participant"],
+            )
+            champion = await self.bot.lol.champions.by_id(participant["championId"])
+            log.info(
+                "Sending `%s_%s` - [`%s`](%s) %s",
+                game["platformId"],
+                game["gameId"],
+                player_account_row["display_name"],
+                (
+                    f"https://op.gg/summoners/{player_account_row['platform']}/"
+                    f"{player_account_row['in_game_name']}-{player_account_row['tag_line']}"
+                ),
+                champion.emote,
+            )
+            match_to_send = MatchToSend(self.bot, game, participant, player_account_row, champion)
+            await self.send_match(match_to_send, recipients)
 
     @aluloop(seconds=59)
     async def notification_worker(self) -> None:
@@ -172,32 +204,39 @@ class Notifications(BaseNotifications):
         """
         match_rows: list[FindMatchesToEditQueryRow] = await self.bot.pool.fetch(query, self.live_match_ids)
 
-        for match_row in match_rows:
-            try:
-                match_id = f"{match_row['platform'].upper()}_{match_row['match_id']}"
-                continent = lol.Platform(match_row["platform"]).continent
+        finished_message_ids: list[int] = []
+        try:
+            for match_row in match_rows:
+                try:
+                    match_id = f"{match_row['platform'].upper()}_{match_row['match_id']}"
+                    continent = lol.Platform(match_row["platform"]).continent
 
-                match = await self.bot.lol.get_lol_match_v5_match(id=match_id, region=continent)
-                timeline = await self.bot.lol.get_lol_match_v5_match_timeline(id=match_id, region=continent)
-
-            except aiohttp.ClientResponseError as exc:
-                if exc.status == 404:
-                    continue
-                raise
-
-            for participant in match["info"]["participants"]:
-                if participant["championId"] == match_row["champion_id"]:
-                    # found our participant
-                    match_to_edit = MatchToEdit(self.bot, participant=participant, timeline=timeline)
-                    await self.edit_match(
-                        match_to_edit,
-                        [
-                            EditTuple(channel_id=channel_id, message_id=message_id)
-                            for channel_id, message_id in match_row["channel_message_tuples"]
-                        ],
+                    match, timeline = await asyncio.gather(
+                        self.bot.lol.get_lol_match_v5_match(id=match_id, region=continent),
+                        self.bot.lol.get_lol_match_v5_match_timeline(id=match_id, region=continent),
                     )
-            query = "DELETE FROM lol_messages WHERE match_id=$1"
-            await self.bot.pool.fetch(query, match_row["match_id"])
+                except aiohttp.ClientResponseError as exc:
+                    if exc.status == 404:
+                        continue
+                    raise
+
+                for participant in match["info"]["participants"]:
+                    if participant["championId"] == match_row["champion_id"]:
+                        # found our participant
+                        match_to_edit = MatchToEdit(self.bot, participant=participant, timeline=timeline)
+                        await self.edit_match(
+                            match_to_edit,
+                            [
+                                EditTuple(channel_id=channel_id, message_id=message_id)
+                                for channel_id, message_id in match_row["channel_message_tuples"]
+                            ],
+                        )
+                finished_message_ids.extend(message_id for _, message_id in match_row["channel_message_tuples"])
+        finally:
+            # even if some match failed, don't edit already finished ones again
+            if finished_message_ids:
+                query = "DELETE FROM lol_messages WHERE message_id = ANY($1)"
+                await self.bot.pool.execute(query, finished_message_ids)
 
 
 async def setup(bot: AluBot) -> None:
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import operator
 from collections import Counter
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, override
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from bot import aluloop
 from utils import const, errors
 
 from ._base import HideoutCog
@@ -21,18 +23,53 @@ if TYPE_CHECKING:
 class HideoutModeration(HideoutCog):
     """Moderation utilities for Hideout Discord Server."""
 
+    def __init__(self, bot: AluBot) -> None:
+        super().__init__(bot)
+        self._join_queue: asyncio.Queue[discord.Member] = asyncio.Queue()
+
+    @override
+    async def cog_load(self) -> None:
+        self.jail_bots_kick_people_worker.start()
+
+    @override
+    async def cog_unload(self) -> None:
+        self.jail_bots_kick_people_worker.cancel()
+
     @commands.Cog.listener(name="on_member_join")
     async def jail_bots_kick_people_on_join(self, member: discord.Member) -> None:
+        """Queue outsiders to be jailed or kicked by `jail_bots_kick_people_worker`."""
+        if member.guild.id == self.bot.hideout.guild.id:
+            self._join_queue.put_nowait(member)
+
+    @aluloop(seconds=0.0)
+    async def jail_bots_kick_people_worker(self) -> None:
         """Jail or kick outsiders.
 
         * Kicks non-bot accounts from the server if they somehow managed to enter
         * Gives newly entered bot-accounts @Jailed Bots role.
+
+        Members are processed one by one so a mass-join doesn't block gateway event processing
+        with a pile of concurrent requests.
         """
-        if member.guild.id == self.bot.hideout.guild.id:
+        member = await self._join_queue.get()
+        if member.guild.get_member(member.id) is None:
+            # already gone
+            return
+        try:
             if member.bot:
                 await member.add_roles(self.bot.hideout.jailed_bots_role)
             else:
                 await member.kick()
+        except discord.NotFound:
+            pass
+        except discord.HTTPException as exc:
+            # i.e. Forbidden or 5xx - report and move on to the next member so the worker keeps running
+            action = "jail bot" if member.bot else "kick member"
+            embed = discord.Embed(
+                color=const.Color.error,
+                description=f"Failed to {action} {member} (`{member.id}`) in the hideout.",
+            ).set_footer(text="HideoutModeration.jail_bots_kick_people_worker")
+            await self.bot.exc_manager.register_error(exc, embed)
 
     @app_commands.guilds(const.Guild.hideout)
     @app_commands.command()
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import colorsys
+import datetime
+import re
 import warnings
-from typing import TYPE_CHECKING
+from collections import Counter, deque
+from typing import TYPE_CHECKING, Any, override
 
 import discord
 from dateparser.search import search_dates
 from discord import app_commands
 from discord.ext import commands
 from PIL import Image, ImageColor
-from wordcloud import WordCloud
+from wordcloud import STOPWORDS, WordCloud
 
-from utils import const, converters, fmt
+from utils import const, converters, errors, fmt
 
 from ._base import InfoCog
 
@@ -140,12 +144,171 @@ class Info(InfoCog, name="Info", emote=const.Emote.PepoG):
         ][:25]
 
 
+class ChannelWordFrequencies:
+    """Word frequencies of a single channel tracked by `WordFrequencyStore`.
+
+    Attributes
+    ----------
+    buckets: deque[tuple[datetime.date, dict[int, Counter[str]]]]
+        Daily buckets of `member_id -> token counter` mappings.
+    member_days: Counter[int]
+        Mapping of member_id to the amount of buckets the member has counters in.
+    words: int
+        Total amount of token entries over all counters in all buckets.
+    tracked_since: datetime.datetime
+        When the channel started being tracked. The store is memory-only so it's reset on restarts.
+    """
+
+    __slots__: tuple[str, ...] = ("buckets", "member_days", "tracked_since", "words")
+
+    def __init__(self) -> None:
+        self.buckets: deque[tuple[datetime.date, dict[int, Counter[str]]]] = deque()
+        self.member_days: Counter[int] = Counter()
+        self.words: int = 0
+        self.tracked_since: datetime.datetime = datetime.datetime.now(datetime.UTC)
+
+
+class WordFrequencyStore:
+    """Bounded rolling per-channel store of word frequencies for `/wordcloud`.
+
+    Messages themselves are not stored - only per-member token counters bucketed by day.
+    Buckets older than `max_age` are pruned and counters are trimmed to the most common tokens.
+    Each channel keeps at most `max_members` members and `max_words` token entries,
+    after that new members are skipped and only already known tokens are counted.
+    Only channels that opted in via `/wordcloud-tracking` are tracked.
+    """
+
+    TOKEN_REGEX = re.compile(r"\w[\w']+")
+
+    def __init__(
+        self,
+        *,
+        max_age: datetime.timedelta = datetime.timedelta(days=14),
+        warmup: datetime.timedelta = datetime.timedelta(days=1),
+        max_tokens: int = 500,
+        max_members: int = 1_000,
+        max_words: int = 200_000,
+    ) -> None:
+        self.max_age: datetime.timedelta = max_age
+        self.warmup: datetime.timedelta = warmup
+        self.max_tokens: int = max_tokens
+        self.max_members: int = max_members
+        self.max_words: int = max_words
+        self.channels: dict[int, ChannelWordFrequencies] = {}
+        """Mapping of channel_id to its word frequencies."""
+
+    def track(self, channel_id: int) -> None:
+        """Start tracking the channel."""
+        if channel_id not in self.channels:
+            self.channels[channel_id] = ChannelWordFrequencies()
+
+    def untrack(self, channel_id: int) -> None:
+        """Stop tracking the channel and forget its frequencies."""
+        self.channels.pop(channel_id, None)
+
+    def is_tracked(self, channel_id: int) -> bool:
+        """Whether the channel opted in for the tracking."""
+        return channel_id in self.channels
+
+    def coverage(self, channel_id: int) -> datetime.timedelta:
+        """Get the period the frequencies of the channel cover, zero if it's not tracked."""
+        channel = self.channels.get(channel_id)
+        if channel is None:
+            return datetime.timedelta()
+        return min(self.max_age, datetime.datetime.now(datetime.UTC) - channel.tracked_since)
+
+    def is_warm(self, channel_id: int) -> bool:
+        """Whether the channel has been tracked for at least `warmup`, i.e. not just after a restart."""
+        return self.is_tracked(channel_id) and self.coverage(channel_id) >= self.warmup
+
+    def tokenize(self, text: str) -> list[str]:
+        """Split text into tokens, roughly the same way `WordCloud.process_text` does."""
+        words = (word.lower().removesuffix("'s") for word in self.TOKEN_REGEX.findall(text))
+        return [word for word in words if word not in STOPWORDS and not word.isdigit()]
+
+    def _trim(self, counter: Counter[str]) -> Counter[str]:
+        return Counter(dict(counter.most_common(self.max_tokens)))
+
+    def _prune(self, channel: ChannelWordFrequencies, today: datetime.date) -> None:
+        while channel.buckets and today - channel.buckets[0][0] > self.max_age:
+            _, counters = channel.buckets.popleft()
+            for member_id, counter in counters.items():
+                channel.words -= len(counter)
+                channel.member_days[member_id] -= 1
+                if channel.member_days[member_id] <= 0:
+                    del channel.member_days[member_id]
+
+    def add(self, message: discord.Message) -> None:
+        """Count tokens of the message if its channel is tracked."""
+        channel = self.channels.get(message.channel.id)
+        if channel is None or not (tokens := self.tokenize(message.content)):
+            return
+
+        day = message.created_at.date()
+        if not channel.buckets or channel.buckets[-1][0] != day:
+            channel.buckets.append((day, {}))
+            self._prune(channel, day)
+
+        counters = channel.buckets[-1][1]
+        member_id = message.author.id
+        counter = counters.get(member_id)
+        if counter is None:
+            if member_id not in channel.member_days and len(channel.member_days) >= self.max_members:
+                return
+            counter = counters[member_id] = Counter()
+            channel.member_days[member_id] += 1
+
+        if channel.words >= self.max_words:
+            tokens = [token for token in tokens if token in counter]
+        size = len(counter)
+        counter.update(tokens)
+        if len(counter) > 4 * self.max_tokens:
+            counter = counters[member_id] = self._trim(counter)
+        channel.words += len(counter) - size
+
+    def frequencies(self, channel_id: int, member_id: int) -> Counter[str]:
+        """Get combined token frequencies of the member in the channel over the whole tracked period."""
+        total: Counter[str] = Counter()
+        channel = self.channels.get(channel_id)
+        if channel is None:
+            return total
+        self._prune(channel, datetime.datetime.now(datetime.UTC).date())
+        for _, counters in channel.buckets:
+            total.update(counters.get(member_id, {}))
+        return total
+
+
 class StatsCommands(InfoCog, name="Stats Commands", emote=const.Emote.Smartge):
     """Some stats/infographics/diagrams/info.
 
     More to come.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.word_frequencies: WordFrequencyStore = WordFrequencyStore()
+
+    @override
+    async def cog_load(self) -> None:
+        for channel_id in await self.bot.pool.fetch("SELECT channel_id FROM wordcloud_channels"):
+            self.word_frequencies.track(channel_id["channel_id"])
+
+    @commands.Cog.listener("on_message")
+    async def count_word_frequencies(self, message: discord.Message) -> None:
+        """Feed `/wordcloud` frequencies store from opted-in channels."""
+        if message.author.bot or not message.guild:
+            return
+        self.word_frequencies.add(message)
+
+    def render_wordcloud(self, source: str | Counter[str]) -> discord.File:
+        """Render wordcloud image. This is CPU-heavy so it should be run in a thread."""
+        wordcloud = WordCloud(width=640, height=360, max_font_size=40)
+        if isinstance(source, str):
+            wordcloud.generate(source)
+        else:
+            wordcloud.generate_from_frequencies(source)
+        return self.bot.transposer.image_to_file(wordcloud.to_image(), filename="wordcloud.png")
+
     @app_commands.guild_only()
     @app_commands.command(name="wordcloud")
     @app_commands.rename(member_="member", channel_="channel")
@@ -159,7 +322,9 @@ class StatsCommands(InfoCog, name="Stats Commands", emote=const.Emote.Smartge):
         """Get `@member`'s wordcloud over last total `limit` messages in requested `#channel`.
 
         I do not scrap any chat histories into my own database.
-        This is why this command is limited and slow because the bot has to look up channel histories in place.
+        If the channel opted in with `/wordcloud-tracking` then the wordcloud is made from in-memory word frequencies
+        over the last two weeks. Otherwise (or while those are still being collected after a restart),
+        the command is limited and slow because the bot has to look up channel histories in place.
 
         Parameters
         ----------
@@ -174,15 +339,62 @@ class StatsCommands(InfoCog, name="Stats Commands", emote=const.Emote.Smartge):
             and not isinstance(channel, discord.CategoryChannel)
         )
 
-        text = "".join([f"{msg.content}\n" async for msg in channel.history(limit=limit) if msg.author == member])
-        wordcloud = WordCloud(width=640, height=360, max_font_size=40).generate(text)
+        store = self.word_frequencies
+        frequencies = store.frequencies(channel.id, member.id) if store.is_warm(channel.id) else None
+        if frequencies:
+            source: str | Counter[str] = frequencies
+            limit_text = f"last {store.coverage(channel.id).days} days"
+        else:
+            # the channel isn't tracked, the store is cold (i.e. right after a restart) or the member isn't in it
+            source = "".join([f"{msg.content}\n" async for msg in channel.history(limit=limit) if msg.author == member])
+            limit_text = f"{limit} messages"
+
+        if not source:
+            msg = f"{member} doesn't have any words in {channel} to make a wordcloud from."
+            raise errors.SomethingWentWrong(msg)
+
+        file = await asyncio.to_thread(self.render_wordcloud, source)
         embed = discord.Embed(
             color=const.Color.prpl,
-            description=f"Member: {member}\nChannel: {channel}\nLimit: {limit}",
+            description=f"Member: {member}\nChannel: {channel}\nLimit: {limit_text}",
         )
-        file = self.bot.transposer.image_to_file(wordcloud.to_image(), filename="wordcloud.png")
         await interaction.followup.send(embed=embed, file=file)
 
+    @app_commands.guild_only()
+    @app_commands.default_permissions(manage_channels=True)
+    @app_commands.command(name="wordcloud-tracking")
+    @app_commands.rename(channel_="channel")
+    async def wordcloud_tracking(
+        self,
+        interaction: discord.Interaction[AluBot],
+        enable: bool,  # noqa: FBT001
+        channel_: discord.TextChannel | None = None,
+    ) -> None:
+        """Opt the channel in/out of counting word frequencies for fast `/wordcloud`.
+
+        Parameters
+        ----------
+        enable: bool
+            Whether to start or stop counting word frequencies in the channel.
+        channel_: discord.TextChannel | None = None
+            The channel to opt in/out. Defaults to the current channel.
+        """
+        channel = channel_ or interaction.channel
+        assert channel and interaction.guild_id
+
+        if enable:
+            query = "INSERT INTO wordcloud_channels (channel_id, guild_id) VALUES ($1, $2) ON CONFLICT DO NOTHING"
+            await interaction.client.pool.execute(query, channel.id, interaction.guild_id)
+            self.word_frequencies.track(channel.id)
+            desc = f"Started counting word frequencies in {channel.mention} (only counters - not messages)."
+        else:
+            await interaction.client.pool.execute("DELETE FROM wordcloud_channels WHERE channel_id = $1", channel.id)
+            self.word_frequencies.untrack(channel.id)
+            desc = f"Stopped counting word frequencies in {channel.mention}."
+
+        embed = discord.Embed(color=const.Color.prpl, description=desc)
+        await interaction.response.send_message(embed=embed)
+
 
 async def setup(bot: AluBot) -> None:
     """Load AluBot extension. Framework of discord.py."""
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
+import time
 from enum import Enum
+from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, NamedTuple, override
 
 import discord
@@ -10,12 +13,12 @@ from bs4 import BeautifulSoup
 from discord import app_commands
 from discord.ext import menus
 
-from utils import cache, const, fmt, pages
+from utils import const, fmt, pages
 
 from ._base import InfoCog
 
 if TYPE_CHECKING:
-    from collections.abc import MutableMapping
+    from collections.abc import Callable
 
     from bot import AluBot, AluContext
 
@@ -42,35 +45,26 @@ LIQUIPEDIA_ICON = (
 LIQUIPEDIA_BASE_URL = "https://liquipedia.net"
 
 
-def scrape_schedule_data(
-    soup: BeautifulSoup,
-    schedule_mode: ScheduleModeEnum,
-    query: str | None = None,
-) -> list[Match]:
-    """Get data about Dota 2 matches in a structured dictionary.
+def parse_schedules(html: bytes) -> dict[ScheduleModeEnum, list[Match]]:
+    """Parse Liquipedia matches page into compact `Match` records for every schedule mode.
+
+    This is CPU-heavy and is supposed to be run in a worker thread. The soup is discarded afterwards.
 
     Note: We are scraping liquipedia.net, while I think there is API, that we can/should use.
 
     Parameters
     ----------
-    session : ClientSession
-        Session we will use to load the liquipedia page.
-    schedule_mode : ScheduleModeEnum
-        Enum that defines multiple conditions for the scrap/search/filtering matches.
-    query : str | None = None
-        Text query we will limit results to.
+    html : bytes
+        Liquipedia "Upcoming and ongoing matches" page.
 
     Returns
     -------
-    list[Match]
-        data about Dota 2 matches in a structured dictionary.
+    dict[ScheduleModeEnum, list[Match]]
+        Data about Dota 2 matches per schedule mode, sorted by league and datetime.
+        The result is cached, so time-dependent filtering is left for `schedule_matches`.
 
     """
-    matches: list[Match] = []
-
-    dt_now = datetime.datetime.now(datetime.UTC)
-    divs = soup.findAll("div", {"data-toggle-area-content": schedule_mode.data_toggle_area_content})
-    match_rows = divs[-1].findAll("tbody")
+    soup = BeautifulSoup(html, "html.parser")
 
     def get_dt_and_twitch_url(match_row: Any) -> tuple[datetime.datetime, str]:
         timer = match_row.find(class_="timer-object")
@@ -80,36 +74,140 @@ def scrape_schedule_data(
         twitch_url = f"https://liquipedia.net/dota2/Special:Stream/twitch/{timer.get('data-stream-twitch')}"
         return dt, twitch_url
 
-    for match_row in match_rows:
-        dt, twitch_url = get_dt_and_twitch_url(match_row)
-
-        if schedule_mode.only_next_game_day and (dt - dt_now).days > 0:
-            # we do not want this and next matches, since it's too far in future (we only want next 24 hours.)
-            break
-
-        team1 = match_row.select_one(".team-left").text.strip().replace("`", ".")
-        team2 = match_row.select_one(".team-right").text.strip().replace("`", ".")
-        # print(dt, (dt - dt_now).days, team1, team2)
-        league = match_row.find(class_="league-icon-small-image").find("a")
-        league_title = league.get("title")
-        league_url = league.get("href")
-
-        if query is not None and not any(query in item for item in [team1, team2, league_title]):
-            continue
-
-        matches.append(
-            Match(
-                league=league_title,
-                league_url=league_url,
-                teams=f"{team1} - {team2}",
-                twitch_url=twitch_url,
-                dt=dt,
-            ),
-        )
+    def parse_area(data_toggle_area_content: str) -> list[Match]:
+        matches: list[Match] = []
+        divs = soup.findAll("div", {"data-toggle-area-content": data_toggle_area_content})
+        for match_row in divs[-1].findAll("tbody"):
+            dt, twitch_url = get_dt_and_twitch_url(match_row)
+            team1 = match_row.select_one(".team-left").text.strip().replace("`", ".")
+            team2 = match_row.select_one(".team-right").text.strip().replace("`", ".")
+            league = match_row.find(class_="league-icon-small-image").find("a")
+            matches.append(
+                Match(
+                    league=league.get("title"),
+                    league_url=league.get("href"),
+                    teams=f"{team1} - {team2}",
+                    twitch_url=twitch_url,
+                    dt=dt,
+                ),
+            )
+        return matches
+
+    areas = {content: parse_area(content) for content in {mode.data_toggle_area_content for mode in ScheduleModeEnum}}
+
+    return {
+        mode: sorted(areas[mode.data_toggle_area_content], key=lambda x: (x.league, x.dt)) for mode in ScheduleModeEnum
+    }
+
+
+def schedule_matches(schedules: dict[ScheduleModeEnum, list[Match]], mode: ScheduleModeEnum) -> list[Match]:
+    """Get matches of the schedule mode from (possibly cached) parsed schedules.
 
+    The next game day cutoff moves with time, so it is applied on every request rather than at parse time.
+    """
+    matches = schedules[mode]
+    if mode.only_next_game_day:
+        # we do not want matches too far in future (we only want next 24 hours.)
+        dt_now = datetime.datetime.now(datetime.UTC)
+        matches = [match for match in matches if (match.dt - dt_now).days <= 0]
     return matches
 
 
+def filter_matches(matches: list[Match], query: str | None) -> list[Match]:
+    """Limit matches to the ones that mention the text query in team names or league title."""
+    if query is None:
+        return matches
+    return [match for match in matches if query in match.teams or query in match.league]
+
+
+def parse_fixtures(html: bytes) -> list[tuple[str, datetime.datetime]] | None:
+    """Parse onefootball fixtures page into `(teams, datetime)` records. `None` if there is no fixtures list."""
+    soup = BeautifulSoup(html, "html.parser")
+    fixtures = soup.find("of-match-cards-list")
+    if not fixtures:
+        return None
+
+    # game_week = fixtures.find('h3', attrs={'class': 'section-header__subtitle'})  # noqa: ERA001
+    # print(game_week.text)  # noqa: ERA001
+    matches = fixtures.findAll("li", attrs={"class": "simple-match-cards-list__match-card"})  # type:ignore[reportAttributeAccessIssue]
+    records: list[tuple[str, datetime.datetime]] = []
+    for match in matches:
+        team_content = match.findAll(
+            "of-simple-match-card-team",
+            attrs={"class": "simple-match-card__team-content"},
+        )
+        team1 = team_content[0].find("span", attrs={"class": "simple-match-card-team__name"}).text
+        team2 = team_content[1].find("span", attrs={"class": "simple-match-card-team__name"}).text
+        pre_match_data = match.find("span", attrs={"class": "simple-match-card__pre-match"})
+        if pre_match_data is not None:
+            match_time = pre_match_data.find("time")["datetime"]
+            dt = datetime.datetime.strptime(match_time, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=datetime.UTC)
+            records.append((f"{team1} - {team2}", dt))
+    return records
+
+
+class ScrapedPage[T]:
+    """Parsed records of a scraped web-page together with HTTP validators to revalidate them."""
+
+    __slots__: tuple[str, ...] = ("data", "etag", "fetched_at", "last_modified")
+
+    def __init__(self, data: T, etag: str | None, last_modified: str | None) -> None:
+        self.data: T = data
+        self.etag: str | None = etag
+        self.last_modified: str | None = last_modified
+        self.fetched_at: float = time.monotonic()
+
+
+class ScrapedPageCache:
+    """Cache of parsed web-pages.
+
+    * pages are parsed off the event loop and only the parsed records are kept in memory;
+    * stale pages are revalidated with conditional requests (`If-None-Match`/`If-Modified-Since`),
+        so unchanged pages are not downloaded nor parsed again;
+    * concurrent requests for a cold/stale page share one fetch.
+    """
+
+    def __init__(self, bot: AluBot, *, ttl: float) -> None:
+        self.bot: AluBot = bot
+        self.ttl: float = ttl
+        self.pages: dict[str, ScrapedPage[Any]] = {}
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+
+    async def get[T](self, url: str, parser: Callable[[bytes], T]) -> T:
+        """Get parsed records of the page at `url`."""
+        page = self.pages.get(url)
+        if page is not None and time.monotonic() - page.fetched_at < self.ttl:
+            return page.data
+
+        task = self._in_flight.get(url)
+        if task is None:
+            task = self._in_flight[url] = asyncio.create_task(self._fetch(url, parser))
+            task.add_done_callback(lambda _: self._in_flight.pop(url, None))
+        return await asyncio.shield(task)
+
+    async def _fetch[T](self, url: str, parser: Callable[[bytes], T]) -> T:
+        page: ScrapedPage[T] | None = self.pages.get(url)
+        headers: dict[str, str] = {}
+        if page is not None:
+            if page.etag:
+                headers["If-None-Match"] = page.etag
+            if page.last_modified:
+                headers["If-Modified-Since"] = page.last_modified
+
+        async with self.bot.session.get(url, headers=headers) as response:
+            if page is not None and response.status == HTTPStatus.NOT_MODIFIED:
+                log.debug("Page %s is not modified.", url)
+                page.fetched_at = time.monotonic()
+                return page.data
+            response.raise_for_status()
+            html = await response.read()
+            etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+        data = await asyncio.to_thread(parser, html)
+        self.pages[url] = ScrapedPage(data, etag, last_modified)
+        return data
+
+
 SELECT_OPTIONS = [
     discord.SelectOption(
         emoji=const.Emote.PepoRules,
@@ -173,13 +271,11 @@ class SchedulePageSource(menus.ListPageSource):
     def __init__(
         self,
         author: discord.User | discord.Member,
-        soup: BeautifulSoup,
+        schedules: dict[ScheduleModeEnum, list[Match]],
         schedule_enum: ScheduleModeEnum,
         query: str | None = None,
     ) -> None:
-        initial_data = scrape_schedule_data(soup, schedule_enum, query)
-        initial_data.sort(key=lambda x: (x.league, x.dt))
-        super().__init__(entries=initial_data, per_page=20)
+        super().__init__(entries=filter_matches(schedule_matches(schedules, schedule_enum), query), per_page=20)
         self.schedule_enum = schedule_enum
         self.author: discord.User | discord.Member = author
         self.query: str | None = query
@@ -241,26 +337,31 @@ class SchedulePages(pages.Paginator):
     def __init__(
         self,
         ctx: AluContext | discord.Interaction[AluBot],
-        soup: BeautifulSoup,
+        schedules: dict[ScheduleModeEnum, list[Match]],
         schedule_enum: ScheduleModeEnum,
         query: str | None = None,
     ) -> None:
-        source = SchedulePageSource(ctx.user, soup, schedule_enum, query)
+        source = SchedulePageSource(ctx.user, schedules, schedule_enum, query)
         super().__init__(ctx, source)
-        self.add_item(ScheduleSelect(ctx.user, soup, query))
+        self.add_item(ScheduleSelect(ctx.user, schedules, query))
 
 
 class ScheduleSelect(discord.ui.Select[SchedulePages]):
-    def __init__(self, author: discord.User | discord.Member, soup: BeautifulSoup, query: str | None = None) -> None:
+    def __init__(
+        self,
+        author: discord.User | discord.Member,
+        schedules: dict[ScheduleModeEnum, list[Match]],
+        query: str | None = None,
+    ) -> None:
         super().__init__(options=SELECT_OPTIONS, placeholder="\N{SPIRAL CALENDAR PAD} Select schedule category")
         self.query: str | None = query
-        self.soup: BeautifulSoup = soup
+        self.schedules: dict[ScheduleModeEnum, list[Match]] = schedules
         self.author: discord.User | discord.Member = author
 
     @override
     async def callback(self, interaction: discord.Interaction[AluBot]) -> None:
         sch_enum = ScheduleModeEnum(value=int(self.values[0]))
-        p = SchedulePages(interaction, self.soup, sch_enum, self.query)
+        p = SchedulePages(interaction, self.schedules, sch_enum, self.query)
         await p.start(edit_response=True)
 
     @override
@@ -268,7 +369,7 @@ class ScheduleSelect(discord.ui.Select[SchedulePages]):
         if interaction.user and interaction.user.id == self.author.id:
             return True
         schedule_enum = ScheduleModeEnum(value=int(self.values[0]))
-        p = SchedulePages(interaction, self.soup, schedule_enum, self.query)
+        p = SchedulePages(interaction, self.schedules, schedule_enum, self.query)
         await p.start(ephemeral=True)
         return False
 
@@ -281,15 +382,7 @@ class Schedule(InfoCog, name="Schedules", emote=const.Emote.DankMadgeThreat):
 
     def __init__(self, bot: AluBot, *args: Any, **kwargs: Any) -> None:
         super().__init__(bot, *args, **kwargs)
-        self.soup_cache: MutableMapping[str, BeautifulSoup] = cache.ExpiringCache(seconds=1800.0)  # 30 minutes
-
-    async def get_soup(self, key: str) -> BeautifulSoup:
-        if soup := self.soup_cache.get(key):
-            return soup
-        async with self.bot.session.get(MATCHES_URL) as r:
-            soup = BeautifulSoup(await r.read(), "html.parser")
-            self.soup_cache[key] = soup
-            return soup
+        self.page_cache: ScrapedPageCache = ScrapedPageCache(bot, ttl=1800.0)  # 30 minutes
 
     @app_commands.command()
     @app_commands.allowed_installs(guilds=True, users=True)
@@ -313,9 +406,9 @@ class Schedule(InfoCog, name="Schedules", emote=const.Emote.DankMadgeThreat):
 
         """
         await interaction.response.defer()
-        soup = await self.get_soup("dota2")
+        schedules = await self.page_cache.get(MATCHES_URL, parse_schedules)
         schedule_enum = ScheduleModeEnum(value=schedule_mode)
-        p = SchedulePages(interaction, soup, schedule_enum, query)
+        p = SchedulePages(interaction, schedules, schedule_enum, query)
         await p.start()
 
     @app_commands.command()
@@ -325,47 +418,25 @@ class Schedule(InfoCog, name="Schedules", emote=const.Emote.DankMadgeThreat):
     ) -> None:
         """Get football fixtures."""
         url = "https://onefootball.com/en/competition/premier-league-9/fixtures"
-        async with self.bot.session.get(url) as r:
-            soup = BeautifulSoup(await r.read(), "html.parser")
-            fixtures = soup.find("of-match-cards-list")
-            if fixtures:
-                # game_week = fixtures.find('h3', attrs={'class': 'section-header__subtitle'})  # noqa: ERA001
-                # print(game_week.text)  # noqa: ERA001
-                matches = fixtures.findAll("li", attrs={"class": "simple-match-cards-list__match-card"})  # type:ignore[reportAttributeAccessIssue]
-                match_strings = []
-                for match in matches:
-                    team_content = match.findAll(
-                        "of-simple-match-card-team",
-                        attrs={"class": "simple-match-card__team-content"},
-                    )
-                    team1 = team_content[0].find("span", attrs={"class": "simple-match-card-team__name"}).text
-                    team2 = team_content[1].find("span", attrs={"class": "simple-match-card-team__name"}).text
-                    pre_match_data = match.find("span", attrs={"class": "simple-match-card__pre-match"})
-                    if pre_match_data is not None:
-                        match_time = match.find("span", attrs={"class": "simple-match-card__pre-match"}).find("time")[
-                            "datetime"
-                        ]
-                        dt = datetime.datetime.strptime(match_time, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=datetime.UTC)
-                        teams = f"{team1} - {team2}".ljust(40, " ")
-                        match_strings.append(f"`{teams}` {fmt.format_dt_tdR(dt)}")
-
-                embed = discord.Embed(
-                    color=0xE0FA51,
-                    title="Premier League Fixtures",
-                    url=url,
-                    description="\n".join(match_strings),
-                ).set_author(
-                    name="Info from onefootball.com",
-                    url=url,
-                    icon_url="https://i.imgur.com/pm2JgEW.jpg",
-                )
-                await interaction.response.send_message(embed=embed)
-            else:
-                embed = discord.Embed(
-                    color=const.Color.error,
-                    description="No matches found",
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+        fixtures = await self.page_cache.get(url, parse_fixtures)
+        if fixtures is not None:
+            embed = discord.Embed(
+                color=0xE0FA51,
+                title="Premier League Fixtures",
+                url=url,
+                description="\n".join(f"`{teams.ljust(40, ' ')}` {fmt.format_dt_tdR(dt)}" for teams, dt in fixtures),
+            ).set_author(
+                name="Info from onefootball.com",
+                url=url,
+                icon_url="https://i.imgur.com/pm2JgEW.jpg",
+            )
+            await interaction.response.send_message(embed=embed)
+        else:
+            embed = discord.Embed(
+                color=const.Color.error,
+                description="No matches found",
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
 async def setup(bot: AluBot) -> None:
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+import asyncio
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, override
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 from gtts import gTTS
 
-from utils import const, errors
+from utils import cache, const, errors
 
 from ._base import VoiceChatCog
 
@@ -34,6 +36,16 @@ class LanguageCollection:
     Literal = Literal["fr", "en", "ru", "es", "pt", "cn", "uk"]
 
 
+def synthesize(text: str, lang: LanguageData) -> bytes:
+    """Synthesize speech into in-memory mp3 bytes.
+
+    This is blocking (gTTS requests Google with `requests`) so it should be run in a worker thread.
+    """
+    buffer = BytesIO()
+    gTTS(text, lang=lang.lang, tld=lang.tld).write_to_fp(buffer)
+    return buffer.getvalue()
+
+
 class TextToSpeech(VoiceChatCog, name="Text To Speech", emote=const.Emote.Ree):
     """Text To Speech commands.
 
@@ -43,6 +55,16 @@ class TextToSpeech(VoiceChatCog, name="Text To Speech", emote=const.Emote.Ree):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.connections: dict[int, discord.VoiceClient] = {}  # guild.id to Voice we are connected to
+        # popular phrases (i.e. "Bonjour !") are synthesized only once
+        self.phrase_cache: cache.ResponseCache[bytes] = cache.ResponseCache(maxsize=128, ttl=86400.0)
+        # each guild has its own playback queue and player task, so guilds don't wait for or interrupt each other
+        self.playback_queues: dict[int, asyncio.Queue[tuple[str, LanguageData]]] = {}
+        self.players: dict[int, asyncio.Task[None]] = {}
+
+    @override
+    async def cog_unload(self) -> None:
+        for player in self.players.values():
+            player.cancel()
 
     tts_group = app_commands.Group(
         name="text-to-speech",
@@ -66,8 +88,8 @@ class TextToSpeech(VoiceChatCog, name="Text To Speech", emote=const.Emote.Ree):
         assert interaction.guild
         voice_client = interaction.guild.voice_client
         if voice_client is not None:
-            vc = self.connections[interaction.guild.id]
             assert isinstance(voice_client, discord.VoiceClient)
+            vc = self.connections[interaction.guild.id] = voice_client
             await voice_client.move_to(voice_state.channel)
         else:
             if not voice_state.channel:
@@ -78,10 +100,44 @@ class TextToSpeech(VoiceChatCog, name="Text To Speech", emote=const.Emote.Ree):
 
         assert isinstance(vc, discord.VoiceClient)
 
-        tts = gTTS(text, lang=lang.lang, tld=lang.tld)
-        audio_name = ".alubot/audio.mp3"
-        tts.save(audio_name)
-        vc.play(discord.FFmpegPCMAudio(audio_name))
+        guild_id = interaction.guild.id
+        self.playback_queues.setdefault(guild_id, asyncio.Queue()).put_nowait((text, lang))
+        player = self.players.get(guild_id)
+        if player is None or player.done():
+            self.players[guild_id] = asyncio.create_task(self.player(guild_id))
+
+    async def player(self, guild_id: int) -> None:
+        """Play queued Text-To-Speech requests in the guild one after another."""
+        queue = self.playback_queues[guild_id]
+        while True:
+            text, lang = await queue.get()
+            vc = self.connections.get(guild_id)
+            if vc is None or not vc.is_connected():
+                continue
+
+            try:
+                audio = await self.phrase_cache.get_or_fetch(
+                    f"{lang.code}:{text}",
+                    lambda text=text, lang=lang: asyncio.to_thread(synthesize, text, lang),
+                )
+            except Exception as exc:  # noqa: BLE001
+                embed = discord.Embed(description=f"Failed to synthesize Text-To-Speech in guild `{guild_id}`.")
+                await self.bot.exc_manager.register_error(exc, embed=embed)
+                continue
+
+            finished = asyncio.Event()
+            try:
+                vc.play(
+                    discord.FFmpegPCMAudio(BytesIO(audio), pipe=True),
+                    after=lambda _error, finished=finished: self.bot.loop.call_soon_threadsafe(finished.set),
+                )
+            except discord.ClientException as exc:
+                # voice client got disconnected (or started playing something else) since the check above;
+                # the player task must survive it, otherwise the rest of the queue is never played
+                embed = discord.Embed(description=f"Failed to play Text-To-Speech in guild `{guild_id}`.")
+                await self.bot.exc_manager.register_error(exc, embed=embed)
+                continue
+            await finished.wait()
 
     @tts_group.command(name="speak")
     @app_commands.describe()
@@ -141,7 +197,7 @@ class TextToSpeech(VoiceChatCog, name="Text To Speech", emote=const.Emote.Ree):
             msg = "I'm not in a voice channel."
             raise errors.ErroneousUsage(msg) from None
 
-        await vc.disconnect()
+        await self.disconnect(interaction.guild.id)
         embed = discord.Embed(description=f"I left {vc.channel.mention}", color=interaction.user.color)
         await interaction.response.send_message(embed=embed)
 
@@ -159,9 +215,15 @@ class TextToSpeech(VoiceChatCog, name="Text To Speech", emote=const.Emote.Ree):
         _after: discord.VoiceState,
     ) -> None:
         if before.channel is not None and len([m for m in before.channel.members if not m.bot]) == 0:
-            vc = self.connections.get(member.guild.id, None)
-            if vc is not None:
-                await vc.disconnect()
+            await self.disconnect(member.guild.id)
+
+    async def disconnect(self, guild_id: int) -> None:
+        """Disconnect from the voice channel in the guild and drop its playback queue."""
+        if player := self.players.pop(guild_id, None):
+            player.cancel()
+        self.playback_queues.pop(guild_id, None)
+        if vc := self.connections.pop(guild_id, None):
+            await vc.disconnect()
 
 
 async def setup(bot: AluBot) -> None:
@@ -9,4 +9,19 @@ CREATE TABLE IF NOT EXISTS alubot_ttv_tokens (
     user_id TEXT PRIMARY KEY, 
     token TEXT NOT NULL, 
     refresh TEXT NOT NULL
-);
\ No newline at end of file
+);
+
+-- Hashes of the last synced application commands payloads, so (auto-)syncs can skip unchanged scopes.
+-- `guild_id = 0` stands for the global scope.
+CREATE TABLE IF NOT EXISTS app_command_sync (
+    application_id BIGINT NOT NULL,
+    guild_id BIGINT NOT NULL,
+    payload_hash TEXT NOT NULL,
+    PRIMARY KEY (application_id, guild_id)
+);
+
+-- Channels that opted in for counting word frequencies for `/wordcloud` (only counters in memory, not messages).
+CREATE TABLE IF NOT EXISTS wordcloud_channels (
+    channel_id BIGINT PRIMARY KEY,
+    guild_id BIGINT NOT NULL
+);
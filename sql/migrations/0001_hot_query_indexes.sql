@@ -0,0 +1,29 @@
+-- Indexes supporting hot queries which previously could only use primary keys (or nothing at all).
+
+-- FPC: accounts are looked up by their player and by their friend id in the notification loops.
+CREATE INDEX IF NOT EXISTS dota_accounts_player_id_idx ON dota_accounts (player_id);
+CREATE INDEX IF NOT EXISTS dota_accounts_friend_id_idx ON dota_accounts (friend_id);
+CREATE INDEX IF NOT EXISTS lol_accounts_player_id_idx ON lol_accounts (player_id);
+
+-- FPC: notification messages are edited/deleted by their match (and friend for dota).
+CREATE INDEX IF NOT EXISTS dota_messages_match_id_friend_id_idx ON dota_messages (match_id, friend_id);
+CREATE INDEX IF NOT EXISTS lol_messages_match_id_idx ON lol_messages (match_id);
+
+-- FPC: players lists are keyset-paginated by case-insensitive display name.
+CREATE INDEX IF NOT EXISTS dota_players_sort_name_idx ON dota_players (lower(display_name), player_id);
+CREATE INDEX IF NOT EXISTS lol_players_sort_name_idx ON lol_players (lower(display_name), player_id);
+
+-- Community: rank is `count(*) WHERE exp > $1` and leaderboard sorts by exp.
+CREATE INDEX IF NOT EXISTS community_members_exp_idx ON community_members (exp DESC);
+CREATE INDEX IF NOT EXISTS community_members_last_seen_idx ON community_members (last_seen);
+
+-- Webhooks are fetched/cleaned up by channel and guild.
+CREATE INDEX IF NOT EXISTS webhooks_channel_id_idx ON webhooks (channel_id);
+CREATE INDEX IF NOT EXISTS webhooks_guild_id_idx ON webhooks (guild_id);
+
+-- Timers: the dispatcher picks the closest timer `ORDER BY expires_at LIMIT 1`.
+CREATE INDEX IF NOT EXISTS timers_expires_at_idx ON timers (expires_at);
+-- Timers: `TimerManager.get_by_kwargs/delete`, reminders and birthdays filter by event and jsonb `data` keys.
+-- Note that the expressions must match the queries, i.e. `data #>> '{author_id}'`.
+CREATE INDEX IF NOT EXISTS timers_event_author_id_idx ON timers (event, (data #>> '{author_id}'));
+CREATE INDEX IF NOT EXISTS timers_event_user_id_idx ON timers (event, (data #>> '{user_id}'));
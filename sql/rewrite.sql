@@ -1,6 +1,6 @@
 CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
-CREATE TABLE auto_sync (
+CREATE TABLE auto_sync ( --deprecated: replaced by `app_command_sync` in bot.sql
     guild_id BIGINT, 
     payload JSONB
 );
@@ -86,6 +86,21 @@ CREATE TABLE IF NOT EXISTS valve_devs (
     login TEXT PRIMARY KEY
 );
 
+-- Incremental polling state for the bugtracker news worker.
+-- `etag` belongs to the "most recently updated issue" request, `last_event_id` is the newest processed issue event.
+CREATE TABLE IF NOT EXISTS bugtracker_cursor (
+    repo TEXT PRIMARY KEY,
+    etag TEXT,
+    last_event_id BIGINT
+);
+
+-- Snapshots of pulsefire rate limiters state so restarts don't burst into 429s, see `utils/ratelimiters.py`.
+CREATE TABLE IF NOT EXISTS rate_limiter_states (
+    name TEXT PRIMARY KEY,
+    state JSONB NOT NULL,
+    saved_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
 CREATE TABLE IF NOT EXISTS autoparse (
     steam_id BIGINT PRIMARY KEY
 );
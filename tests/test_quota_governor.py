@@ -0,0 +1,74 @@
+"""Check `QuotaGovernor` daily window and pacing assumptions.
+
+Neither OpenDota nor Stratz send the reset time of their daily quota,
+so the governor assumes a fixed window resetting at midnight UTC until it observes the reset itself.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pulsefire")
+
+from utils import errors
+from utils.dota.pulsefire_clients import SECONDS_IN_DAY, QuotaGovernor, QuotaPriority
+
+MIDNIGHT = 1_700_006_400.0  # 2023-11-15 00:00:00 UTC
+HOUR = 60 * 60
+
+
+def test_window_defaults_to_midnight_utc() -> None:
+    """Without an observed reset the daily window starts at midnight UTC."""
+    governor = QuotaGovernor(daily_limit=10_000)
+    assert governor.day_progress(MIDNIGHT + 6 * HOUR) == (6 * HOUR, SECONDS_IN_DAY - 6 * HOUR)
+    assert governor.window_start(MIDNIGHT + 6 * HOUR) == MIDNIGHT
+
+
+def test_observed_reset_anchors_window() -> None:
+    """`remaining` jumping up means the quota was reset right then."""
+    governor = QuotaGovernor(daily_limit=10_000)
+    governor.update(daily_limit=10_000, remaining=300, now=MIDNIGHT + 5 * HOUR)
+    # small drift between our own bookkeeping and the headers is not a reset
+    governor.update(daily_limit=10_000, remaining=320, now=MIDNIGHT + 5 * HOUR + 10)
+    assert governor.reset_offset == pytest.approx(0.0)
+
+    governor.update(daily_limit=10_000, remaining=9_999, now=MIDNIGHT + 7 * HOUR)
+    assert governor.reset_offset == 7 * HOUR
+    assert governor.window_start(MIDNIGHT + 8 * HOUR) == MIDNIGHT + 7 * HOUR
+    assert governor.window_start(MIDNIGHT + 6 * HOUR) == MIDNIGHT - 17 * HOUR
+
+
+def test_full_speed_while_projection_fits() -> None:
+    """Requests are not delayed while the projected daily usage fits into the limit."""
+    governor = QuotaGovernor(daily_limit=10_000)
+    governor.update(daily_limit=10_000, remaining=9_000, now=MIDNIGHT + 12 * HOUR)
+    for priority in QuotaPriority:
+        assert governor.delay(priority, MIDNIGHT + 12 * HOUR) == pytest.approx(0.0)
+
+
+def test_pacing_clock_is_shared_between_priorities() -> None:
+    """A request of any priority pushes back the next request of every priority."""
+    governor = QuotaGovernor(daily_limit=10_000)
+    now = MIDNIGHT + 12 * HOUR
+    # 8k spent in half a day projects to 16k - pacing is on
+    governor.update(daily_limit=10_000, remaining=2_000, now=now)
+
+    governor.consume(now)
+    notifications = governor.delay(QuotaPriority.Notifications, now)
+    storage = governor.delay(QuotaPriority.Storage, now)
+    assert 0 < notifications < storage
+
+    # once the notifications interval passed, the next request of the same priority books the clock again
+    later = now + notifications
+    assert governor.delay(QuotaPriority.Notifications, later) == pytest.approx(0.0)
+    governor.consume(later)
+    assert governor.delay(QuotaPriority.Storage, later) > 0.0
+
+
+def test_reserve_refuses_less_important_requests() -> None:
+    """Only Notifications can touch the reserved part of the quota."""
+    governor = QuotaGovernor(daily_limit=10_000)
+    governor.update(daily_limit=10_000, remaining=500, now=MIDNIGHT + 20 * HOUR)
+    assert governor.delay(QuotaPriority.Notifications, MIDNIGHT + 20 * HOUR) >= 0.0
+    with pytest.raises(errors.QuotaExhausted):
+        governor.delay(QuotaPriority.Command, MIDNIGHT + 20 * HOUR)
@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 __all__ = ("Config",)
 
@@ -8,9 +8,19 @@ class Discord(TypedDict):
     YENBOT: str
 
 
+class PostgresPool(TypedDict, total=False):
+    MIN_SIZE: int
+    MAX_SIZE: int
+    MAX_INACTIVE_CONNECTION_LIFETIME: float
+    COMMAND_TIMEOUT: float
+    STATEMENT_CACHE_SIZE: int
+    PGBOUNCER: bool
+
+
 class Postgres(TypedDict):
     VPS: str
     HOME: str
+    POOL: NotRequired[PostgresPool]
 
 
 class SteamAccount(TypedDict):
@@ -4,6 +4,7 @@ import asyncio
 import enum
 import logging
 import time
+from collections import OrderedDict
 from functools import wraps
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar, override
 
@@ -89,6 +90,89 @@ class ExpiringCache(dict[Any, Any]):
         return ((x[0], x[1][0]) for x in super().items())  # map(lambda x: (x[0], x[1][0]), super().items())
 
 
+class ResponseCache[V]:
+    """Bounded TTL cache for upstream responses with single-flight coalescing.
+
+    Concurrent lookups for the same key share one upstream request.
+    Exceptions are not cached, so a failed lookup is retried on the next call.
+    Thus `fetch` callables should raise on upstream failures (i.e. 429 or 5xx statuses)
+    instead of returning an "empty" result, otherwise that result is served for the whole `ttl`.
+
+    Attributes
+    ----------
+    maxsize: int
+        Maximum amount of cached responses. The least recently used ones are evicted first.
+    ttl: float
+        For how many seconds a response is considered fresh.
+    hits: int
+        Amount of lookups answered from the cache (including the ones joined to an in-flight request).
+    misses: int
+        Amount of lookups that required an upstream request.
+
+    """
+
+    def __init__(self, *, maxsize: int = 256, ttl: float = 3600.0) -> None:
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._data: OrderedDict[str, tuple[V, float]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task[V]] = {}
+
+    @override
+    def __repr__(self) -> str:
+        hits, misses = self.get_stats()
+        return f"<{self.__class__.__name__} size={len(self._data)}/{self.maxsize} hits={hits} misses={misses}>"
+
+    @staticmethod
+    def normalize_key(*parts: str) -> str:
+        """Normalise a query so trivially different spellings share a cache entry."""
+        return "\x1f".join(" ".join(part.split()).casefold() for part in parts)
+
+    def get_stats(self) -> tuple[int, int]:
+        """Get `(hits, misses)` tuple, same as `lru.LRU.get_stats`."""
+        return self.hits, self.misses
+
+    def get(self, key: str) -> V | None:
+        """Get a fresh cached response without requesting upstream."""
+        try:
+            value, created_at = self._data[key]
+        except KeyError:
+            return None
+        if time.monotonic() - created_at > self.ttl:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Coroutine[Any, Any, V]]) -> V:
+        """Get cached response for the key or request it with `fetch`, coalescing concurrent identical lookups."""
+        entry = self._data.get(key)
+        if entry is not None and time.monotonic() - entry[1] <= self.ttl:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            task = self._in_flight[key] = asyncio.create_task(fetch())
+
+            def done(task: asyncio.Task[V]) -> None:
+                self._in_flight.pop(key, None)
+                if not task.cancelled() and task.exception() is None:
+                    self._data[key] = (task.result(), time.monotonic())
+                    self._data.move_to_end(key)
+                    while len(self._data) > self.maxsize:
+                        self._data.popitem(last=False)
+
+            task.add_done_callback(done)
+        # shield so one cancelled waiter doesn't cancel the request for everybody else
+        return await asyncio.shield(task)
+
+
 class Strategy(enum.Enum):
     lru = 1
     raw = 2
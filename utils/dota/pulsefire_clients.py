@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import collections
+import enum
+import logging
 import random
 import time
-from typing import TYPE_CHECKING, Any, override
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, override
 
 import aiohttp
 import orjson
+from multidict import CIMultiDict
 from pulsefire.clients import BaseClient
 from pulsefire.middlewares import http_error_middleware, json_response_middleware, rate_limiter_middleware
 from pulsefire.ratelimiters import BaseRateLimiter
@@ -23,7 +28,7 @@ except ImportError:
     from utils import errors
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Callable, Mapping, Sequence
 
     from pulsefire.invocation import Invocation
 
@@ -32,29 +37,180 @@ if TYPE_CHECKING:
 __all__ = (
     "OpenDotaClient",
     "OpenDotaConstantsClient",
+    "QuotaGovernor",
+    "QuotaPriority",
     "SteamWebAPIClient",
     "StratzClient",
 )
 
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
 type HeaderRateLimitInfo = Mapping[str, Sequence[tuple[int, int]]]
 
+SECONDS_IN_DAY = 60 * 60 * 24
+
+
+class QuotaPriority(enum.IntEnum):
+    """Priority of a request in regards to the daily quota of an API.
+
+    The lower the value - the more important the request is.
+    Clients methods accept it as `priority` keyword argument.
+    """
+
+    Notifications = 0
+    Storage = 1
+    Command = 2
+
+
+class QuotaGovernor:
+    """Spreads the daily quota of an API over the whole day.
+
+    The daily consumption is projected from the usage so far. While the projection fits into the daily limit,
+    requests go at full speed. Otherwise, requests are paced so the remaining quota lasts until the daily reset.
+    Less important requests have a part of the quota reserved away from them, so they are slowed down first
+    and refused once only the reserve is left.
+
+    Attributes
+    ----------
+    daily_limit: int
+        Amount of requests allowed per day.
+    remaining: int | None
+        Amount of requests left for today according to the latest response headers. `None` if unknown yet.
+    reset_offset: float
+        Seconds after midnight UTC when the daily window resets.
+
+    Notes
+    -----
+    * Neither OpenDota nor Stratz send the reset time in their headers - only the remaining daily amount.
+        So the daily window is assumed to be fixed (not rolling) and to reset at midnight UTC
+        until a reset is observed, i.e. `X-RateLimit-Remaining-Day` jumps up between two responses.
+        Then the window is anchored at the moment of that jump instead.
+    * All priorities share one pacing clock so spending at once doesn't multiply the paced rate.
+    """
+
+    RESERVES: ClassVar[Mapping[QuotaPriority, float]] = {
+        QuotaPriority.Notifications: 0.0,
+        QuotaPriority.Storage: 0.1,
+        QuotaPriority.Command: 0.25,
+    }
+    """Fraction of the daily limit that a request of the priority is not allowed to touch."""
+
+    RESET_JUMP_FRACTION: ClassVar[float] = 0.05
+    """`remaining` going up by more than this fraction of the daily limit means the daily window was reset."""
+
+    __slots__: tuple[str, ...] = ("_last_request", "daily_limit", "remaining", "reset_offset")
+
+    def __init__(self, daily_limit: int) -> None:
+        self.daily_limit: int = daily_limit
+        self.remaining: int | None = None
+        self.reset_offset: float = 0.0
+        self._last_request: float = 0.0
+
+    @override
+    def __repr__(self) -> str:
+        return f"<QuotaGovernor remaining={self.remaining} daily_limit={self.daily_limit}>"
+
+    def day_progress(self, now: float) -> tuple[float, float]:
+        """Seconds passed since and left until the daily reset."""
+        passed = (now - self.reset_offset) % SECONDS_IN_DAY
+        return passed, SECONDS_IN_DAY - passed
+
+    def window_start(self, now: float) -> float:
+        """Timestamp when the current daily window started."""
+        passed, _ = self.day_progress(now)
+        return now - passed
+
+    def update(self, *, daily_limit: int, remaining: int, now: float | None = None) -> None:
+        """Update the quota numbers from the response headers."""
+        now = time.time() if now is None else now
+        if self.remaining is not None and remaining - self.remaining > daily_limit * self.RESET_JUMP_FRACTION:
+            self.reset_offset = now % SECONDS_IN_DAY
+            self._last_request = 0.0
+            log.info(
+                "Observed the daily quota reset (%s -> %s), anchoring the window at it.", self.remaining, remaining
+            )
+        self.daily_limit = daily_limit
+        self.remaining = remaining
+
+    def projected_usage(self, now: float) -> float:
+        """Amount of requests that will be spent by the end of the day if we keep the current pace."""
+        if self.remaining is None:
+            return 0.0
+        passed, _ = self.day_progress(now)
+        spent = self.daily_limit - self.remaining
+        # a minute of minimum so a couple of requests right after the reset don't look like a disaster
+        return spent * SECONDS_IN_DAY / max(passed, 60)
+
+    def delay(self, priority: QuotaPriority, now: float) -> float:
+        """Get for how long a request of the given priority should wait to fit into the daily budget.
+
+        Raises
+        ------
+        errors.QuotaExhausted
+            Only the quota reserved for more important requests is left.
+        """
+        if self.remaining is None:
+            return 0.0
+
+        reserve = self.daily_limit * self.RESERVES[priority]
+        if self.projected_usage(now) <= self.daily_limit - reserve:
+            return 0.0
+
+        usable = self.remaining - reserve
+        if usable <= 0:
+            if priority is QuotaPriority.Notifications:
+                # nothing to reserve for - the rate limiter itself waits for the daily window to reset
+                return 0.0
+            msg = f"Daily API quota left ({self.remaining}/{self.daily_limit}) is reserved for more important requests."
+            raise errors.QuotaExhausted(msg)
+
+        # the pacing clock is shared: the interval counts from the latest request of any priority
+        _, left = self.day_progress(now)
+        return max(self._last_request + left / usable - now, 0.0)
+
+    def consume(self, now: float) -> None:
+        """Tick the shared pacing clock after a request of any priority was let through."""
+        if self.remaining is None:
+            return
+        self._last_request = now
+        self.remaining = max(self.remaining - 1, 0)
+
+    @property
+    def status_string(self) -> str:
+        """Human-readable summary of the quota state."""
+        if self.remaining is None:
+            return "Not Set Yet"
+        return (
+            f"Remaining: {self.remaining}/{self.daily_limit}\n"
+            f"Projected usage: {self.projected_usage(time.time()):.0f}/{self.daily_limit}"
+        )
+
 
 class DotaAPIsRateLimiter(BaseRateLimiter):
     """Dota 2 APIs rate limiter.
 
     This rate limiter can be served stand-alone for centralized rate limiting.
+    On top of the per-window limits from the headers, the `governor` paces requests by their `priority`
+    so the daily quota doesn't run dry before the end of the day.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, daily_limit: int) -> None:
         self._track_syncs: dict[str, tuple[float, list[Any]]] = {}
         self.rate_limits_string: str = "Not Set Yet"
         self.rate_limits_ratio: float = 1.0
+        self.governor: QuotaGovernor = QuotaGovernor(daily_limit)
+        self.last_headers: dict[str, str] | None = None
         self._index: dict[tuple[str, int, Any, Any, Any], tuple[int, int, float, float, float]] = (
             collections.defaultdict(lambda: (0, 0, 0, 0, 0))
         )
 
     @override
     async def acquire(self, invocation: Invocation) -> float:
+        priority: QuotaPriority = invocation.params.get("priority", QuotaPriority.Command)
+        if (governor_wait := self.governor.delay(priority, time.time())) > 0:
+            return governor_wait
+
         wait_for = 0
         pinging_targets = []
         requesting_targets = []
@@ -82,6 +238,7 @@ class DotaAPIsRateLimiter(BaseRateLimiter):
             for requesting_target in requesting_targets:
                 count, *values = self._index[requesting_target]
                 self._index[requesting_target] = (count + 1, *values)  # type: ignore[reportArgumentType]
+            self.governor.consume(request_time)
 
         return wait_for
 
@@ -103,6 +260,7 @@ class DotaAPIsRateLimiter(BaseRateLimiter):
             for pinging_target in pinging_targets:  # type: ignore[reportArgumentType]
                 self._index[pinging_target] = (0, 0, 0, 0, 0)
             return
+        self.last_headers = {key: value for key, value in headers.items() if key.lower().startswith("x-rate")}
         for scope, idx, *subscopes in pinging_targets:  # type: ignore[reportArgumentType]
             if idx >= len(header_limits[scope]):
                 self._index[scope, idx, *subscopes] = (0, 10**10, response_time + 3600, 0, 0)
@@ -118,6 +276,16 @@ class DotaAPIsRateLimiter(BaseRateLimiter):
     def analyze_headers(self, headers: dict[str, str]) -> tuple[HeaderRateLimitInfo, HeaderRateLimitInfo]:
         raise NotImplementedError
 
+    def restore_headers(self, headers: dict[str, str]) -> None:
+        """Re-analyze rate limit headers saved before the restart, see `utils/ratelimiters.py`."""
+        # aiohttp headers are case-insensitive and the saved ones are a plain dict
+        self.analyze_headers(CIMultiDict(headers))  # type: ignore[reportArgumentType]
+        self.last_headers = headers
+
+    def window_start(self, now: float) -> float:
+        """Timestamp when the current daily quota window started, see `utils/ratelimiters.py`."""
+        return self.governor.window_start(now)
+
 
 class OpenDotaAPIRateLimiter(DotaAPIsRateLimiter):
     @override
@@ -126,6 +294,7 @@ class OpenDotaAPIRateLimiter(DotaAPIsRateLimiter):
             [f"{timeframe}: {headers[f'X-Rate-Limit-Remaining-{timeframe}']}" for timeframe in ("Minute", "Day")],
         )
         self.rate_limits_ratio = int(headers["X-Rate-Limit-Remaining-Day"]) / 2000
+        self.governor.update(daily_limit=2000, remaining=int(headers["X-Rate-Limit-Remaining-Day"]))
 
         header_limits = {
             "app": [(60, 60), (2000, 60 * 60 * 24)],
@@ -143,7 +312,7 @@ class OpenDotaClient(BaseClient):
     """Pulsefire client for OpenDota API."""
 
     def __init__(self) -> None:
-        self.rate_limiter = OpenDotaAPIRateLimiter()
+        self.rate_limiter = OpenDotaAPIRateLimiter(daily_limit=2000)
         super().__init__(
             base_url="https://api.opendota.com/api",
             default_params={},
@@ -156,11 +325,15 @@ class OpenDotaClient(BaseClient):
             ],
         )
 
-    async def get_match(self, *, match_id: int) -> opendota.MatchResponse:
+    async def get_match(
+        self, *, match_id: int, priority: QuotaPriority = QuotaPriority.Command
+    ) -> opendota.MatchResponse:
         """GET matches/{match_id}."""
         return await self.invoke("GET", f"/matches/{match_id}")  # type: ignore[reportReturnType]
 
-    async def request_parse(self, *, match_id: int) -> opendota.ParseResponse:
+    async def request_parse(
+        self, *, match_id: int, priority: QuotaPriority = QuotaPriority.Command
+    ) -> opendota.ParseResponse:
         """POST /request/{match_id}."""
         return await self.invoke("POST", f"/request/{match_id}")  # type: ignore[reportReturnType]
 
@@ -170,9 +343,16 @@ class OpenDotaConstantsClient(BaseClient):
 
     This client works with odota/dotaconstants repository.
     https://github.com/odota/dotaconstants
+
+    The constants are megabytes of JSON that only change on patches, so besides the plain `get_*` methods
+    there are projected ones that keep an on-disk copy, request it with `If-None-Match`
+    and parse it off-loop into a compact projection only when the content actually changed.
     """
 
+    CACHE_DIR: ClassVar[Path] = Path(".temp/odota_constants")
+
     def __init__(self) -> None:
+        self._projections: dict[str, tuple[str | None, Any]] = {}
         super().__init__(
             # could use `https://api.opendota.com/api/constants` but sometimes they update the repo first
             # and forget to update the site backend x_x
@@ -221,6 +401,106 @@ class OpenDotaConstantsClient(BaseClient):
         """
         return await self.invoke("GET", "/items.json")  # type: ignore[reportReturnType]
 
+    def _cache_paths(self, filename: str) -> tuple[Path, Path]:
+        """Get paths of the on-disk copy of `filename` and of its ETag."""
+        body_path = self.CACHE_DIR / filename
+        return body_path, body_path.with_suffix(".etag")
+
+    async def _download(self, filename: str, etag: str | None) -> tuple[bytes | None, str | None]:
+        """Download `filename` unless it still matches `etag`.
+
+        Returns
+        -------
+        tuple[bytes | None, str | None]
+            Body (`None` on 304 Not Modified) and its ETag.
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        assert self.session is not None  # the client is entered in `DotaClient.start_helpers`
+        async with self.session.get(f"{self.base_url}/{filename}", headers=headers) as response:
+            if response.status == 304:
+                return None, etag
+            response.raise_for_status()
+            return await response.read(), response.headers.get("ETag")
+
+    def _save(self, filename: str, body: bytes, etag: str | None) -> None:
+        """Save the on-disk copy of `filename`. This is blocking.
+
+        Both files are replaced atomically and the ETag is written only once the body is in place,
+        so an interrupted save never leaves an ETag describing some other (or half-written) body.
+        """
+        body_path, etag_path = self._cache_paths(filename)
+        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        etag_path.unlink(missing_ok=True)
+        temp_path = body_path.with_name(f"{body_path.name}.tmp")
+        temp_path.write_bytes(body)
+        temp_path.replace(body_path)
+        if etag:
+            temp_path.write_text(etag, "utf-8")
+            temp_path.replace(etag_path)
+
+    def _discard(self, filename: str) -> None:
+        """Delete the on-disk copy of `filename` together with its ETag. This is blocking."""
+        for path in self._cache_paths(filename):
+            path.unlink(missing_ok=True)
+
+    async def _project[T](self, filename: str, body: bytes, etag: str | None, projection: Callable[[Any], T]) -> T:
+        """Parse `body` into a projection off-loop and remember it."""
+        projected = await asyncio.to_thread(lambda: projection(orjson.loads(body)))
+        self._projections[filename] = (etag, projected)
+        log.info("OpenDota constants `%s` are parsed (%s bytes).", filename, len(body))
+        return projected
+
+    async def get_projected[T](self, filename: str, projection: Callable[[Any], T]) -> T:
+        """Get a compact projection of `filename` constants, re-parsing the file only if it changed.
+
+        Parameters
+        ----------
+        filename: str
+            Name of the file in the build folder, i.e. `"abilities.json"`.
+        projection: Callable[[Any], T]
+            Function to pick only the needed fields out of the parsed JSON. It runs in a thread.
+        """
+        body_path, etag_path = self._cache_paths(filename)
+
+        etag, projected = self._projections.get(filename, (None, None))
+        if etag is None and body_path.exists() and etag_path.exists():
+            etag = etag_path.read_text("utf-8")
+
+        body, etag = await self._download(filename, etag)
+        if body is None:
+            if filename in self._projections:
+                log.debug("OpenDota constants `%s` are not modified.", filename)
+                return projected
+
+            try:
+                body = await asyncio.to_thread(body_path.read_bytes)
+                return await self._project(filename, body, etag, projection)
+            except (OSError, orjson.JSONDecodeError) as exc:
+                # the on-disk copy is missing or corrupted while its ETag still matches - start from scratch
+                log.warning("OpenDota constants `%s` on disk are unusable, downloading again: %r", filename, exc)
+                await asyncio.to_thread(self._discard, filename)
+                body, etag = await self._download(filename, None)
+                assert body is not None  # 304 can't happen without `If-None-Match`
+
+        await asyncio.to_thread(self._save, filename, body, etag)
+        return await self._project(filename, body, etag, projection)
+
+    async def get_ability_display_names(self) -> dict[str, str]:
+        """Get `abilities.json` projected to `ability_name -> display name` mapping."""
+
+        def projection(abilities: odota_constants.GetAbilitiesResponse) -> dict[str, str]:
+            return {name: ability.get("dname", "unknown") for name, ability in abilities.items()}
+
+        return await self.get_projected("abilities.json", projection)
+
+    async def get_facet_titles(self) -> dict[str, str]:
+        """Get `hero_abilities.json` projected to `facet_name -> facet title` mapping."""
+
+        def projection(hero_abilities: odota_constants.GetHeroAbilitiesResponse) -> dict[str, str]:
+            return {facet["name"]: facet["title"] for hero in hero_abilities.values() for facet in hero["facets"]}
+
+        return await self.get_projected("hero_abilities.json", projection)
+
 
 class SteamWebAPIClient(BaseClient):
     """Pulsefire client to work with Steam Web API."""
@@ -253,6 +533,15 @@ class SteamWebAPIClient(BaseClient):
         queries = {"server_steam_id": server_steam_id}  # noqa: F841
         return await self.invoke("GET", "/IDOTA2MatchStats_570/GetRealtimeStats/v1/")  # type: ignore[reportReturnType]
 
+    async def get_top_live_game(self, partner: int = 0) -> steam_web_api.TopLiveGameResponse:
+        """GET /IDOTA2Match_570/GetTopLiveGame/v1/.
+
+        https://steamapi.xpaw.me/#IDOTA2Match_570/GetTopLiveGame.
+        Web API mirror of Game Coordinator's FindTopSourceTVGames. Each `partner` gives its own part of the list.
+        """
+        queries = {"partner": partner}  # noqa: F841
+        return await self.invoke("GET", "/IDOTA2Match_570/GetTopLiveGame/v1/")  # type: ignore[reportReturnType]
+
 
 class StratzAPIRateLimiter(DotaAPIsRateLimiter):
     @override
@@ -265,6 +554,10 @@ class StratzAPIRateLimiter(DotaAPIsRateLimiter):
             ],
         )
         self.rate_limits_ratio = int(headers["X-RateLimit-Remaining-Day"]) / int(headers["X-RateLimit-Limit-Day"])
+        self.governor.update(
+            daily_limit=int(headers["X-RateLimit-Limit-Day"]),
+            remaining=int(headers["X-RateLimit-Remaining-Day"]),
+        )
 
         periods = [
             ("Second", 1),
@@ -277,6 +570,41 @@ class StratzAPIRateLimiter(DotaAPIsRateLimiter):
         return header_limits, header_counts
 
 
+STRATZ_MAX_MATCHES_PER_QUERY = 10
+"""Amount of aliased `match` fields in one batched query. Stratz rejects queries that are too complex."""
+
+FPC_PLAYER_FRAGMENT = """
+fragment FPCPlayer on MatchPlayerType {
+    isVictory
+    heroId
+    variant
+    kills
+    deaths
+    assists
+    item0Id
+    item1Id
+    item2Id
+    item3Id
+    item4Id
+    item5Id
+    neutral0Id
+    playbackData {
+        abilityLearnEvents {
+            abilityId
+        }
+        purchaseEvents {
+            time
+            itemId
+        }
+    }
+    stats {
+        matchPlayerBuffEvent {
+            itemId
+        }
+    }
+}"""
+
+
 class StratzClient(BaseClient):
     """Pulsefire client to boilerplate work with Stratz GraphQL queries.
 
@@ -285,7 +613,7 @@ class StratzClient(BaseClient):
     """
 
     def __init__(self) -> None:
-        self.rate_limiter = StratzAPIRateLimiter()
+        self.rate_limiter = StratzAPIRateLimiter(daily_limit=10000)
         super().__init__(
             base_url="https://api.stratz.com/graphql",
             default_params={},
@@ -302,9 +630,11 @@ class StratzClient(BaseClient):
             ],
         )
 
-    async def invoke_with_try(self, query: str, json: dict[str, Any]) -> Any:
+    async def invoke_with_try(self, query: str, json: dict[str, Any], priority: QuotaPriority) -> Any:
         """Error wrapper for `self.invoker`.
 
+        `query`, `json` and `priority` are picked up by pulsefire from this frame's locals.
+
         Notes
         -----
         * The reason for this function is that sometimes I forget Stratz resets Bearer Tokens every ~365 days
@@ -324,47 +654,65 @@ class StratzClient(BaseClient):
                 raise errors.ResponseNotOK(msg) from None
             raise
 
-    async def get_fpc_match_to_edit(self, *, match_id: int, friend_id: int) -> stratz.FPCMatchesResponse:
+    async def get_fpc_match_to_edit(
+        self, *, match_id: int, friend_id: int, priority: QuotaPriority = QuotaPriority.Command
+    ) -> stratz.FPCMatchesResponse:
         """Queries info that I need to know in order to edit Dota 2 FPC notification."""
-        query = """
-query GetFPCMatchToEdit ($match_id: Long!, $friend_id: Long!) {
-    match(id: $match_id) {
-        statsDateTime
-        players(steamAccountId: $friend_id) {
-            isVictory
-            heroId
-            variant
-            kills
-            deaths
-            assists
-            item0Id
-            item1Id
-            item2Id
-            item3Id
-            item4Id
-            item5Id
-            neutral0Id
-            playbackData {
-                abilityLearnEvents {
-                    abilityId
-                }
-                purchaseEvents {
-                    time
-                    itemId
-                }
-            }
-            stats {
-                matchPlayerBuffEvent {
-                    itemId
-                }
-            }
-        }
-    }
-}"""
-        json = {"query": query, "variables": {"match_id": match_id, "friend_id": friend_id}}
-        return await self.invoke_with_try(query, json)
+        responses = await self.get_fpc_matches_to_edit([(match_id, friend_id)], priority=priority)
+        return responses[match_id, friend_id]
+
+    async def get_fpc_matches_to_edit(
+        self, pairs: Sequence[tuple[int, int]], *, priority: QuotaPriority = QuotaPriority.Command
+    ) -> dict[tuple[int, int], stratz.FPCMatchesResponse]:
+        """Batched version of `get_fpc_match_to_edit`.
+
+        Every `(match_id, friend_id)` pair becomes an aliased `match` field, so the whole batch
+        costs a single request against Stratz daily limits. Big batches are split into chunks of
+        `STRATZ_MAX_MATCHES_PER_QUERY` to stay under the query complexity limit.
+
+        A failed chunk doesn't throw away the results of the other ones: its pairs are just missing
+        from the returned mapping. The error is only raised if every chunk failed.
+
+        Returns
+        -------
+        dict[tuple[int, int], stratz.FPCMatchesResponse]
+            Mapping `(match_id, friend_id) -> response` in the same shape as `get_fpc_match_to_edit` returns.
+        """
+        unique_pairs = list(dict.fromkeys(pairs))
+        responses: dict[tuple[int, int], stratz.FPCMatchesResponse] = {}
+        error: Exception | None = None
+        for i in range(0, len(unique_pairs), STRATZ_MAX_MATCHES_PER_QUERY):
+            chunk = unique_pairs[i : i + STRATZ_MAX_MATCHES_PER_QUERY]
+
+            variables: dict[str, int] = {}
+            for n, (match_id, friend_id) in enumerate(chunk):
+                variables[f"m{n}"] = match_id
+                variables[f"f{n}"] = friend_id
+            declarations = ", ".join(f"$m{n}: Long!, $f{n}: Long!" for n in range(len(chunk)))
+            fields = "\n".join(
+                f"    match{n}: match(id: $m{n}) {{ statsDateTime players(steamAccountId: $f{n}) {{ ...FPCPlayer }} }}"
+                for n in range(len(chunk))
+            )
+            query = f"query GetFPCMatchesToEdit ({declarations}) {{\n{fields}\n}}\n{FPC_PLAYER_FRAGMENT}"
+
+            json = {"query": query, "variables": variables}
+            try:
+                data = await self.invoke_with_try(query, json, priority)
+            except (aiohttp.ClientError, TimeoutError, errors.ResponseNotOK, errors.QuotaExhausted) as exc:
+                log.warning("Stratz: failed to fetch a chunk of %s FPC matches to edit: %r", len(chunk), exc)
+                error = exc
+                continue
+
+            # `data` is `null` when the whole query errored out (GraphQL errors come with status 200)
+            matches = data.get("data") or {}
+            for n, pair in enumerate(chunk):
+                responses[pair] = {"data": {"match": matches.get(f"match{n}")}}
+
+        if error and not responses:
+            raise error
+        return responses
 
-    async def get_heroes(self) -> stratz.HeroesResponse:
+    async def get_heroes(self, *, priority: QuotaPriority = QuotaPriority.Storage) -> stratz.HeroesResponse:
         """Queries Dota 2 Hero Constants."""
         query = """
 query Heroes {
@@ -390,9 +738,9 @@ query Heroes {
 }
         """
         json = {"query": query}
-        return await self.invoke_with_try(query, json)
+        return await self.invoke_with_try(query, json, priority)
 
-    async def get_abilities(self) -> stratz.AbilitiesResponse:
+    async def get_abilities(self, *, priority: QuotaPriority = QuotaPriority.Storage) -> stratz.AbilitiesResponse:
         """Queries Dota 2 Hero Ability Constants."""
         query = """
 query Abilities {
@@ -408,9 +756,9 @@ query Abilities {
     }
 }"""
         json = {"query": query}
-        return await self.invoke_with_try(query, json)
+        return await self.invoke_with_try(query, json, priority)
 
-    async def get_items(self) -> stratz.ItemsResponse:
+    async def get_items(self, *, priority: QuotaPriority = QuotaPriority.Storage) -> stratz.ItemsResponse:
         """Queries Dota 2 Hero Item Constants."""
         query = """
 query Items {
@@ -422,9 +770,9 @@ query Items {
     }
 }"""
         json = {"query": query}
-        return await self.invoke_with_try(query, json)
+        return await self.invoke_with_try(query, json, priority)
 
-    async def get_facets(self) -> stratz.FacetsResponse:
+    async def get_facets(self, *, priority: QuotaPriority = QuotaPriority.Storage) -> stratz.FacetsResponse:
         """Queries Dota 2 Hero Facet Constants."""
         query = """
 query FacetConstants {
@@ -442,7 +790,7 @@ query FacetConstants {
     }
 }"""
         json = {"query": query}
-        return await self.invoke_with_try(query, json)
+        return await self.invoke_with_try(query, json, priority)
 
 
 if __name__ == "__main__":
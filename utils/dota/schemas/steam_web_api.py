@@ -6,6 +6,7 @@ from typing import Literal, TypedDict
 __all__ = (
     "MatchDetailsResponse",
     "RealTimeStatsResponse",
+    "TopLiveGameResponse",
 )
 
 
@@ -160,3 +161,38 @@ class Building(TypedDict):
 
 class GraphData(TypedDict):
     graph_gold: list[int]
+
+
+# 3. GET TOP LIVE GAME
+
+
+class TopLiveGameResponse(TypedDict):
+    game_list: list[TopLiveGame]
+
+
+class TopLiveGame(TypedDict):
+    activate_time: int
+    deactivate_time: int
+    server_steam_id: int
+    lobby_id: int
+    league_id: int
+    lobby_type: int
+    game_time: int
+    delay: int
+    spectators: int
+    game_mode: int
+    average_mmr: int
+    match_id: int
+    series_id: int
+    sort_score: int
+    last_update_time: float
+    radiant_lead: int
+    radiant_score: int
+    dire_score: int
+    players: list[TopLiveGamePlayer]
+    building_state: int
+
+
+class TopLiveGamePlayer(TypedDict):
+    account_id: int
+    hero_id: int
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import datetime
 import logging
-from typing import TYPE_CHECKING, override
+import operator
+from typing import TYPE_CHECKING, NamedTuple, override
 
 import discord
 from steam import PersonaState
@@ -9,18 +12,97 @@ from steam.ext.dota2 import Client
 
 from config import config
 from utils import const, fmt
+from utils.ratelimiters import RateLimiterStateKeeper
 
-from .pulsefire_clients import OpenDotaConstantsClient, StratzClient
+from .pulsefire_clients import OpenDotaConstantsClient, SteamWebAPIClient, StratzClient
 from .storage import Abilities, Facets, Heroes, Items
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from steam.ext.dota2 import PartialUser
 
     from bot import AluBot
 
+    from .schemas import steam_web_api
+
 log = logging.getLogger(__name__)
 
-__all__ = ("DotaClient",)
+__all__ = (
+    "DotaClient",
+    "WebAPILiveMatch",
+)
+
+TOP_LIVE_GAME_PARTNERS = (0, 1, 2, 3)
+
+
+class WebAPILiveHero(NamedTuple):
+    id: int
+
+
+class WebAPILivePlayer(NamedTuple):
+    id: int
+    hero: WebAPILiveHero
+
+
+class WebAPILiveMatch:
+    """Live match built from Steam Web API data.
+
+    Duck-typed subset of steam.py's `LiveMatch` that FPC notifications need,
+    so Web API data can go the same way as Game Coordinator's while the latter is down.
+    """
+
+    __slots__: tuple[str, ...] = ("id", "players", "server_steam_id", "start_time")
+
+    def __init__(
+        self,
+        *,
+        match_id: int,
+        server_steam_id: int,
+        start_time: datetime.datetime,
+        players: list[WebAPILivePlayer],
+    ) -> None:
+        self.id: int = match_id
+        self.server_steam_id: int = server_steam_id
+        self.start_time: datetime.datetime = start_time
+        self.players: list[WebAPILivePlayer] = players
+
+    @override
+    def __repr__(self) -> str:
+        return f"<WebAPILiveMatch id={self.id} server_steam_id={self.server_steam_id}>"
+
+    @property
+    def heroes(self) -> list[WebAPILiveHero]:
+        """Heroes in the match ordered by player slots."""
+        return [player.hero for player in self.players]
+
+    @classmethod
+    def from_top_live_game(cls, game: steam_web_api.TopLiveGame) -> WebAPILiveMatch:
+        """Build from GetTopLiveGame entry."""
+        return cls(
+            match_id=int(game["match_id"]),
+            server_steam_id=int(game["server_steam_id"]),
+            start_time=datetime.datetime.fromtimestamp(game["activate_time"], datetime.UTC),
+            players=[
+                WebAPILivePlayer(id=player["account_id"], hero=WebAPILiveHero(id=player["hero_id"]))
+                for player in game["players"]
+            ],
+        )
+
+    @classmethod
+    def from_real_time_stats(cls, stats: steam_web_api.RealTimeStatsResponse) -> WebAPILiveMatch:
+        """Build from GetRealtimeStats response which is fresher than the top live list."""
+        match = stats["match"]
+        return cls(
+            match_id=int(match["match_id"]),
+            server_steam_id=int(match["server_steam_id"]),
+            start_time=datetime.datetime.fromtimestamp(match["start_timestamp"], datetime.UTC),
+            players=[
+                WebAPILivePlayer(id=player["accountid"], hero=WebAPILiveHero(id=player["heroid"]))
+                for team in sorted(stats["teams"], key=operator.itemgetter("team_number"))
+                for player in sorted(team["players"], key=operator.itemgetter("team_slot"))
+            ],
+        )
 
 
 class DotaClient(Client):
@@ -44,7 +126,9 @@ class DotaClient(Client):
 
         # clients
         self.stratz = StratzClient()
+        self.stratz_rate_limiter_state = RateLimiterStateKeeper(bot, "stratz", self.stratz.rate_limiter)
         self.opendota_constants = OpenDotaConstantsClient()
+        self.steam_web_api = SteamWebAPIClient()
         # storages
         self.abilities = Abilities(bot)
         self.heroes = Heroes(bot)
@@ -70,6 +154,8 @@ class DotaClient(Client):
             # clients
             await self.stratz.__aenter__()  # noqa: PLC2801
             await self.opendota_constants.__aenter__()  # noqa: PLC2801
+            await self.steam_web_api.__aenter__()  # noqa: PLC2801
+            await self.stratz_rate_limiter_state.start()
 
             # caches
             self.abilities.start()
@@ -79,6 +165,46 @@ class DotaClient(Client):
 
             self.started = True
 
+    async def web_api_live_matches(self, account_ids: Collection[int]) -> list[WebAPILiveMatch]:
+        """Get live matches with any of `account_ids` players in them from Steam Web API.
+
+        Fallback for `top_live_matches` while Game Coordinator is down. The top live list is gathered from
+        all GetTopLiveGame partners, then matches with our players are refreshed with GetRealtimeStats
+        because the list lags behind and often misses hero picks.
+
+        Partners that failed to respond are skipped; an error is raised only if all of them failed.
+        """
+        partner_responses = await asyncio.gather(
+            *(self.steam_web_api.get_top_live_game(partner) for partner in TOP_LIVE_GAME_PARTNERS),
+            return_exceptions=True,
+        )
+        responses: list[steam_web_api.TopLiveGameResponse] = []
+        for partner, response in zip(TOP_LIVE_GAME_PARTNERS, partner_responses, strict=True):
+            if isinstance(response, BaseException):
+                log.warning("Steam Web API: GetTopLiveGame for partner %s failed: %r", partner, response)
+            else:
+                responses.append(response)
+        if not responses:
+            raise next(response for response in partner_responses if isinstance(response, BaseException))
+
+        games = {int(game["match_id"]): game for response in responses for game in response.get("game_list", [])}
+        our_games = [
+            game for game in games.values() if any(player["account_id"] in account_ids for player in game["players"])
+        ]
+
+        stats_responses = await asyncio.gather(
+            *(self.steam_web_api.get_real_time_stats(int(game["server_steam_id"])) for game in our_games),
+            return_exceptions=True,
+        )
+        live_matches: list[WebAPILiveMatch] = []
+        for game, stats in zip(our_games, stats_responses, strict=True):
+            if isinstance(stats, BaseException) or not stats.get("teams"):
+                # real-time stats are not always available, i.e. for matches that have just started
+                live_matches.append(WebAPILiveMatch.from_top_live_game(game))
+            else:
+                live_matches.append(WebAPILiveMatch.from_real_time_stats(stats))
+        return live_matches
+
     @override
     async def login(self) -> None:
         await self.start_helpers()
@@ -96,8 +222,10 @@ class DotaClient(Client):
     async def close(self) -> None:
         await self.bot.send_warning("DotaClient is closing.")
         # clients
+        await self.stratz_rate_limiter_state.close()
         await self.stratz.__aexit__()
         await self.opendota_constants.__aexit__()
+        await self.steam_web_api.__aexit__()
 
         # caches
         self.abilities.close()
@@ -9,6 +9,8 @@ from .. import const, fmt
 from ..fpc import Character, CharacterStorage, CharacterTransformer, GameDataStorage
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from bot import AluBot
 
     from .schemas import stratz
@@ -130,20 +132,42 @@ class Heroes(CharacterStorage[Hero, PseudoHero]):  # CharacterCache
             emote=const.NEW_HERO_EMOTE,
         )
 
+    @staticmethod
+    def disconnected_or_unpicked() -> PseudoHero:
+        """Special case for `hero_id=0`."""
+        return PseudoHero(
+            id=0,
+            short_name="disconnected_or_unpicked",
+            display_name="Disconnected/Unpicked",
+            topbar_icon_url=const.DotaAsset.HeroTopbarDisconnectedUnpicked,
+            emote="\N{BLACK QUESTION MARK ORNAMENT}",
+        )
+
     @override
     async def by_id(self, hero_id: int) -> Hero | PseudoHero:
         """Get Hero object by its ID."""
         # special cases
         if hero_id == 0:
-            return PseudoHero(
-                id=0,
-                short_name="disconnected_or_unpicked",
-                display_name="Disconnected/Unpicked",
-                topbar_icon_url=const.DotaAsset.HeroTopbarDisconnectedUnpicked,
-                emote="\N{BLACK QUESTION MARK ORNAMENT}",
-            )
+            return self.disconnected_or_unpicked()
         return await super().by_id(hero_id)
 
+    @override
+    def from_cache(self, hero_ids: Iterable[int]) -> dict[int, Hero | PseudoHero]:
+        hero_ids = set(hero_ids)
+        heroes = super().from_cache(hero_ids - {0})
+        if 0 in hero_ids:
+            heroes[0] = self.disconnected_or_unpicked()
+        return heroes
+
+    @override
+    async def by_ids(self, hero_ids: Iterable[int]) -> dict[int, Hero | PseudoHero]:
+        hero_ids = set(hero_ids)
+        # `hero_id=0` is never in the cache so it shouldn't trigger a refresh
+        heroes = await super().by_ids(hero_ids - {0})
+        if 0 in hero_ids:
+            heroes[0] = self.disconnected_or_unpicked()
+        return heroes
+
     async def create_hero_emote(
         self,
         hero_id: int,
@@ -212,17 +236,14 @@ class Abilities(GameDataStorage[Ability, PseudoAbility]):
 
         # as of 12/October/2024 Stratz doesn't have full data on some Talent names (a lot of nulls)
         # so for now we fill the missing data with opendota
-        odota_abilities = await self.bot.dota.opendota_constants.get_abilities()
+        odota_display_names = await self.bot.dota.opendota_constants.get_ability_display_names()
 
         def get_display_name(ability: stratz.Ability) -> str:
             if ability["language"] and (display_name := ability["language"]["displayName"]):
                 # can be `None`, especially for new abilities
                 return display_name
             # else get the information from opendota
-            opendota_ability = odota_abilities.get(ability["name"])
-            if opendota_ability:
-                return opendota_ability.get("dname", "unknown")
-            return "Unknown"
+            return odota_display_names.get(ability["name"], "Unknown")
 
         return {
             ability["id"]: Ability(
@@ -358,10 +379,7 @@ class Facets(GameDataStorage[Facet, PseudoFacet]):
 
         # as of 12/October/2024 Stratz doesn't have full data on Facets (a lot of nulls)
         # so for now we fill the missing data with opendota
-        hero_abilities = await self.bot.dota.opendota_constants.get_hero_abilities()
-        short_name_display_name_lookup: dict[str, str] = {
-            facet["name"]: facet["title"] for hero in hero_abilities.values() for facet in hero["facets"]
-        }
+        short_name_display_name_lookup = await self.bot.dota.opendota_constants.get_facet_titles()
 
         return {
             facet["id"]: Facet(
@@ -21,6 +21,7 @@ __all__: tuple[str, ...] = (
     "ErroneousUsage",
     "PermissionsError",
     "PlaceholderRaiseError",
+    "QuotaExhausted",
     "ResponseNotOK",
     "SomethingWentWrong",
     "UserError",
@@ -83,6 +84,16 @@ class ResponseNotOK(AluBotError):
     __slots__: tuple[str, ...] = ()
 
 
+class QuotaExhausted(AluBotError):
+    """Raised when the daily quota left for some API is reserved for more important requests.
+
+    I.e. Stratz daily limit is running low and it should be spent on editing FPC notifications
+    instead of someone's random command.
+    """
+
+    __slots__: tuple[str, ...] = ()
+
+
 class TranslateError(AluBotError):
     """Raised when there is an error in translate functionality."""
 
@@ -15,6 +15,8 @@ from bot import aluloop
 from utils import const, errors, fuzzy
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from bot import AluBot, AluInteraction
 
 __all__ = (
@@ -175,6 +177,30 @@ class GameDataStorage[VT, PseudoVT](abc.ABC):
         except KeyError:
             return self.generate_unknown_object(object_id)
 
+    def from_cache(self, object_ids: Iterable[int]) -> dict[int, VT | PseudoVT]:
+        """Get many storage objects at once synchronously, straight from the cache.
+
+        Unknown IDs (or all of them if the cache is not filled yet) are resolved into pseudo objects.
+        Use `by_ids` unless the cache is known to be ready.
+        """
+        data: dict[int, VT] = getattr(self, "cached_data", {})
+        return {
+            object_id: data[object_id] if object_id in data else self.generate_unknown_object(object_id)
+            for object_id in object_ids
+        }
+
+    async def by_ids(self, object_ids: Iterable[int]) -> dict[int, VT | PseudoVT]:
+        """Get many storage objects by their IDs at once.
+
+        Unlike awaiting `by_id` for each ID, the cache is refreshed at most once for the whole batch.
+        """
+        object_ids = set(object_ids)
+        data = await self.get_cached_data()
+        if not object_ids <= data.keys():
+            # new patch or something
+            await self.update_data()
+        return self.from_cache(object_ids)
+
     async def all(self) -> list[VT | PseudoVT]:
         data = await self.get_cached_data()
         return list(data.values())
@@ -8,6 +8,7 @@ from pulsefire.middlewares import http_error_middleware, json_response_middlewar
 from pulsefire.ratelimiters import RiotAPIRateLimiter
 
 from config import config
+from utils.ratelimiters import RateLimiterStateKeeper
 
 from .storage import Champions, ItemIcons, RolesIdentifiers, RuneIcons, SummonerSpellIcons
 
@@ -17,15 +18,17 @@ if TYPE_CHECKING:
 
 class LeagueClient(RiotAPIClient):
     def __init__(self, bot: AluBot) -> None:
+        self.rate_limiter = RiotAPIRateLimiter()
         super().__init__(
             default_headers={"X-Riot-Token": config["TOKENS"]["RIOT"]},
             default_queries={},
             middlewares=[
                 json_response_middleware(orjson.loads),
                 http_error_middleware(),
-                rate_limiter_middleware(RiotAPIRateLimiter()),
+                rate_limiter_middleware(self.rate_limiter),
             ],
         )
+        self.rate_limiter_state = RateLimiterStateKeeper(bot, "riot", self.rate_limiter)
         self.cdragon = CDragonClient(
             default_params={"patch": "latest", "locale": "default"},
             middlewares=[
@@ -49,6 +52,7 @@ class LeagueClient(RiotAPIClient):
         await self.__aenter__()  # noqa: PLC2801
         await self.cdragon.__aenter__()  # noqa: PLC2801
         await self.meraki.__aenter__()  # noqa: PLC2801
+        await self.rate_limiter_state.start()
 
         self.champions.start()
         self.item_icons.start()
@@ -57,6 +61,7 @@ class LeagueClient(RiotAPIClient):
         self.roles.start()
 
     async def close(self) -> None:
+        await self.rate_limiter_state.close()
         await self.__aexit__()
         await self.cdragon.__aexit__()
         await self.meraki.__aexit__()
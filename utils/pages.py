@@ -19,6 +19,8 @@ Sources
 
 from __future__ import annotations
 
+import abc
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, NotRequired, Self, TypedDict, override
 
 import discord
@@ -39,6 +41,8 @@ if TYPE_CHECKING:
 
 __all__ = (
     "EmbedDescriptionPaginator",
+    "KeysetPageSource",
+    "KeysetPaginator",
     "Paginator",
 )
 
@@ -276,6 +280,10 @@ class Paginator(AluView):
         """Show the very last page."""
         await self.show_page(interaction, -1)
 
+    async def normalize_page_number(self, page_number: int) -> int:
+        """Turn requested page number into a real one, i.e. `page_number = -1` means the last page."""
+        return page_number % self.max_pages
+
     async def show_page(self, interaction: AluInteraction, page_number: int) -> None:
         """Show page. Edits the paginator's message with a new page and updates navigation labels.
 
@@ -284,7 +292,7 @@ class Paginator(AluView):
         page_number: int
             Page number to show.
         """
-        real_page_number = page_number % self.max_pages  # includes offset, i.e. page_number = -1 means last page.
+        real_page_number = await self.normalize_page_number(page_number)
 
         page_entries = await self.get_page_entries(real_page_number)
         send_kwargs = await self._get_page_send_kwargs(page_entries)
@@ -321,6 +329,149 @@ class Paginator(AluView):
         self.stop()
 
 
+class KeysetPageSource[T, K](abc.ABC):
+    """Lazy source of entries for `KeysetPaginator`.
+
+    Instead of holding the whole list in memory, entries are fetched from the database page by page
+    with keyset pagination, i.e. `WHERE (sort key) > $last_key ORDER BY sort key LIMIT $n`,
+    which is as fast for the thousandth page as for the first one.
+    Pages are fetched in pairs so the adjacent page is usually cached by the time "next" is pressed.
+    Jumps to pages which boundary key is not known yet (i.e. "last page" button) fall back to OFFSET
+    and make the estimated total exact whenever they land past the end or short of it.
+
+    Subclassing
+    -----------
+    Subclasses must implement `key`, `fetch` and `count`.
+
+    Attributes
+    ----------
+    per_page: int
+        How many entries are in a page.
+    total: int
+        Total amount of entries. This starts as an estimate and gets exact once the end of the list is fetched.
+    """
+
+    def __init__(self, *, per_page: int, max_cached_pages: int = 6) -> None:
+        self.per_page: int = per_page
+        self.max_cached_pages: int = max_cached_pages
+        self.total: int = 0
+        self._exact_total: bool = False
+        self._pages: OrderedDict[int, list[T]] = OrderedDict()
+        # keys of the last entries of already seen pages - they are tiny so we don't evict them
+        self._last_keys: dict[int, K] = {}
+
+    @abc.abstractmethod
+    def key(self, entry: T) -> K:
+        """Get sort key of the entry. It should be unique and match the `ORDER BY` in `fetch`."""
+
+    @abc.abstractmethod
+    async def fetch(self, *, after: K | None, offset: int, limit: int) -> list[T]:
+        """Fetch `limit` entries going after the `after` key or, if it's `None`, skipping `offset` entries."""
+
+    @abc.abstractmethod
+    async def count(self, *, estimate: bool) -> int:
+        """Count the total amount of entries. If `estimate` is `True` then a cheap estimate is good enough."""
+
+    @property
+    def max_pages(self) -> int:
+        """Total amount of pages, there is always at least one (maybe empty) page."""
+        return max(1, -(self.total // -self.per_page))
+
+    async def prepare(self) -> None:
+        """Prepare the source before the pagination starts."""
+        self.total = await self.count(estimate=True)
+
+    async def get_page(self, page_number: int) -> list[T]:
+        """Get entries for the page, fetching it (together with the next one) if it's not cached."""
+        if (entries := self._pages.get(page_number)) is not None:
+            self._pages.move_to_end(page_number)
+            return entries
+
+        after = self._last_keys.get(page_number - 1) if page_number else None
+        offset = 0 if after is not None else page_number * self.per_page
+        rows = await self.fetch(after=after, offset=offset, limit=2 * self.per_page)
+
+        entries, next_entries = rows[: self.per_page], rows[self.per_page :]
+        for number, page in ((page_number, entries), (page_number + 1, next_entries)):
+            if page:
+                self._pages[number] = page
+                self._last_keys[number] = self.key(page[-1])
+        while len(self._pages) > self.max_cached_pages:
+            self._pages.popitem(last=False)
+
+        if not rows and offset:
+            # jumped over the end of the list because the estimate was too high
+            self.total = await self.count(estimate=False)
+            self._exact_total = True
+        elif len(rows) < 2 * self.per_page:
+            # we reached the end of the list so now we know the exact total
+            self.total = page_number * self.per_page + len(rows)
+            self._exact_total = True
+        elif after is None and offset and not self._exact_total:
+            # jumped to the estimated last page but the list goes on because the estimate was too low
+            self.total = await self.count(estimate=False)
+            self._exact_total = True
+        elif not self._exact_total:
+            self.total = max(self.total, (page_number + 2) * self.per_page)
+        return entries
+
+
+class KeysetPaginator(Paginator):
+    """Paginator that lazily fetches pages from `KeysetPageSource` instead of slicing in-memory `entries`.
+
+    Attributes
+    ----------
+    source: KeysetPageSource
+        The source of the entries.
+    """
+
+    def __init__(
+        self,
+        interaction: AluInteraction,
+        source: KeysetPageSource[Any, Any],
+        *,
+        author_id: int | None = None,
+        timeout: float | None = 300.0,
+    ) -> None:
+        self.source: KeysetPageSource[Any, Any] = source
+        super().__init__(interaction, entries=[], per_page=source.per_page, author_id=author_id, timeout=timeout)
+
+    @override
+    def is_paginating(self) -> bool:
+        return self.max_pages > 1
+
+    @override
+    async def start(
+        self,
+        *,
+        ephemeral: bool = False,
+        edit_response: bool = False,
+        page_number: int = 0,
+    ) -> discord.InteractionMessage | discord.WebhookMessage:
+        await self.source.prepare()
+        self.max_pages = self.source.max_pages
+        self.clear_items()
+        self.fill_items()
+        page_number = await self.normalize_page_number(page_number)
+        return await super().start(ephemeral=ephemeral, edit_response=edit_response, page_number=page_number)
+
+    @override
+    async def normalize_page_number(self, page_number: int) -> int:
+        real_page_number = await super().normalize_page_number(page_number)
+        if real_page_number and not await self.source.get_page(real_page_number):
+            # the total was overestimated; now it's exact so we can show the real last page
+            real_page_number = self.source.max_pages - 1
+        self.max_pages = self.source.max_pages
+        return real_page_number
+
+    @override
+    async def get_page_entries(self, page_number: int) -> Any | Sequence[Any]:
+        entries = await self.source.get_page(page_number)
+        if self.per_page == 1:
+            return entries[0] if entries else None
+        return entries
+
+
 if TYPE_CHECKING:
 
     class EmbedAuthorTemplate(TypedDict):
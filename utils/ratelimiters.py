@@ -0,0 +1,163 @@
+"""Persistence for pulsefire rate limiters state.
+
+Pulsefire rate limiters keep their window counts and expiry purely in memory.
+So a restart during a busy window starts from zero and bursts straight into 429s and penalty windows.
+`RateLimiterStateKeeper` snapshots that state into the database and restores still-active windows on boot.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Protocol, TypedDict, runtime_checkable
+
+from bot import aluloop
+
+if TYPE_CHECKING:
+    import datetime
+
+    from pulsefire.ratelimiters import BaseRateLimiter
+
+    from bot import AluBot
+
+    class RateLimiterState(TypedDict):
+        index: list[tuple[list[Any], list[float]]]
+        headers: dict[str, str] | None
+
+    class RateLimiterStateRow(TypedDict):
+        state: RateLimiterState
+        saved_at: datetime.datetime
+
+
+__all__ = ("RateLimiterStateKeeper",)
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+SECONDS_IN_HOUR = 60 * 60
+
+
+@runtime_checkable
+class SupportsHeadersRestore(Protocol):
+    """Rate limiter that remembers the latest rate limit headers and can restore from them."""
+
+    last_headers: dict[str, str] | None
+
+    def restore_headers(self, headers: dict[str, str]) -> None: ...
+
+    def window_start(self, now: float) -> float: ...
+
+
+class RateLimiterStateKeeper:
+    """Keeps the state of a pulsefire rate limiter persisted in the database.
+
+    The state is the rate limiter's `_index` (window counts, limits and expiry) and, if supported,
+    the latest synchronised rate limit headers. It is saved every minute and on `close`,
+    then restored on `start`. Only windows that did not expire yet are restored.
+
+    Attributes
+    ----------
+    bot: AluBot
+        The bot instance, needed for the database pool and `@aluloop` error notifications.
+    name: str
+        Unique name of the rate limiter in the database.
+    rate_limiter: BaseRateLimiter
+        Pulsefire rate limiter which state is being persisted.
+    """
+
+    def __init__(self, bot: AluBot, name: str, rate_limiter: BaseRateLimiter) -> None:
+        self.bot: AluBot = bot
+        self.name: str = name
+        self.rate_limiter: BaseRateLimiter = rate_limiter
+
+    @property
+    def index(self) -> dict[tuple[Any, ...], tuple[int, int, float, float, float]]:
+        """Shortcut to the rate limiter's `(count, limit, expire, latency, pinged)` index by scope keys."""
+        return self.rate_limiter._index  # type: ignore[reportAttributeAccessIssue]
+
+    def snapshot(self) -> RateLimiterState:
+        """Get the JSON-friendly state of still-active rate limit windows."""
+        now = time.time()
+        return {
+            "index": [(list(key), list(value)) for key, value in self.index.items() if value[2] > now],
+            "headers": self.rate_limiter.last_headers
+            if isinstance(self.rate_limiter, SupportsHeadersRestore)
+            else None,
+        }
+
+    def restore(self, state: RateLimiterState, saved_at: float) -> int:
+        """Restore the state from the snapshot.
+
+        Windows that are still active in memory (i.e. after `reload`) take precedence over the snapshot.
+        In-flight "pinging" flags are not restored because requests that set them died with the process.
+        If the snapshot was saved before the current daily window started, then the saved headers and
+        day-scope windows describe the previous day's quota, so they are dropped and the rate limiter
+        waits for a live response instead.
+
+        Returns
+        -------
+        int
+            Amount of restored rate limit windows.
+        """
+        now = time.time()
+        stale = isinstance(self.rate_limiter, SupportsHeadersRestore) and saved_at < self.rate_limiter.window_start(now)
+        restored = 0
+        for key, (count, limit, expire, latency, _pinged) in state["index"]:
+            target = tuple(key)
+            if expire <= now or self.index[target][2] > now:
+                continue
+            if stale and expire - saved_at > SECONDS_IN_HOUR:
+                # longer than the hour windows - a day-scope window of the previous day
+                continue
+            self.index[target] = (int(count), int(limit), expire, latency, 0)
+            restored += 1
+
+        headers = state.get("headers")
+        if stale:
+            log.info("Saved rate limit headers for `%s` are from the previous daily window.", self.name)
+        elif (
+            headers and isinstance(self.rate_limiter, SupportsHeadersRestore) and self.rate_limiter.last_headers is None
+        ):
+            try:
+                self.rate_limiter.restore_headers(headers)
+            except KeyError:
+                log.warning("Saved rate limit headers for `%s` are outdated and cannot be analyzed.", self.name)
+        return restored
+
+    async def load(self) -> None:
+        """Load the snapshot from the database and restore it."""
+        query = "SELECT state, saved_at FROM rate_limiter_states WHERE name = $1"
+        row: RateLimiterStateRow | None = await self.bot.pool.fetchrow(query, self.name)
+        if row is None:
+            return
+        restored = self.restore(row["state"], row["saved_at"].timestamp())
+        log.info("Restored %s active rate limit windows for `%s`.", restored, self.name)
+
+    async def save(self) -> None:
+        """Save the snapshot into the database."""
+        query = """
+            INSERT INTO rate_limiter_states (name, state, saved_at)
+            VALUES ($1, $2, now())
+            ON CONFLICT (name) DO UPDATE
+                SET state = $2, saved_at = now();
+        """
+        await self.bot.pool.execute(query, self.name, self.snapshot())
+
+    @aluloop(minutes=1)
+    async def periodic_save(self) -> None:
+        """Save the snapshot periodically so even a crash doesn't lose the state."""
+        await self.save()
+
+    async def start(self) -> None:
+        """Restore the state and start saving it periodically."""
+        await self.load()
+        if not self.periodic_save.is_running():
+            self.periodic_save.start()
+
+    async def close(self) -> None:
+        """Stop the periodic saving and save the final snapshot."""
+        if not self.periodic_save.is_running():
+            # never started - don't overwrite the saved snapshot with an empty state
+            return
+        self.periodic_save.cancel()
+        await self.save()
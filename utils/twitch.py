@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import datetime
 import logging
-from typing import TYPE_CHECKING, TypedDict, override
+from typing import TYPE_CHECKING, Any, TypedDict, override
 
 import discord
 import twitchio
 from twitchio import eventsub
 
+from bot import aluloop
 from config import config
 
-from . import const, fmt
+from . import const, errors, fmt
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from twitchio.types_.responses import VideosResponse
+
     from bot import AluBot
 
     class LoadTokensQueryRow(TypedDict):
@@ -20,10 +27,27 @@ if TYPE_CHECKING:
         refresh: str
 
 
-__all__ = ("AluTwitchClient",)
+__all__ = (
+    "AluTwitchClient",
+    "StreamStatusCache",
+    "Streamer",
+)
 
 log = logging.getLogger(__name__)
 
+HELIX_MAX_IDS_PER_REQUEST = 100
+"""Twitch Helix endpoints such as "Get Users" and "Get Streams" accept at most 100 ids per request."""
+
+VOD_RETRY_DELAYS = (
+    datetime.timedelta(minutes=1),
+    datetime.timedelta(minutes=2),
+    datetime.timedelta(minutes=4),
+    datetime.timedelta(minutes=8),
+    datetime.timedelta(minutes=16),
+)
+"""Back-off between attempts to find the VOD of a stream. It's not requested anymore after the last one,
+i.e. the broadcaster has VODs disabled."""
+
 
 class AluTwitchClient(twitchio.Client):
     def __init__(self, bot: AluBot) -> None:
@@ -33,6 +57,7 @@ class AluTwitchClient(twitchio.Client):
             bot_id=const.TwitchID.Bot,
         )
         self._bot: AluBot = bot
+        self.stream_status: StreamStatusCache = StreamStatusCache(self)
 
     def print_bot_oauth(self) -> None:
         scopes = "%20".join(
@@ -117,9 +142,12 @@ class AluTwitchClient(twitchio.Client):
             )
 
     async def event_stream_offline(self, offline: twitchio.StreamOffline) -> None:
+        self.stream_status.mark_offline(offline.broadcaster.id)
         self._bot.dispatch("twitchio_stream_offline", offline)
 
     async def event_stream_online(self, online: twitchio.StreamOnline) -> None:
+        # refresh before dispatching so listeners already see the new stream and its VOD in the cache
+        await self.stream_status.refresh([online.broadcaster.id])
         self._bot.dispatch("twitchio_stream_online", online)
 
     # OVERRIDE
@@ -144,10 +172,181 @@ class AluTwitchClient(twitchio.Client):
         """Get Irene's channel from the cache."""
         return self.create_partialuser(const.TwitchID.Me)
 
+    @override
+    async def close(self, **options: Any) -> None:
+        self.stream_status.poll.cancel()
+        await super().close(**options)
+
     async def fetch_streamer(self, twitch_id: str) -> Streamer:
-        user = await self.create_partialuser(twitch_id).user()
-        stream = next(iter(await self.fetch_streams(user_ids=[twitch_id])), None)  # None if offline
-        return Streamer(self, user, stream)
+        """Get streamer from the stream status cache, only requesting Twitch on a cache miss."""
+        streamer = self.stream_status.get(twitch_id)
+        if streamer is None:
+            await self.stream_status.track([twitch_id])
+            streamer = self.stream_status.get(twitch_id)
+        if streamer is None:
+            msg = f"Twitch user with id `{twitch_id}` does not exist."
+            raise errors.SomethingWentWrong(msg)
+        return streamer
+
+
+class StreamStatusCache:
+    """Shared in-memory cache of Twitch users, their live streams and current VODs.
+
+    Tracked broadcasters are polled in batches of up to 100 ids per Helix request once a minute
+    and kept fresh in-between via eventsub online/offline events, so FPC notifications and
+    community features read everything from memory instead of requesting Twitch for every message.
+
+    Attributes
+    ----------
+    tracked_ids: set[str]
+        Twitch IDs of broadcasters being polled. Refilled from FPC players tables on every poll.
+    users: dict[str, twitchio.User]
+        Mapping of twitch ID to user (display name, profile and offline images).
+    streams: dict[str, twitchio.Stream]
+        Mapping of twitch ID to the current stream. Only live broadcasters are present.
+    vods: dict[str, twitchio.Video]
+        Mapping of twitch ID to the VOD of the current stream. Only live broadcasters are present.
+    vod_misses: dict[str, tuple[str, int, datetime.datetime]]
+        Mapping of twitch ID to `(stream ID, failed attempts, next attempt at)` for streams which VOD wasn't found.
+
+    """
+
+    USERS_REFRESH_INTERVAL = datetime.timedelta(hours=6)
+
+    def __init__(self, twitch: AluTwitchClient) -> None:
+        self.twitch: AluTwitchClient = twitch
+        self.bot: AluBot = twitch._bot  # for `aluloop` error handling
+
+        self.tracked_ids: set[str] = {const.TwitchID.Me}
+        self.users: dict[str, twitchio.User] = {}
+        self.streams: dict[str, twitchio.Stream] = {}
+        self.vods: dict[str, twitchio.Video] = {}
+        self.vod_misses: dict[str, tuple[str, int, datetime.datetime]] = {}
+        self._users_refreshed_at: datetime.datetime | None = None
+
+    @staticmethod
+    def chunks(twitch_ids: list[str]) -> list[list[str]]:
+        """Split twitch IDs into Helix-maximum sized chunks."""
+        return [
+            twitch_ids[i : i + HELIX_MAX_IDS_PER_REQUEST] for i in range(0, len(twitch_ids), HELIX_MAX_IDS_PER_REQUEST)
+        ]
+
+    async def fetch_tracked_ids(self) -> set[str]:
+        """Get twitch IDs of all FPC players and mine."""
+        query = """
+            SELECT twitch_id FROM dota_players WHERE twitch_id IS NOT NULL
+            UNION
+            SELECT twitch_id FROM lol_players WHERE twitch_id IS NOT NULL
+        """
+        return {const.TwitchID.Me} | {twitch_id for (twitch_id,) in await self.bot.pool.fetch(query)}
+
+    async def refresh(self, twitch_ids: Iterable[str] | None = None) -> None:
+        """Refresh users, streams and current VODs for the given (or all tracked) broadcasters.
+
+        Users are only re-requested every `USERS_REFRESH_INTERVAL` or when they are missing from the cache.
+        VODs are requested for live broadcasters until the VOD of their current stream is found
+        (with a back-off and a limit of attempts per stream).
+        """
+        twitch_ids = list(twitch_ids) if twitch_ids is not None else list(self.tracked_ids)
+        if not twitch_ids:
+            # otherwise fetch_streams fetches top streams and we dont want that.
+            return
+
+        now = datetime.datetime.now(datetime.UTC)
+        if self._users_refreshed_at is None or now - self._users_refreshed_at > self.USERS_REFRESH_INTERVAL:
+            self._users_refreshed_at = now
+            user_ids = list(self.tracked_ids | set(twitch_ids))
+        else:
+            user_ids = [twitch_id for twitch_id in twitch_ids if twitch_id not in self.users]
+
+        users_responses, streams_responses = await asyncio.gather(
+            asyncio.gather(*(self.twitch.fetch_users(ids=chunk) for chunk in self.chunks(user_ids))),
+            asyncio.gather(
+                *(self.twitch.fetch_streams(user_ids=chunk, first=100) for chunk in self.chunks(twitch_ids))
+            ),
+        )
+        self.users.update({user.id: user for users in users_responses for user in users})
+        live_streams = {stream.user.id: stream for streams in streams_responses for stream in streams}
+
+        missing_vods: list[twitchio.Stream] = []
+        for twitch_id in twitch_ids:
+            stream = live_streams.get(twitch_id)
+            if stream is None:
+                self.mark_offline(twitch_id)
+                continue
+
+            previous = self.streams.get(twitch_id)
+            if previous is not None and previous.id != stream.id:
+                # the VOD of the previous stream
+                self.vods.pop(twitch_id, None)
+                self.vod_misses.pop(twitch_id, None)
+            if twitch_id not in self.vods and self.should_fetch_vod(stream, now):
+                missing_vods.append(stream)
+            self.streams[twitch_id] = stream
+
+        if missing_vods:
+            # Get Videos endpoint doesn't support batching by user ids,
+            # but this only happens a few times per stream until its VOD is found
+            await asyncio.gather(*(self.fetch_current_vod(stream) for stream in missing_vods))
+
+    def should_fetch_vod(self, stream: twitchio.Stream, now: datetime.datetime) -> bool:
+        """Whether it's time for the next attempt to find the VOD of the stream, see `VOD_RETRY_DELAYS`."""
+        miss = self.vod_misses.get(stream.user.id)
+        if miss is None or miss[0] != stream.id:
+            return True
+        _, attempts, next_attempt_at = miss
+        return attempts <= len(VOD_RETRY_DELAYS) and now >= next_attempt_at
+
+    async def fetch_current_vod(self, stream: twitchio.Stream) -> None:
+        """Fetch and cache the VOD of the given live stream.
+
+        Twitch creates the archive a bit after the stream starts and until then the latest archive
+        belongs to the previous stream. So the VOD is only cached when its `stream_id` matches the stream,
+        otherwise it's left unset and requested again with a back-off, see `should_fetch_vod`.
+        """
+        # `twitchio.Video` doesn't expose `stream_id` so request the endpoint directly
+        params = {"user_id": stream.user.id, "type": "archive", "first": 1}
+        response: VideosResponse = await self.twitch.http.request_json(twitchio.Route("GET", "videos", params=params))
+        data = next((video for video in response["data"] if video["stream_id"] == stream.id), None)
+        if data is not None:
+            self.vods[stream.user.id] = twitchio.Video(data, http=self.twitch.http)
+            self.vod_misses.pop(stream.user.id, None)
+            return
+
+        miss = self.vod_misses.get(stream.user.id)
+        attempts = miss[1] + 1 if miss is not None and miss[0] == stream.id else 1
+        delay = VOD_RETRY_DELAYS[min(attempts, len(VOD_RETRY_DELAYS)) - 1]
+        self.vod_misses[stream.user.id] = (stream.id, attempts, datetime.datetime.now(datetime.UTC) + delay)
+
+    def mark_offline(self, twitch_id: str) -> None:
+        """Forget the stream and VOD of a broadcaster who went offline."""
+        self.streams.pop(twitch_id, None)
+        self.vods.pop(twitch_id, None)
+        self.vod_misses.pop(twitch_id, None)
+
+    async def track(self, twitch_ids: Iterable[str]) -> None:
+        """Start tracking broadcasters, requesting the ones that are not tracked yet right away."""
+        new_ids = set(twitch_ids) - self.tracked_ids
+        if new_ids:
+            self.tracked_ids |= new_ids
+            await self.refresh(new_ids)
+
+    def get(self, twitch_id: str) -> Streamer | None:
+        """Get streamer from the cache. `None` if the user isn't cached."""
+        user = self.users.get(twitch_id)
+        if user is None:
+            return None
+        return Streamer(self.twitch, user, self.streams.get(twitch_id), self.vods.get(twitch_id))
+
+    @aluloop(minutes=1)
+    async def poll(self) -> None:
+        """Task to poll all tracked broadcasters in batches."""
+        self.tracked_ids = await self.fetch_tracked_ids()
+        await self.refresh()
+        # don't keep data for broadcasters that are no longer tracked
+        for cache in (self.users, self.streams, self.vods, self.vod_misses):
+            for twitch_id in cache.keys() - self.tracked_ids:
+                del cache[twitch_id]
 
 
 # class AluComponent(commands.Component):
@@ -186,17 +385,29 @@ class Streamer:
         Stream's title. "Offline" if stream is offline.
     preview_url: str
         Thumbnail for the stream preview. Tries to use offline image if stream is offline.
+    game_id: str | None
+        Twitch category ID of the stream. `None` if stream is offline.
+    vod: twitchio.Video | None
+        VOD of the current stream. `None` if stream is offline or VODs are disabled.
 
     """
 
     if TYPE_CHECKING:
         live: bool
         game: str
+        game_id: str | None
         title: str
         preview_url: str
 
-    def __init__(self, _twitch: AluTwitchClient, user: twitchio.User, stream: twitchio.Stream | None) -> None:
+    def __init__(
+        self,
+        _twitch: AluTwitchClient,
+        user: twitchio.User,
+        stream: twitchio.Stream | None,
+        vod: twitchio.Video | None = None,
+    ) -> None:
         self._twitch: AluTwitchClient = _twitch
+        self.vod: twitchio.Video | None = vod
 
         self.id: str = user.id
         self.display_name: str = user.display_name
@@ -206,12 +417,14 @@ class Streamer:
         if stream:
             self.live = True
             self.game = stream.game_name or "No category"
+            self.game_id = stream.game_id
             self.title = stream.title
             # example: https://static-cdn.jtvnw.net/previews-ttv/live_user_gosu-{width}x{height}.jpg
             self.preview_url = stream.thumbnail.url
         else:
             self.live = False
             self.game = "Offline"
+            self.game_id = None
             self.title = "Offline"
             offline_image = user.offline_image
             if offline_image:
@@ -227,15 +440,15 @@ class Streamer:
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {self.display_name} id={self.id} title={self.title}>"
 
-    async def vod_link(self, *, seconds_ago: int = 0, markdown: bool = True) -> str:
-        """Get latest vod link, timestamped to timedelta ago."""
-        video = next(iter(await self._twitch.fetch_videos(user_id=self.id, period="day")), None)
-        if not video:
+    def vod_link(self, *, seconds_ago: int = 0, markdown: bool = True) -> str:
+        """Get current stream's vod link, timestamped to timedelta ago."""
+        if not self.vod:
             return ""
 
-        duration = fmt.hms_to_seconds(video.duration)
-        new_hms = fmt.divmod_timedelta(duration - seconds_ago)
-        url = f"{video.url}?t={new_hms}"
+        # the VOD is cached, so its `duration` is outdated - count from its creation instead
+        duration = int((datetime.datetime.now(datetime.UTC) - self.vod.created_at).total_seconds())
+        new_hms = fmt.divmod_timedelta(max(duration - seconds_ago, 0))
+        url = f"{self.vod.url}?t={new_hms}"
         return f"/[VOD]({url})" if markdown else url
 
     async def game_art_url(self) -> str | None: